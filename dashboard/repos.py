@@ -5,23 +5,63 @@ Repository Management Endpoints
 API endpoints for managing GitLab repositories in the Auto-Dev system.
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+from pydantic import BaseModel, ConfigDict, Field
+from starlette.background import BackgroundTask
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-import json
+import asyncio
+import hashlib
+import logging
 import secrets
 import os
-import sys
-from pathlib import Path
 
-# Add parent for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import orjson
+
+logger = logging.getLogger(__name__)
 
 # Will be imported from main server
 orchestrator = None
 
-router = APIRouter(prefix="/api/repos", tags=["repos"])
+router = APIRouter(prefix="/api/repos", tags=["repos"], default_response_class=ORJSONResponse)
+
+# Public dashboard URL, read once at import (restart to pick up changes)
+BASE_URL = os.environ.get("AUTO_DEV_URL", "http://localhost:8080")
+WEBHOOK_URL = f"{BASE_URL}/webhook/gitlab"
+
+_WEBHOOK_INSTRUCTIONS_TMPL = """
+## GitLab Webhook Setup
+
+1. Go to your GitLab project: {gitlab_url}/{project_id}
+2. Navigate to Settings → Webhooks
+3. Add a new webhook with these settings:
+
+   **URL**: {webhook_url}
+   **Secret Token**: {display_secret}
+
+   **Trigger events**:
+   - ✅ Push events
+   - ✅ Merge request events
+   - ✅ Issue events
+   - ✅ Pipeline events
+   - ✅ Comments (Note events)
+
+4. Click "Add webhook"
+5. Test the webhook using the "Test" button
+
+The webhook will route events to the appropriate Auto-Dev agents.{secret_note}
+"""
+
+# get_repo_tasks streams the response instead of building it when limit exceeds this
+TASK_STREAM_THRESHOLD = 500
+
+# Stats responses are cached briefly; mutations below clear them explicitly
+STATS_CACHE_TTL = 30
+STATS_CACHE_NAMESPACES = ("dash", "repo_stats")
 
 
 def set_orchestrator(orch):
@@ -30,9 +70,38 @@ def set_orchestrator(orch):
     orchestrator = orch
 
 
+def repo_stats_key_builder(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None):
+    """Cache key for per-repo stats: one entry per repo_id."""
+    return f"{namespace}:{kwargs['repo_id']}"
+
+
+def make_etag(*parts) -> str:
+    """Weak ETag over a version marker (stable across workers, unlike hash())."""
+    return 'W/"' + hashlib.sha1(repr(parts).encode()).hexdigest() + '"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already holds this ETag."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+async def invalidate_stats_cache() -> None:
+    """Drop cached dashboard/repo stats after a mutation."""
+    for namespace in STATS_CACHE_NAMESPACES:
+        try:
+            await FastAPICache.clear(namespace=namespace)
+        except Exception as e:
+            # Stale entries still expire after STATS_CACHE_TTL
+            logger.warning(f"Failed to clear {namespace} cache: {e}")
+
+
 # Pydantic models for request/response
 class RepoCreate(BaseModel):
     """Create a new repository."""
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
     name: str = Field(..., min_length=1, max_length=100)
     provider: str = Field(default="gitlab", pattern="^(gitlab|github)$", description="Git provider (gitlab or github)")
     gitlab_url: str = Field(..., description="Git provider URL (e.g., https://gitlab.com or https://github.com)")
@@ -44,6 +113,8 @@ class RepoCreate(BaseModel):
 
 class RepoUpdate(BaseModel):
     """Update repository settings."""
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
     name: Optional[str] = None
     default_branch: Optional[str] = None
     autonomy_mode: Optional[str] = Field(default=None, pattern="^(guided|full)$")
@@ -73,8 +144,10 @@ class WebhookInfo(BaseModel):
     instructions: str
 
 
-@router.get("")
+@router.get("", response_model=None)
 async def list_repos(
+    request: Request,
+    response: Response,
     active_only: bool = True,
     limit: int = 50,
     offset: int = 0
@@ -84,11 +157,17 @@ async def list_repos(
         raise HTTPException(status_code=500, detail="Orchestrator not initialized")
 
     try:
-        repos = orchestrator.list_repos(active_only=active_only)
-
-        # Apply pagination
-        total = len(repos)
-        repos = repos[offset:offset + limit]
+        version = await run_in_threadpool(orchestrator.repos_version)
+        etag = make_etag(version, active_only, limit, offset)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        response.headers["ETag"] = etag
+
+        total, repos = await asyncio.gather(
+            run_in_threadpool(orchestrator.count_repos, active_only=active_only),
+            run_in_threadpool(orchestrator.list_repos, active_only=active_only, limit=limit, offset=offset)
+        )
 
         return {
             "repos": repos,
@@ -107,36 +186,79 @@ async def create_repo(repo: RepoCreate) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail="Orchestrator not initialized")
 
     try:
+        # Generate the webhook secret up front so webhook GETs stay read-only
+        settings = dict(repo.settings or {})
+        settings.setdefault("webhook_secret", secrets.token_hex(32))
+
         # Let orchestrator generate UUID for repo_id
-        result = orchestrator.create_repo(
+        result = await run_in_threadpool(
+            orchestrator.create_repo,
             name=repo.name,
             provider=repo.provider,
             gitlab_url=repo.gitlab_url,
             gitlab_project_id=repo.gitlab_project_id,
             default_branch=repo.default_branch,
             autonomy_mode=repo.autonomy_mode,
-            settings=repo.settings or {}
+            settings=settings
         )
+        await invalidate_stats_cache()
 
         return {
             "status": "created",
             "repo_id": result.id,
+            # Only time the full secret is returned without ?regenerate=true
+            "webhook_secret": settings["webhook_secret"],
             "message": f"Repository '{repo.name}' created successfully"
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/{repo_id}")
-async def get_repo(repo_id: str) -> Dict[str, Any]:
+# Dashboard stats endpoint (aggregates across all repos).
+# ETag / If-None-Match for the cached stats endpoints is handled by fastapi-cache.
+# Registered before /{repo_id} routes so "dashboard" is not captured as a repo_id.
+@router.get("/dashboard/stats", response_model=None)
+@cache(expire=STATS_CACHE_TTL, namespace="dash")
+async def dashboard_stats() -> Dict[str, Any]:
+    """Get aggregated stats for the dashboard."""
+    if not orchestrator:
+        raise HTTPException(status_code=500, detail="Orchestrator not initialized")
+
+    try:
+        # One JOIN aggregation returns every active repo with its task/approval counts
+        repo_stats = await run_in_threadpool(orchestrator.repo_dashboard_stats)
+
+        return {
+            "total_repos": len(repo_stats),
+            "total_tasks": sum(r["task_count"] for r in repo_stats),
+            "pending_tasks": sum(r["pending_tasks"] for r in repo_stats),
+            "in_progress_tasks": sum(r["in_progress_tasks"] for r in repo_stats),
+            "total_pending_approvals": sum(r["pending_approvals"] for r in repo_stats),
+            "repos": repo_stats
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{repo_id}", response_model=None)
+async def get_repo(repo_id: str, request: Request, response: Response) -> Dict[str, Any]:
     """Get repository details."""
     if not orchestrator:
         raise HTTPException(status_code=500, detail="Orchestrator not initialized")
 
     try:
-        repo = orchestrator.get_repo(repo_id)
+        version = await run_in_threadpool(orchestrator.repo_version, repo_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Repository not found")
+        etag = make_etag(repo_id, version)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+
+        repo = await run_in_threadpool(orchestrator.get_repo, repo_id)
         if not repo:
             raise HTTPException(status_code=404, detail="Repository not found")
+        response.headers["ETag"] = etag
         return repo
     except HTTPException:
         raise
@@ -151,13 +273,18 @@ async def update_repo(repo_id: str, updates: RepoUpdate) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail="Orchestrator not initialized")
 
     try:
-        # Build update dict from non-None values
-        update_dict = {k: v for k, v in updates.dict().items() if v is not None}
+        # Only the fields the client sent; an explicit null clears settings
+        update_dict = updates.model_dump(exclude_unset=True)
+        if "settings" in update_dict and update_dict["settings"] is None:
+            update_dict["settings"] = {}
+        # The remaining columns are NOT NULL, so ignore explicit nulls there
+        update_dict = {k: v for k, v in update_dict.items() if v is not None}
 
         if not update_dict:
             raise HTTPException(status_code=400, detail="No updates provided")
 
-        orchestrator.update_repo(repo_id, **update_dict)
+        await run_in_threadpool(orchestrator.update_repo, repo_id, **update_dict)
+        await invalidate_stats_cache()
 
         return {
             "status": "updated",
@@ -179,7 +306,8 @@ async def delete_repo(repo_id: str, hard_delete: bool = False) -> Dict[str, Any]
     try:
         if hard_delete:
             # Actually delete from database
-            orchestrator.delete_repo(repo_id)
+            await run_in_threadpool(orchestrator.delete_repo, repo_id)
+            await invalidate_stats_cache()
             return {
                 "status": "deleted",
                 "repo_id": repo_id,
@@ -187,7 +315,8 @@ async def delete_repo(repo_id: str, hard_delete: bool = False) -> Dict[str, Any]
             }
         else:
             # Soft delete - just deactivate
-            orchestrator.update_repo(repo_id, active=False)
+            await run_in_threadpool(orchestrator.update_repo, repo_id, active=False)
+            await invalidate_stats_cache()
             return {
                 "status": "deactivated",
                 "repo_id": repo_id,
@@ -208,32 +337,33 @@ async def get_webhook_info(repo_id: str, regenerate: bool = False) -> WebhookInf
     if not orchestrator:
         raise HTTPException(status_code=500, detail="Orchestrator not initialized")
 
-    repo = orchestrator.get_repo(repo_id)
+    repo = await run_in_threadpool(orchestrator.get_repo, repo_id)
     if not repo:
         raise HTTPException(status_code=404, detail="Repository not found")
 
-    # Generate or retrieve webhook secret
+    # Retrieve webhook secret (generated at repo creation)
     settings = repo.settings or {}
     webhook_secret = settings.get("webhook_secret")
     is_new_secret = False
 
-    if not webhook_secret or regenerate:
+    if regenerate:
         # Generate new secret - this is the only time we show it in full
         webhook_secret = secrets.token_hex(32)
-        settings["webhook_secret"] = webhook_secret
-        orchestrator.update_repo(repo_id, settings=settings)
+        await run_in_threadpool(orchestrator.update_repo, repo_id, settings={**settings, "webhook_secret": webhook_secret})
         is_new_secret = True
-
-    # Get the dashboard URL from environment or default
-    base_url = os.environ.get("AUTO_DEV_URL", "http://localhost:8080")
-    webhook_url = f"{base_url}/webhook/gitlab"
+    elif not webhook_secret:
+        # Legacy repo created before secrets were generated up front
+        ensured = await run_in_threadpool(orchestrator.ensure_webhook_secret, repo_id)
+        if not ensured:
+            raise HTTPException(status_code=404, detail="Repository not found")
+        webhook_secret, is_new_secret = ensured
 
     # Mask secret if not newly generated (security: don't expose on every read)
     display_secret = webhook_secret if is_new_secret else f"{webhook_secret[:8]}...{webhook_secret[-4:]}"
     secret_note = "" if is_new_secret else "\n\n**Note**: Secret is masked. Use `?regenerate=true` to generate a new one."
 
     return WebhookInfo(
-        webhook_url=webhook_url,
+        webhook_url=WEBHOOK_URL,
         webhook_secret=display_secret,
         events=[
             "push_events",
@@ -242,32 +372,42 @@ async def get_webhook_info(repo_id: str, regenerate: bool = False) -> WebhookInf
             "pipeline_events",
             "note_events"
         ],
-        instructions=f"""
-## GitLab Webhook Setup
+        instructions=_WEBHOOK_INSTRUCTIONS_TMPL.format_map({
+            "gitlab_url": repo.gitlab_url,
+            "project_id": repo.gitlab_project_id,
+            "webhook_url": WEBHOOK_URL,
+            "display_secret": display_secret,
+            "secret_note": secret_note,
+        })
+    )
 
-1. Go to your GitLab project: {repo.gitlab_url}/{repo.gitlab_project_id}
-2. Navigate to Settings → Webhooks
-3. Add a new webhook with these settings:
 
-   **URL**: {webhook_url}
-   **Secret Token**: {display_secret}
+def _open_repo_task_batches(repo_id: str, status: Optional[str], task_type: Optional[str], limit: int):
+    """Run get_repo_tasks' query and fetch its first batch of tasks.
 
-   **Trigger events**:
-   - ✅ Push events
-   - ✅ Merge request events
-   - ✅ Issue events
-   - ✅ Pipeline events
-   - ✅ Comments (Note events)
+    Returns (first batch, iterator over the remaining batches). A failing
+    query raises here, before any part of the response has been sent.
+    """
+    batches = orchestrator.iter_tasks(repo_id=repo_id, status=status, task_type=task_type, limit=limit)
+    return next(batches, []), batches
 
-4. Click "Add webhook"
-5. Test the webhook using the "Test" button
 
-The webhook will route events to the appropriate Auto-Dev agents.{secret_note}
-"""
-    )
+def _stream_repo_tasks(repo_id: str, first: List[Any], batches):
+    """Yield a get_repo_tasks JSON body in chunks, one task batch at a time.
+
+    first and batches come from _open_repo_task_batches. A sync generator: StreamingResponse iterates it in the threadpool, so the
+    blocking DB fetches stay off the event loop.
+    """
+    yield b'{"repo_id":' + orjson.dumps(repo_id) + b',"tasks":[' + b",".join(orjson.dumps(task) for task in first)
+    count = len(first)
+    for batch in batches:
+        chunk = b",".join(orjson.dumps(task) for task in batch)
+        yield chunk if count == 0 else b"," + chunk
+        count += len(batch)
+    yield b'],"count":' + orjson.dumps(count) + b"}"
 
 
-@router.get("/{repo_id}/tasks")
+@router.get("/{repo_id}/tasks", response_model=None)
 async def get_repo_tasks(
     repo_id: str,
     status: Optional[str] = None,
@@ -278,17 +418,28 @@ async def get_repo_tasks(
     if not orchestrator:
         raise HTTPException(status_code=500, detail="Orchestrator not initialized")
 
+    if limit > TASK_STREAM_THRESHOLD:
+        # Query errors still become a 500 here; only later batches are fetched mid-stream
+        try:
+            first, batches = await run_in_threadpool(_open_repo_task_batches, repo_id, status, task_type, limit)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        return StreamingResponse(
+            _stream_repo_tasks(repo_id, first, batches),
+            media_type="application/json",
+            # Releases the query's connection if the body is never iterated
+            background=BackgroundTask(batches.close)
+        )
+
     try:
-        tasks = orchestrator.list_tasks(
+        tasks = await run_in_threadpool(
+            orchestrator.list_tasks,
             repo_id=repo_id,
             status=status,
+            task_type=task_type,
             limit=limit
         )
 
-        # Filter by task_type if provided
-        if task_type:
-            tasks = [t for t in tasks if t.get("task_type") == task_type]
-
         return {
             "repo_id": repo_id,
             "tasks": tasks,
@@ -298,7 +449,7 @@ async def get_repo_tasks(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{repo_id}/approvals")
+@router.get("/{repo_id}/approvals", response_model=None)
 async def get_repo_approvals(
     repo_id: str,
     status: str = "pending",
@@ -309,7 +460,8 @@ async def get_repo_approvals(
         raise HTTPException(status_code=500, detail="Orchestrator not initialized")
 
     try:
-        approvals = orchestrator.list_approvals(
+        approvals = await run_in_threadpool(
+            orchestrator.list_approvals,
             repo_id=repo_id,
             status=status,
             limit=limit
@@ -324,45 +476,41 @@ async def get_repo_approvals(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{repo_id}/stats")
+@router.get("/{repo_id}/stats", response_model=None)
+@cache(expire=STATS_CACHE_TTL, namespace="repo_stats", key_builder=repo_stats_key_builder)
 async def get_repo_stats(repo_id: str) -> Dict[str, Any]:
     """Get statistics for a specific repository."""
     if not orchestrator:
         raise HTTPException(status_code=500, detail="Orchestrator not initialized")
 
     try:
-        repo = orchestrator.get_repo(repo_id)
+        # Repo lookup, task counts (aggregated in SQL) and approval count are independent
+        repo, counts, pending_approvals = await asyncio.gather(
+            run_in_threadpool(orchestrator.get_repo, repo_id),
+            run_in_threadpool(orchestrator.aggregate_task_counts, repo_id),
+            run_in_threadpool(orchestrator.count_approvals, repo_id=repo_id, status="pending")
+        )
         if not repo:
             raise HTTPException(status_code=404, detail="Repository not found")
 
-        # Get task counts by status
-        all_tasks = orchestrator.list_tasks(repo_id=repo_id, limit=1000)
+        by_status = counts["by_status"]
 
         task_stats = {
-            "total": len(all_tasks),
-            "pending": len([t for t in all_tasks if t.get("status") == "pending"]),
-            "in_progress": len([t for t in all_tasks if t.get("status") == "in_progress"]),
-            "completed": len([t for t in all_tasks if t.get("status") == "completed"]),
-            "failed": len([t for t in all_tasks if t.get("status") == "failed"])
+            "total": counts["total"],
+            "pending": by_status.get("pending", 0),
+            "in_progress": by_status.get("in_progress", 0),
+            "completed": by_status.get("completed", 0),
+            "failed": by_status.get("failed", 0)
         }
 
-        # Get approval counts
-        pending_approvals = orchestrator.list_approvals(repo_id=repo_id, status="pending")
-
-        # Get task types breakdown
-        task_types = {}
-        for task in all_tasks:
-            tt = task.get("task_type", "unknown")
-            task_types[tt] = task_types.get(tt, 0) + 1
-
         return {
             "repo_id": repo_id,
             "repo_name": repo.name,
             "autonomy_mode": repo.autonomy_mode,
             "active": repo.status == "active",
             "tasks": task_stats,
-            "task_types": task_types,
-            "pending_approvals": len(pending_approvals),
+            "task_types": counts["by_type"],
+            "pending_approvals": pending_approvals,
             "created_at": repo.created_at
         }
     except HTTPException:
@@ -382,12 +530,13 @@ async def trigger_analysis(
         raise HTTPException(status_code=500, detail="Orchestrator not initialized")
 
     try:
-        repo = orchestrator.get_repo(repo_id)
+        repo = await run_in_threadpool(orchestrator.get_repo, repo_id)
         if not repo:
             raise HTTPException(status_code=404, detail="Repository not found")
 
         # Create the analysis task
-        task_id = orchestrator.create_task(
+        task_id = await run_in_threadpool(
+            orchestrator.create_task,
             repo_id=repo_id,
             task_type=task_type,
             payload={
@@ -400,6 +549,7 @@ async def trigger_analysis(
             },
             priority=5  # Medium priority for manual triggers
         )
+        await invalidate_stats_cache()
 
         return {
             "status": "triggered",
@@ -412,53 +562,3 @@ async def trigger_analysis(
         raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
-
-
-# Dashboard stats endpoint (aggregates across all repos)
-@router.get("/dashboard/stats")
-async def dashboard_stats() -> Dict[str, Any]:
-    """Get aggregated stats for the dashboard."""
-    if not orchestrator:
-        raise HTTPException(status_code=500, detail="Orchestrator not initialized")
-
-    try:
-        repos = orchestrator.list_repos(active_only=True)
-
-        total_tasks = 0
-        pending_tasks = 0
-        in_progress_tasks = 0
-        total_approvals = 0
-
-        repo_stats = []
-        for repo in repos:
-            tasks = orchestrator.list_tasks(repo_id=repo.id, limit=1000)
-            approvals = orchestrator.list_approvals(repo_id=repo.id, status="pending")
-
-            pending = len([t for t in tasks if t.get("status") == "pending"])
-            in_progress = len([t for t in tasks if t.get("status") == "in_progress"])
-
-            total_tasks += len(tasks)
-            pending_tasks += pending
-            in_progress_tasks += in_progress
-            total_approvals += len(approvals)
-
-            repo_stats.append({
-                "id": repo.id,
-                "name": repo.name,
-                "autonomy_mode": repo.autonomy_mode,
-                "task_count": len(tasks),
-                "pending_tasks": pending,
-                "in_progress_tasks": in_progress,
-                "pending_approvals": len(approvals)
-            })
-
-        return {
-            "total_repos": len(repos),
-            "total_tasks": total_tasks,
-            "pending_tasks": pending_tasks,
-            "in_progress_tasks": in_progress_tasks,
-            "total_pending_approvals": total_approvals,
-            "repos": repo_stats
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
@@ -8,16 +8,28 @@ Shows activity streams, income tracking, token usage, and memory stats.
 """
 
 import os
-import sys
+import copy
+import time
 import subprocess
 import signal
 import logging
 from pathlib import Path
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 import json
 import sqlite3
 import asyncio
+import threading
+import hashlib
+import re
+import uuid
+import queue
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+
+import anyio
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,116 +38,481 @@ logger = logging.getLogger(__name__)
 try:
     import psycopg2
     import psycopg2.extras
+    import psycopg2.pool
     HAS_PSYCOPG2 = True
 except ImportError:
     HAS_PSYCOPG2 = False
 
+try:
+    import psycopg
+    import psycopg_pool
+    from psycopg.conninfo import make_conninfo
+    from psycopg.rows import dict_row
+    from psycopg.types.string import TextLoader
+    HAS_PSYCOPG3 = True
+except ImportError:
+    HAS_PSYCOPG3 = False
+
+HAS_POSTGRES = HAS_PSYCOPG3 or HAS_PSYCOPG2
+
 try:
     import redis
+    import redis.asyncio
     HAS_REDIS = True
 except ImportError:
     HAS_REDIS = False
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps_text(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_text(obj) -> str:
+        return json.dumps(obj, default=str)
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+async def read_json(request) -> Any:
+    """Decode a JSON request body (orjson when available)."""
+    return _json_loads(await request.body())
+
+def uuid4_batch(count: int) -> List[str]:
+    """`count` random UUID strings, like str(uuid.uuid4()), from a single urandom read."""
+    raw = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+_utc_second_prefix: Tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """Current UTC time in the naive ISO format stored in the task tables.
+
+    Same text as datetime.utcnow().isoformat() (always with microseconds), but
+    the date/time part is formatted at most once per second.
+    """
+    global _utc_second_prefix
+    now = time.time()
+    second = int(now)
+    if _utc_second_prefix[0] != second:
+        _utc_second_prefix = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+    return f"{_utc_second_prefix[1]}.{int((now - second) * 1_000_000):06d}"
+
 def parse_json_field(value):
     """Parse JSON field handling both string (SQLite) and dict (PostgreSQL JSONB)."""
-    if value is None:
-        return None
-    if isinstance(value, (dict, list)):
-        return value
-    try:
-        return json.loads(value)
-    except (json.JSONDecodeError, TypeError):
-        return value
-
-from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+    # Exact type checks: this runs for every JSON column of every row
+    t = type(value)
+    if t is str or t is bytes:
+        # Blank columns are common and would only raise inside the parser
+        if not value or value.isspace():
+            return value
+        try:
+            return _json_loads(value)
+        except ValueError:
+            return value
+    return value
+
+from fastapi import Body, Depends, FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.background import BackgroundTask
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from pydantic import BaseModel
 import yaml
 import psutil
 
-# Add parent directory for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
 
 from watcher.orchestrator_pg import get_orchestrator
 
 # Import repo management router
-from dashboard.repos import router as repos_router, set_orchestrator as set_repos_orchestrator
+from dashboard.repos import (
+    router as repos_router,
+    set_orchestrator as set_repos_orchestrator,
+    make_etag,
+    not_modified,
+)
 
-app = FastAPI(title="Auto-Dev Dashboard", version="2.0.0")
+app = FastAPI(title="Auto-Dev Dashboard", version="2.0.0", default_response_class=ORJSONResponse)
 
 # Register routers
 app.include_router(repos_router)
 
 
+# Static payload, serialized once at import
+HEALTH_RESPONSE_BODY = _json_dumps_bytes(
+    {"status": "healthy", "service": "dashboard", "version": "2.0.0"}
+)
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Docker/load balancer."""
-    return {"status": "healthy", "service": "dashboard", "version": "2.0.0"}
+    return Response(HEALTH_RESPONSE_BODY, media_type="application/json")
+
+
+# ============================================================================
+# POSTGRESQL CONNECTION POOL
+# ============================================================================
+
+PG_POOL_MIN = int(os.environ.get("DASHBOARD_PG_POOL_MIN", "2"))
+PG_POOL_MAX = int(os.environ.get("DASHBOARD_PG_POOL_MAX", "10"))
+# psycopg 3 prepares a statement server-side once it has run this many times
+# on a connection; set to "off" when going through a transaction-mode pgbouncer.
+PG_PREPARE_THRESHOLD = os.environ.get("DASHBOARD_PG_PREPARE_THRESHOLD", "1")
+
+_pg_pool = None
+_pg_pool_lock = threading.Lock()
+
+
+class PooledConnection:
+    """PostgreSQL connection checked out of the shared pool.
+
+    Behaves like the underlying connection, except that close() hands it
+    back to the pool (rolling back any open transaction) instead of
+    tearing down the socket.
+    """
+
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        try:
+            if not conn.closed:
+                conn.rollback()
+            if HAS_PSYCOPG3:
+                self._pool.putconn(conn)
+            else:
+                self._pool.putconn(conn, close=bool(conn.closed))
+        except Exception as e:
+            logger.warning(f"Failed to return PostgreSQL connection to pool: {e}")
+
+    def execute_prepared(self, cursor, sql: str, params=None):
+        """Execute a hot query as a server-side prepared statement.
+
+        psycopg 3 prepares it on first use; with psycopg2 the statement is
+        PREPAREd by hand once per pooled connection and then EXECUTEd.
+        """
+        if HAS_PSYCOPG3:
+            cursor.execute(sql, params, prepare=True)
+            return
+
+        name, body, names, count = _pg2_prepare_form(sql)
+        prepared = _pg2_prepared.setdefault(self._conn, set())
+        if name not in prepared:
+            cursor.execute(f"PREPARE {name} AS {body}")
+            prepared.add(name)
+        values = [params[n] for n in names] if names else list(params or ())
+        if count:
+            cursor.execute(f"EXECUTE {name}({', '.join(['%s'] * count)})", values)
+        else:
+            cursor.execute(f"EXECUTE {name}")
+
+
+# Statement names PREPAREd on each raw psycopg2 connection
+_pg2_prepared = weakref.WeakKeyDictionary()
+_PG_PARAM_RE = re.compile(r"%\((\w+)\)s|%s|%%")
+
+
+@lru_cache(maxsize=64)
+def _pg2_prepare_form(sql: str):
+    """Rewrite a psycopg2 query for PREPARE.
+
+    Returns (statement name, SQL with $n placeholders, named-parameter order
+    or None for positional queries, parameter count).
+    """
+    names: List[str] = []
+    positional = 0
+
+    def to_dollar(match):
+        nonlocal positional
+        if match.group(0) == '%%':
+            return '%'
+        if match.group(1):
+            if match.group(1) not in names:
+                names.append(match.group(1))
+            return f"${names.index(match.group(1)) + 1}"
+        positional += 1
+        return f"${positional}"
+
+    body = _PG_PARAM_RE.sub(to_dollar, sql)
+    name = "dash_" + hashlib.sha1(sql.encode()).hexdigest()[:16]
+    return name, body, (tuple(names) if names else None), (len(names) or positional)
+
+
+def _configure_pg_connection(conn):
+    """Match psycopg2's row types so callers work with either driver."""
+    # psycopg2 hands UUID columns back as str; psycopg 3 would build uuid.UUID
+    conn.adapters.register_loader("uuid", TextLoader)
+
+
+def _postgres_connect_kwargs() -> Optional[Dict[str, Any]]:
+    """Connection arguments from the environment, or None if unconfigured."""
+    # Check for individual connection params (Docker environment)
+    db_host = os.environ.get('DB_HOST')
+    db_user = os.environ.get('DB_USER')
+    db_password = os.environ.get('DB_PASSWORD')
+    db_name = os.environ.get('DB_NAME')
+
+    if db_host and db_user and db_name:
+        return {
+            "host": db_host,
+            "user": db_user,
+            "password": db_password or '',
+            "dbname": db_name,
+        }
+
+    # Check for DATABASE_URL
+    database_url = os.environ.get('DATABASE_URL')
+    if database_url:
+        return {"dsn": database_url}
+
+    return None
+
+
+def get_postgres_pool():
+    """Get (lazily creating) the shared PostgreSQL connection pool."""
+    global _pg_pool
+    if not HAS_POSTGRES:
+        return None
+    if _pg_pool is not None:
+        return _pg_pool
+
+    with _pg_pool_lock:
+        if _pg_pool is None:
+            kwargs = _postgres_connect_kwargs()
+            if kwargs is None:
+                return None
+            try:
+                if HAS_PSYCOPG3:
+                    prepare_threshold = (
+                        None if PG_PREPARE_THRESHOLD.lower() in ("off", "none", "")
+                        else int(PG_PREPARE_THRESHOLD)
+                    )
+                    _pg_pool = psycopg_pool.ConnectionPool(
+                        make_conninfo(kwargs.pop("dsn", ""), **kwargs),
+                        min_size=PG_POOL_MIN,
+                        max_size=PG_POOL_MAX,
+                        kwargs={"row_factory": dict_row, "prepare_threshold": prepare_threshold},
+                        configure=_configure_pg_connection,
+                        open=True,
+                    )
+                else:
+                    _pg_pool = psycopg2.pool.ThreadedConnectionPool(
+                        PG_POOL_MIN, PG_POOL_MAX,
+                        cursor_factory=psycopg2.extras.RealDictCursor,
+                        **kwargs
+                    )
+            except Exception as e:
+                print(f"PostgreSQL connection error: {e}")
+    return _pg_pool
+
+
+def get_postgres_db():
+    """Get a pooled PostgreSQL connection; close() returns it to the pool."""
+    pool = get_postgres_pool()
+    if pool is None:
+        return None
+    try:
+        return PooledConnection(pool, pool.getconn())
+    except Exception as e:
+        print(f"PostgreSQL connection error: {e}")
+        return None
+
+
+def get_pg_conn():
+    """FastAPI dependency yielding a pooled PostgreSQL connection (or None)."""
+    conn = get_postgres_db()
+    try:
+        yield conn
+    finally:
+        if conn:
+            conn.close()
+
+
+def close_postgres_pool():
+    """Close every connection held by the shared pool."""
+    global _pg_pool
+    with _pg_pool_lock:
+        if _pg_pool is not None:
+            if HAS_PSYCOPG3:
+                _pg_pool.close()
+            else:
+                _pg_pool.closeall()
+            _pg_pool = None
 
 
 # ============================================================================
 # ADMIN/MIGRATION ENDPOINTS (temporary)
 # ============================================================================
 
+# Statuses tasks_status_check must allow once migrated
+_TASK_STATUSES = ('pending', 'claimed', 'in_progress', 'completed', 'failed', 'cancelled')
+
+# (name, table, column, sql) - statements are run inside one PL/pgSQL block
+# and each migration is verified against the catalog afterwards.
+_MIGRATIONS: Tuple[Tuple[str, str, Optional[str], str], ...] = (
+    ("Add claimed_at column", "tasks", "claimed_at", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMP"),
+    ("Add needs_approval column", "tasks", "needs_approval", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS needs_approval INTEGER DEFAULT 0"),
+    ("Add approval_status column", "tasks", "approval_status", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS approval_status TEXT"),
+    ("Add approved_by column", "tasks", "approved_by", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS approved_by TEXT"),
+    ("Add approved_at column", "tasks", "approved_at", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS approved_at TIMESTAMP"),
+    ("Add rejection_reason column", "tasks", "rejection_reason", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS rejection_reason TEXT"),
+    ("Add parent_task_id column", "tasks", "parent_task_id", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS parent_task_id UUID"),
+    # Drop + re-add in a sub-block so a failed ADD keeps the old constraint
+    ("Replace status constraint", "tasks", None, """BEGIN
+        ALTER TABLE tasks DROP CONSTRAINT IF EXISTS tasks_status_check;
+        ALTER TABLE tasks ADD CONSTRAINT tasks_status_check CHECK (status IN (""" + ", ".join(f"'{status}'" for status in _TASK_STATUSES) + """));
+    EXCEPTION WHEN others THEN
+        RAISE WARNING 'tasks_status_check not replaced: %', SQLERRM;
+    END"""),
+    # Repos table migrations
+    ("Add provider column to repos", "repos", "provider", "ALTER TABLE repos ADD COLUMN IF NOT EXISTS provider TEXT DEFAULT 'gitlab'"),
+)
+_MIGRATION_TABLES = sorted({table for _, table, _, _ in _MIGRATIONS})
+
+
+def _guarded_sql(sql: str) -> str:
+    """Wrap a statement in its own PL/pgSQL sub-block.
+
+    A failing statement is rolled back alone and reported as a WARNING
+    instead of aborting the rest of the DO block. Statements that are
+    already a BEGIN ... END block are returned as they are.
+    """
+    if sql.startswith("BEGIN"):
+        return sql
+    label = sql.split("(", 1)[0].strip().replace("'", "''").replace("%", "%%")
+    return (f"BEGIN\n    {sql};\nEXCEPTION WHEN others THEN\n"
+            f"    RAISE WARNING '{label} failed: %', SQLERRM;\nEND")
+
+
+def _do_block(statements) -> str:
+    """Run statements as one DO block, each in its own guarded sub-block."""
+    return "DO $$ BEGIN\n" + ";\n".join(_guarded_sql(sql) for sql in statements) + ";\nEND $$"
+
+
+# A single DO statement: one round trip, and it can be prepared like any
+# other statement (multi-statement strings cannot)
+_MIGRATIONS_SQL = _do_block(sql for _, _, _, sql in _MIGRATIONS)
+
+def _migration_schema_snapshot(cursor):
+    """Existing (table, column) pairs plus the tasks_status_check definition."""
+    cursor.execute("""
+        SELECT table_name::text AS name, column_name::text AS detail
+        FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = ANY(%s)
+        UNION ALL
+        SELECT conname::text, pg_get_constraintdef(oid)
+        FROM pg_constraint WHERE conname = 'tasks_status_check'
+    """, (_MIGRATION_TABLES,))
+    columns, status_check = set(), ""
+    for row in cursor.fetchall():
+        if row['name'] == 'tasks_status_check':
+            status_check = row['detail']
+        else:
+            columns.add((row['name'], row['detail']))
+    return columns, status_check
+
+
+def _status_check_values(definition: str) -> frozenset:
+    """Status literals allowed by a pg_get_constraintdef() CHECK definition."""
+    return frozenset(re.findall(r"'([^']*)'", definition))
+
+
+# Results of the last fully successful run; the schema can't regress while we're up
+_migrations_done: Optional[List[Dict[str, Any]]] = None
+
+
 @app.post("/api/admin/run-migrations")
-async def run_migrations():
-    """Run database migrations to fix schema issues."""
-    if not HAS_PSYCOPG2:
+def run_migrations(force: bool = False, conn=Depends(get_pg_conn)):
+    """Run database migrations to fix schema issues.
+
+    After one fully successful run the cached results are returned; pass
+    force=true to run the migrations again.
+    """
+    global _migrations_done
+    if _migrations_done is not None and not force:
+        return {"status": "already-applied", "results": _migrations_done}
+
+    if not HAS_POSTGRES:
         return {"error": "PostgreSQL not available"}
 
-    conn = get_postgres_db()
     if not conn:
         return {"error": "Could not connect to PostgreSQL"}
 
     results = []
     try:
         cursor = conn.cursor()
-        migrations = [
-            ("Add claimed_at column", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMP"),
-            ("Add needs_approval column", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS needs_approval INTEGER DEFAULT 0"),
-            ("Add approval_status column", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS approval_status TEXT"),
-            ("Add approved_by column", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS approved_by TEXT"),
-            ("Add approved_at column", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS approved_at TIMESTAMP"),
-            ("Add rejection_reason column", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS rejection_reason TEXT"),
-            ("Add parent_task_id column", "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS parent_task_id UUID"),
-            ("Drop old status constraint", "ALTER TABLE tasks DROP CONSTRAINT IF EXISTS tasks_status_check"),
-            ("Add new status constraint", "ALTER TABLE tasks ADD CONSTRAINT tasks_status_check CHECK (status IN ('pending', 'claimed', 'in_progress', 'completed', 'failed', 'cancelled'))"),
-            # Repos table migrations
-            ("Add provider column to repos", "ALTER TABLE repos ADD COLUMN IF NOT EXISTS provider TEXT DEFAULT 'gitlab'"),
-        ]
-        for name, sql in migrations:
-            try:
-                cursor.execute(sql)
-                conn.commit()
+        before, status_check_before = _migration_schema_snapshot(cursor)
+
+        cursor.execute(_MIGRATIONS_SQL)
+        after, status_check = _migration_schema_snapshot(cursor)
+        conn.commit()
+
+        for name, table, column, _ in _MIGRATIONS:
+            if column is None:
+                if _status_check_values(status_check) != frozenset(_TASK_STATUSES):
+                    results.append({"migration": name, "status": "failed",
+                                    "error": "constraint not replaced, see PostgreSQL log"})
+                elif status_check == status_check_before:
+                    results.append({"migration": name, "status": "skipped", "reason": "constraint unchanged"})
+                else:
+                    results.append({"migration": name, "status": "success"})
+            elif (table, column) in before:
+                results.append({"migration": name, "status": "skipped", "reason": "column exists"})
+            elif (table, column) in after:
                 results.append({"migration": name, "status": "success"})
-            except Exception as e:
-                conn.rollback()
-                results.append({"migration": name, "status": "failed", "error": str(e)})
+            else:
+                results.append({"migration": name, "status": "failed", "error": "column missing after migration"})
 
+        if all(r["status"] != "failed" for r in results):
+            _migrations_done = results
         return {"status": "completed", "results": results}
     except Exception as e:
+        conn.rollback()
         return {"status": "error", "error": str(e)}
-    finally:
-        conn.close()
 
 # ============================================================================
 # AUTONOMY & APPROVAL CONFIGURATION API
 # ============================================================================
 
+# Served when settings.yaml has no autonomy.approval_gates section (read-only)
+DEFAULT_APPROVAL_GATES = {
+    "issue_creation": True,
+    "spec_approval": True,
+    "merge_approval": True,
+    "deploy_approval": False
+}
+
+
 @app.get("/api/config/autonomy")
 async def get_autonomy_config():
     """Get current autonomy and approval gate settings."""
-    cfg = load_config()
-    autonomy = cfg.get('autonomy', {})
+    autonomy = await get_current_autonomy()
     return {
         "default_mode": autonomy.get('default_mode', 'guided'),
-        "approval_gates": autonomy.get('approval_gates', {
-            "issue_creation": True,
-            "spec_approval": True,
-            "merge_approval": True,
-            "deploy_approval": False
-        }),
+        "approval_gates": autonomy.get('approval_gates', DEFAULT_APPROVAL_GATES),
         "auto_approve_thresholds": autonomy.get('auto_approve_thresholds', {}),
         "safety_limits": autonomy.get('safety_limits', {})
     }
@@ -145,97 +522,125 @@ async def get_autonomy_config():
 async def update_autonomy_config(request: Request):
     """Update autonomy and approval gate settings."""
     try:
-        body = await request.json()
+        body = await read_json(request)
     except (json.JSONDecodeError, ValueError) as e:
         logger.warning(f"Invalid JSON in request: {e}")
-        return JSONResponse({"error": "Invalid JSON"}, status_code=400)
+        return ORJSONResponse({"error": "Invalid JSON"}, status_code=400)
 
-    cfg = load_config()
-    if 'autonomy' not in cfg:
-        cfg['autonomy'] = {}
+    global _pending_autonomy
+    async with _config_lock:
+        autonomy = await get_current_autonomy()
 
-    # Update only the fields that were provided
-    if 'default_mode' in body:
-        cfg['autonomy']['default_mode'] = body['default_mode']
+        # Update only the fields that were provided
+        if 'default_mode' in body:
+            autonomy['default_mode'] = body['default_mode']
 
-    if 'approval_gates' in body:
-        if 'approval_gates' not in cfg['autonomy']:
-            cfg['autonomy']['approval_gates'] = {}
-        cfg['autonomy']['approval_gates'].update(body['approval_gates'])
+        if 'approval_gates' in body:
+            autonomy.setdefault('approval_gates', {}).update(body['approval_gates'])
 
-    if 'auto_approve_thresholds' in body:
-        if 'auto_approve_thresholds' not in cfg['autonomy']:
-            cfg['autonomy']['auto_approve_thresholds'] = {}
-        cfg['autonomy']['auto_approve_thresholds'].update(body['auto_approve_thresholds'])
+        if 'auto_approve_thresholds' in body:
+            autonomy.setdefault('auto_approve_thresholds', {}).update(body['auto_approve_thresholds'])
 
-    if 'safety_limits' in body:
-        if 'safety_limits' not in cfg['autonomy']:
-            cfg['autonomy']['safety_limits'] = {}
-        cfg['autonomy']['safety_limits'].update(body['safety_limits'])
+        if 'safety_limits' in body:
+            autonomy.setdefault('safety_limits', {}).update(body['safety_limits'])
 
-    save_config(cfg)
-    return {"success": True, "autonomy": cfg['autonomy']}
+        # Written to settings.yaml by the background flusher
+        _pending_autonomy = autonomy
+        _config_dirty.set()
+
+    return {"success": True, "autonomy": autonomy}
 
 
 # ============================================================================
 # PENDING APPROVALS API
 # ============================================================================
 
+# Tasks awaiting approval; the queries below add the ordering
+PENDING_TASKS_SQL = """
+    SELECT 'task' AS item_type, id::text AS id, task_type AS type, priority, payload::text AS payload,
+           assigned_agent AS assigned_to, created_by, NULL::text AS status, created_at,
+           approval_type, repo_id::text AS repo_id
+    FROM tasks
+    WHERE needs_approval = 1 AND approval_status = 'pending'
+"""
+# Plus the approvals queue (scripts/init_db.sql) in the same round trip, for
+# deployments that have the table; payload is text on both sides of the UNION
+PENDING_ITEMS_SQL = f"""
+    SELECT * FROM (
+        {PENDING_TASKS_SQL}
+        UNION ALL
+        SELECT 'approval', id::text, NULL, NULL, payload::text, NULL, NULL, status,
+               created_at, approval_type, repo_id::text
+        FROM approvals
+        WHERE status = 'pending'
+    ) pending
+    ORDER BY item_type = 'approval', priority DESC NULLS LAST, created_at ASC
+"""
+PENDING_TASKS_ONLY_SQL = PENDING_TASKS_SQL + "    ORDER BY priority DESC, created_at ASC\n"
+PENDING_TASK_FIELDS = ('item_type', 'id', 'type', 'priority', 'payload', 'assigned_to',
+                       'created_by', 'created_at', 'approval_type', 'repo_id')
+PENDING_APPROVAL_FIELDS = ('item_type', 'id', 'repo_id', 'approval_type', 'context', 'status',
+                           'created_at')
+# approval_type spellings -> stats bucket
+_APPROVAL_CATEGORY = {
+    'merge': 'merges', 'mr': 'merges', 'merge_request': 'merges',
+    'deploy': 'deploys', 'deployment': 'deploys',
+    'spec': 'specs', 'specification': 'specs',
+    'issue': 'issues', 'issue_creation': 'issues',
+    'task': 'tasks',
+}
+
+
+# Whether the optional approvals table exists; looked up once, on first use
+_approvals_table: Optional[bool] = None
+
+
+def _has_approvals_table(cursor) -> bool:
+    """Whether the approvals table exists (checked on first call, then cached)."""
+    global _approvals_table
+    if _approvals_table is None:
+        cursor.execute("SELECT to_regclass('approvals') IS NOT NULL AS present")
+        _approvals_table = bool(cursor.fetchone()['present'])
+    return _approvals_table
+
+
+def _pending_item(row) -> Dict[str, Any]:
+    """API shape of a pending-items row: tasks carry payload, approvals context."""
+    payload = _json_loads(row['payload']) if row['payload'] is not None else None
+    if row['item_type'] == 'approval':
+        item = {key: row[key] for key in PENDING_APPROVAL_FIELDS if key != 'context'}
+        item['context'] = payload
+    else:
+        item = {key: row[key] for key in PENDING_TASK_FIELDS}
+        item['payload'] = payload
+    return item
+
+
 @app.get("/api/pending-approvals")
-async def get_pending_approvals():
+def get_pending_approvals():
     """Get all items pending human approval (tasks, MRs, deployments)."""
     conn = get_postgres_db()
     if not conn:
         return {"approvals": [], "stats": {"tasks": 0, "merges": 0, "deploys": 0, "specs": 0, "issues": 0, "total": 0}}
 
     try:
-        cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-
-        # Get tasks pending approval from PostgreSQL
-        cursor.execute("""
-            SELECT id::text, task_type as type, priority, payload, assigned_agent as assigned_to,
-                   created_by, created_at, approval_type, repo_id::text
-            FROM tasks
-            WHERE needs_approval = 1 AND approval_status = 'pending'
-            ORDER BY priority DESC, created_at ASC
-        """)
-        tasks = []
-        for row in cursor.fetchall():
-            task = dict(row)
-            task['item_type'] = 'task'
-            task['created_at'] = task['created_at'].isoformat() if task.get('created_at') else None
-            tasks.append(task)
-
-        # Get from approvals table as well
-        dev_approvals = []
-        try:
-            cursor.execute("""
-                SELECT id::text, repo_id::text, approval_type, payload as context,
-                       status, created_at
-                FROM approvals
-                WHERE status = 'pending'
-                ORDER BY created_at ASC
-            """)
-            for row in cursor.fetchall():
-                approval = dict(row)
-                approval['item_type'] = 'approval'
-                approval['created_at'] = approval['created_at'].isoformat() if approval.get('created_at') else None
-                dev_approvals.append(approval)
-        except Exception as e:
-            print(f"Error fetching approvals: {e}")
-
-        # Combine and categorize
-        all_approvals = tasks + dev_approvals
+        cursor = conn.cursor()
 
-        # Count by type
-        stats = {
-            "tasks": len([a for a in all_approvals if a.get('approval_type') == 'task' or (a.get('item_type') == 'task' and not a.get('approval_type'))]),
-            "merges": len([a for a in all_approvals if a.get('approval_type') in ('merge', 'mr', 'merge_request')]),
-            "deploys": len([a for a in all_approvals if a.get('approval_type') in ('deploy', 'deployment')]),
-            "specs": len([a for a in all_approvals if a.get('approval_type') in ('spec', 'specification')]),
-            "issues": len([a for a in all_approvals if a.get('approval_type') in ('issue', 'issue_creation')]),
-            "total": len(all_approvals)
-        }
+        sql = PENDING_ITEMS_SQL if _has_approvals_table(cursor) else PENDING_TASKS_ONLY_SQL
+        conn.execute_prepared(cursor, sql)
+        all_approvals = [_pending_item(row) for row in cursor.fetchall()]
+
+        # Count by type in a single pass
+        counts = Counter()
+        for a in all_approvals:
+            approval_type = a.get('approval_type')
+            category = _APPROVAL_CATEGORY.get(approval_type)
+            if category is None and not approval_type and a.get('item_type') == 'task':
+                category = 'tasks'
+            if category:
+                counts[category] += 1
+        stats = {key: counts[key] for key in ("tasks", "merges", "deploys", "specs", "issues")}
+        stats["total"] = len(all_approvals)
 
         return {"approvals": all_approvals, "stats": stats}
     except Exception as e:
@@ -244,99 +649,95 @@ async def get_pending_approvals():
         conn.close()
 
 
-@app.post("/api/pending-approvals/{item_id}/approve")
-async def approve_pending_item(item_id: str, request: Request):
-    """Approve a pending item (task, MR, or deployment)."""
-    try:
-        body = await request.json()
-        notes = body.get('notes', '')
-    except (json.JSONDecodeError, ValueError, AttributeError):
-        notes = ''
+class ApproveBody(BaseModel):
+    """Optional body for approving a pending item."""
+    notes: str = ''
 
-    conn = get_postgres_db()
-    if not conn:
-        return JSONResponse({"error": "Database unavailable"}, status_code=500)
 
-    now = datetime.now()
+class RejectBody(BaseModel):
+    """Optional body for rejecting a pending item."""
+    reason: str = 'Rejected by human reviewer'
 
-    try:
-        cursor = conn.cursor()
 
-        # Try to update in tasks table first
-        cursor.execute("""
-            UPDATE tasks
-            SET approval_status = 'approved', approved_by = 'human', approved_at = %s
-            WHERE id::text = %s AND needs_approval = 1 AND approval_status = 'pending'
-        """, (now, item_id))
-
-        if cursor.rowcount > 0:
-            conn.commit()
-            return {"success": True, "message": "Task approved", "id": item_id}
+@app.post("/api/pending-approvals/{item_id}/approve")
+async def approve_pending_item(item_id: str, body: ApproveBody = Body(default_factory=ApproveBody)):
+    """Approve a pending item (task, MR, or deployment)."""
+    # Blocking DB work runs in a worker thread, off the event loop
+    return await asyncio.to_thread(
+        _review_pending_item, item_id, APPROVE_PENDING_SQL, APPROVE_TASK_SQL, body.notes,
+        {"task": "Task approved", "approval": "Approval granted"}
+    )
 
-        # Try approvals table
-        cursor.execute("""
-            UPDATE approvals
-            SET status = 'approved', review_comment = %s, reviewed_at = %s
-            WHERE id::text = %s AND status = 'pending'
-        """, (notes, now, item_id))
 
-        if cursor.rowcount > 0:
-            conn.commit()
-            return {"success": True, "message": "Approval granted", "id": item_id}
+@app.post("/api/pending-approvals/{item_id}/reject")
+async def reject_pending_item(item_id: str, body: RejectBody = Body(default_factory=RejectBody)):
+    """Reject a pending item (task, MR, or deployment)."""
+    # Blocking DB work runs in a worker thread, off the event loop
+    return await asyncio.to_thread(
+        _review_pending_item, item_id, REJECT_PENDING_SQL, REJECT_TASK_SQL, body.reason,
+        {"task": "Task rejected", "approval": "Approval rejected"}
+    )
 
-        return JSONResponse({"error": "Item not found or already processed"}, status_code=404)
-    except Exception as e:
-        conn.rollback()
-        return JSONResponse({"error": str(e)}, status_code=500)
-    finally:
-        conn.close()
 
+# Reviews of a pending task; RETURNING tells whether a row was updated
+APPROVE_TASK_SQL = """
+    UPDATE tasks
+    SET approval_status = 'approved', approved_by = 'human', approved_at = %(now)s
+    WHERE id::text = %(id)s AND needs_approval = 1 AND approval_status = 'pending'
+    RETURNING 'task'::text AS kind
+"""
+REJECT_TASK_SQL = """
+    UPDATE tasks
+    SET approval_status = 'rejected', approved_by = 'human', approved_at = %(now)s,
+        rejection_reason = %(text)s, status = 'cancelled'
+    WHERE id::text = %(id)s AND needs_approval = 1 AND approval_status = 'pending'
+    RETURNING 'task'::text AS kind
+"""
+# With the approvals table the id is tried against the task first and the
+# approvals row only when no task matched, in one statement
+APPROVE_PENDING_SQL = f"""
+    WITH t AS ({APPROVE_TASK_SQL}),
+    a AS (
+        UPDATE approvals
+        SET status = 'approved', review_comment = %(text)s, reviewed_at = %(now)s
+        WHERE id::text = %(id)s AND status = 'pending' AND NOT EXISTS (SELECT 1 FROM t)
+        RETURNING 'approval'::text AS kind
+    )
+    SELECT kind FROM t UNION ALL SELECT kind FROM a
+"""
+REJECT_PENDING_SQL = f"""
+    WITH t AS ({REJECT_TASK_SQL}),
+    a AS (
+        UPDATE approvals
+        SET status = 'rejected', review_comment = %(text)s, reviewed_at = %(now)s
+        WHERE id::text = %(id)s AND status = 'pending' AND NOT EXISTS (SELECT 1 FROM t)
+        RETURNING 'approval'::text AS kind
+    )
+    SELECT kind FROM t UNION ALL SELECT kind FROM a
+"""
 
-@app.post("/api/pending-approvals/{item_id}/reject")
-async def reject_pending_item(item_id: str, request: Request):
-    """Reject a pending item (task, MR, or deployment)."""
-    try:
-        body = await request.json()
-        reason = body.get('reason', 'Rejected by human reviewer')
-    except (json.JSONDecodeError, ValueError, AttributeError):
-        reason = 'Rejected by human reviewer'
 
+def _review_pending_item(item_id: str, pending_sql: str, task_sql: str, text: str,
+                         messages: Dict[str, str]):
+    """Apply an approve/reject to a pending task or approval and build the API response."""
     conn = get_postgres_db()
     if not conn:
-        return JSONResponse({"error": "Database unavailable"}, status_code=500)
-
-    now = datetime.now()
+        return ORJSONResponse({"error": "Database unavailable"}, status_code=500)
 
     try:
         cursor = conn.cursor()
+        params = {"id": item_id, "text": text, "now": datetime.now()}
+        sql = pending_sql if _has_approvals_table(cursor) else task_sql
+        conn.execute_prepared(cursor, sql, params)
+        row = cursor.fetchone()
+        if row is None:
+            return ORJSONResponse({"error": "Item not found or already processed"}, status_code=404)
 
-        # Try to update in tasks table first
-        cursor.execute("""
-            UPDATE tasks
-            SET approval_status = 'rejected', approved_by = 'human', approved_at = %s,
-                rejection_reason = %s, status = 'cancelled'
-            WHERE id::text = %s AND needs_approval = 1 AND approval_status = 'pending'
-        """, (now, reason, item_id))
-
-        if cursor.rowcount > 0:
-            conn.commit()
-            return {"success": True, "message": "Task rejected", "id": item_id}
-
-        # Try approvals table
-        cursor.execute("""
-            UPDATE approvals
-            SET status = 'rejected', review_comment = %s, reviewed_at = %s
-            WHERE id::text = %s AND status = 'pending'
-        """, (reason, now, item_id))
-
-        if cursor.rowcount > 0:
-            conn.commit()
-            return {"success": True, "message": "Approval rejected", "id": item_id}
-
-        return JSONResponse({"error": "Item not found or already processed"}, status_code=404)
+        conn.commit()
+        return {"success": True, "message": messages[row['kind']], "id": item_id}
     except Exception as e:
         conn.rollback()
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
     finally:
         conn.close()
 
@@ -348,88 +749,338 @@ ORCHESTRATOR_DB_PATH = Path("/auto-dev/data/orchestrator.db")
 SCREENSHOTS_PATH = Path("/auto-dev/data/screenshots")
 REACT_BUILD_PATH = Path(__file__).parent / "frontend" / "dist"
 
+# Worker threads available for offloaded blocking calls (DB, file I/O)
+THREADPOOL_SIZE = int(os.environ.get("DASHBOARD_THREADPOOL_SIZE", "200"))
+
 # Agent types
 AGENT_TYPES = ['pm', 'architect', 'builder', 'reviewer', 'tester', 'security', 'devops', 'bug_finder']
 
+# Parsed settings.yaml, keyed by the file's mtime so edits on disk are picked up
+_config_cache: tuple = (None, None)
+
 # Load config
-def load_config() -> Dict[str, Any]:
-    """Load configuration from YAML file."""
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH) as f:
-            return yaml.safe_load(f)
-    return {}
+def load_config(readonly: bool = False) -> Dict[str, Any]:
+    """Load configuration from YAML file.
+
+    The parsed file is cached until its mtime changes. Returns a private copy
+    unless readonly is set, in which case the shared cached dict is returned
+    and must not be mutated.
+    """
+    global _config_cache
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    cached_mtime, data = _config_cache
+    if cached_mtime != mtime or data is None:
+        # Binary mode lets libyaml read the bytes directly
+        with open(CONFIG_PATH, "rb") as f:
+            data = yaml.load(f, Loader=YamlLoader) or {}
+        _config_cache = (mtime, data)
+    return data if readonly else copy.deepcopy(data)
+
+def config_mtime() -> Optional[int]:
+    """settings.yaml's mtime, for keying values derived from it (None if missing)."""
+    try:
+        return CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 def save_config(updated: Dict[str, Any]) -> None:
     """Persist configuration to YAML file."""
+    global _config_cache
     tmp_path = CONFIG_PATH.with_suffix(".tmp")
     with open(tmp_path, "w") as f:
-        yaml.safe_dump(updated, f, sort_keys=False)
+        yaml.dump(updated, f, Dumper=YamlDumper, sort_keys=False)
     tmp_path.replace(CONFIG_PATH)
+    _config_cache = (CONFIG_PATH.stat().st_mtime_ns, copy.deepcopy(updated))
 
 config = load_config()
 
+# Autonomy edits are held in memory and coalesced into a single settings.yaml
+# write shortly after the last PUT, instead of rewriting the file every time.
+CONFIG_FLUSH_DELAY = 0.1  # seconds
+CONFIG_RETRY_DELAY = 5.0  # seconds to wait after a failed write
+
+_pending_autonomy: Optional[Dict[str, Any]] = None
+_config_lock = asyncio.Lock()
+_config_dirty = asyncio.Event()
+_config_flush_task: Optional[asyncio.Task] = None
+
+
+async def get_current_autonomy() -> Dict[str, Any]:
+    """Autonomy settings including edits not yet flushed to disk (a private copy)."""
+    if _pending_autonomy is not None:
+        return copy.deepcopy(_pending_autonomy)
+    cfg = await asyncio.to_thread(load_config)
+    return cfg.get('autonomy') or {}
+
+
+async def flush_pending_config() -> None:
+    """Write any pending autonomy edits to settings.yaml."""
+    global _pending_autonomy
+    async with _config_lock:
+        autonomy, _pending_autonomy = _pending_autonomy, None
+        if autonomy is None:
+            return
+
+        def write():
+            # Merge into the current file so other sections edited meanwhile survive
+            cfg = load_config()
+            cfg['autonomy'] = autonomy
+            save_config(cfg)
+
+        try:
+            await asyncio.to_thread(write)
+        except Exception:
+            # Re-queue the edits so the next flush retries them
+            if _pending_autonomy is None:
+                _pending_autonomy = autonomy
+            _config_dirty.set()
+            raise
+
+
+async def config_flusher():
+    """Background task: flush autonomy edits once updates go quiet."""
+    while True:
+        await _config_dirty.wait()
+        await asyncio.sleep(CONFIG_FLUSH_DELAY)
+        _config_dirty.clear()
+        try:
+            await flush_pending_config()
+        except Exception as e:
+            logger.error(f"Failed to save autonomy config, retrying in {CONFIG_RETRY_DELAY}s: {e}")
+            await asyncio.sleep(CONFIG_RETRY_DELAY)
+
 # Initialize orchestrator for repos module on startup
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
+    # Blocking orchestrator calls run in AnyIO's worker pool (default 40 threads)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
     try:
         orchestrator = get_orchestrator(db_path=str(ORCHESTRATOR_DB_PATH))
         set_repos_orchestrator(orchestrator)
     except Exception as e:
         print(f"Warning: Could not initialize orchestrator: {e}")
 
+    init_response_cache()
+
+    # Open the PostgreSQL pool up front so the first request doesn't pay for it;
+    # without PostgreSQL, pre-open the SQLite fallback's connections instead
+    if await asyncio.to_thread(get_postgres_pool) is None and ORCHESTRATOR_DB_PATH.exists():
+        await asyncio.to_thread(_orchestrator_db_pool.warm)
+
+    global _config_flush_task, _stats_broadcast_task
+    _config_flush_task = asyncio.create_task(config_flusher())
+    _stats_broadcast_task = asyncio.create_task(stats_broadcaster())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush pending config edits and release pooled connections."""
+    if _config_flush_task:
+        _config_flush_task.cancel()
+    if _stats_broadcast_task:
+        _stats_broadcast_task.cancel()
+    await flush_pending_config()
+    close_postgres_pool()
+    _memory_db_pool.close()
+    _orchestrator_db_pool.close()
+    await close_async_redis()
+
+
+def init_response_cache():
+    """Initialize the response cache (Redis-backed, in-memory fallback)."""
+    if HAS_REDIS:
+        try:
+            from fastapi_cache.backends.redis import RedisBackend
+            from redis import asyncio as aioredis
+
+            redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+            FastAPICache.init(RedisBackend(aioredis.from_url(redis_url)), prefix="autodev-cache")
+            return
+        except Exception as e:
+            print(f"Warning: Redis response cache unavailable, using in-memory cache: {e}")
+    FastAPICache.init(InMemoryBackend(), prefix="autodev-cache")
+
 # WebSocket connection manager
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates."""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # Each client's outbox of encoded frames, drained by its relay() task
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
     
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket) -> asyncio.Queue:
         await websocket.accept()
-        self.active_connections.append(websocket)
+        outbox = asyncio.Queue(maxsize=CLIENT_OUTBOX_SIZE)
+        self.active_connections[websocket] = outbox
+        return outbox
     
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.pop(websocket, None)
     
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
+        await self.broadcast_frame(_json_dumps_text(message))
+
+    async def broadcast_frame(self, payload: str):
+        # Queue the same encoded frame for every client, yielding to the loop
+        # every batch of clients
+        for i, outbox in enumerate(list(self.active_connections.values()), 1):
             try:
-                await connection.send_json(message)
-            except (ConnectionError, RuntimeError):
-                # Connection closed or websocket error - will be cleaned up later
+                outbox.put_nowait(payload)
+            except asyncio.QueueFull:
+                # Client stopped reading; it picks up the next update instead
                 pass
+            if i % BROADCAST_BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+
+
+async def relay(websocket: WebSocket, outbox: asyncio.Queue):
+    """Send a client's queued frames, coalescing whatever is waiting into one frame."""
+    while True:
+        frames = [await outbox.get()]
+        while True:
+            try:
+                frames.append(outbox.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if len(frames) == 1:
+            text = frames[0]
+        else:
+            text = '{"type":"batch","items":[' + ",".join(frames) + "]}"
+        try:
+            await websocket.send_text(text)
+        except (ConnectionError, RuntimeError, WebSocketDisconnect):
+            # Connection closed or websocket error - the endpoint cleans up
+            return
+
+BROADCAST_BATCH_SIZE = 50  # clients queued per event-loop turn
+CLIENT_OUTBOX_SIZE = 256  # frames buffered for a client that is slow to read
+STATS_BROADCAST_INTERVAL = 5  # seconds
 
 manager = ConnectionManager()
 
 
+# Compiled statements each pooled connection keeps (sqlite3's default is 128)
+SQLITE_STATEMENT_CACHE_SIZE = 512
+
+
+class SQLitePool:
+    """Pool of open SQLite connections to one database file.
+
+    Connections are opened on demand and configured once with the given
+    PRAGMAs; up to `size` idle ones are kept so SQLite's page cache stays warm
+    instead of being rebuilt by a fresh connect() on every request.
+    """
+
+    def __init__(self, path: Path, size: int, pragmas: Tuple[str, ...] = ()):
+        self.path = path
+        self.pragmas = pragmas
+        self._idle: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=size)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path, check_same_thread=False, cached_statements=SQLITE_STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in self.pragmas:
+            try:
+                conn.execute(f"PRAGMA {pragma}")
+            except sqlite3.OperationalError as e:
+                # e.g. the WAL switch losing a race with a writer; retried on the next connection
+                logger.debug(f"PRAGMA {pragma} failed on {self.path}: {e}")
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def put(self, conn: sqlite3.Connection) -> None:
+        """Return a connection, discarding any uncommitted work."""
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def warm(self) -> None:
+        """Open and configure idle connections up to the pool size ahead of demand."""
+        for _ in range(self._idle.maxsize - self._idle.qsize()):
+            self.put(self._connect())
+
+    @contextmanager
+    def connection(self):
+        conn = self.get()
+        try:
+            yield conn
+        finally:
+            self.put(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+# Read-only connections to the memory DB
+SQLITE_POOL_SIZE = 4
+SQLITE_READER_PRAGMAS = (
+    "journal_mode=WAL",  # readers don't block on the agents' writes
+    "cache_size=-20000",  # ~20 MB page cache
+    "mmap_size=268435456",
+    "query_only=ON",
+)
+_memory_db_pool = SQLitePool(DB_PATH, SQLITE_POOL_SIZE, SQLITE_READER_PRAGMAS)
+
+
+@contextmanager
 def get_db_connection():
-    """Get SQLite database connection."""
+    """Borrow a pooled SQLite connection to the memory DB (None if it doesn't exist)."""
     if not DB_PATH.exists():
-        return None
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+        yield None
+        return
+    with _memory_db_pool.connection() as conn:
+        yield conn
 
 
 def get_recent_memories(limit: int = 50) -> List[Dict]:
     """Get recent memory entries."""
-    conn = get_db_connection()
-    if not conn:
-        return []
-    
-    try:
+    with get_db_connection() as conn:
+        if not conn:
+            return []
         cursor = conn.execute(
             "SELECT * FROM memories ORDER BY id DESC LIMIT ?",
             (limit,)
         )
         return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
+
+
+# Token usage is summarized at most once per time bucket of this length; the
+# bucket also keys the /api/tokens and /api/stats ETags
+TOKEN_STATS_TTL = 30  # seconds
+TOKEN_STATS_CACHE_SIZE = 8
+_token_stats_cache: Dict[int, Tuple[int, Dict[str, Any]]] = {}
 
 
 def get_token_stats(days: int = 7) -> Dict[str, Any]:
-    """Get token usage statistics from orchestrator's token_usage table."""
+    """Get token usage statistics from orchestrator's token_usage table.
+
+    Results are shared for the rest of the current TOKEN_STATS_TTL bucket.
+    """
+    bucket = int(time.time() // TOKEN_STATS_TTL)
+    hit = _token_stats_cache.get(days)
+    if hit and hit[0] == bucket:
+        return hit[1]
+
     try:
         orchestrator = get_orchestrator(
             db_path="/auto-dev/data/orchestrator.db"
@@ -437,7 +1088,7 @@ def get_token_stats(days: int = 7) -> Dict[str, Any]:
         summary = orchestrator.get_token_usage_summary(days)
         today_usage = orchestrator.get_token_usage_today()
         
-        return {
+        stats = {
             "total": summary.get("total_tokens", 0),
             "total_cost": summary.get("total_cost_usd", 0),
             "by_agent": summary.get("by_agent", {}),
@@ -445,63 +1096,162 @@ def get_token_stats(days: int = 7) -> Dict[str, Any]:
             "daily_average": summary.get("total_tokens", 0) / max(days, 1),
             "today": today_usage
         }
+        if len(_token_stats_cache) >= TOKEN_STATS_CACHE_SIZE:
+            _token_stats_cache.clear()
+        _token_stats_cache[days] = (bucket, stats)
+        return stats
     except Exception as e:
         logger.error(f"Failed to get token stats: {e}")
         return {"total": 0, "by_day": {}, "by_agent": {}, "daily_average": 0, "today": {}}
 
 
-def get_screenshots(limit: int = 20) -> List[Dict]:
-    """Get recent screenshots."""
-    if not SCREENSHOTS_PATH.exists():
-        return []
-    
+@lru_cache(maxsize=512)
+def _read_screenshot_meta(meta_name: str, mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    """Parse a screenshot's .meta sidecar; cached until the file's mtime changes."""
+    try:
+        text = (SCREENSHOTS_PATH / meta_name).read_text()
+        return tuple(tuple(line.split(': ', 1)) for line in text.strip().split('\n'))
+    except (OSError, ValueError):
+        return ()
+
+
+def get_screenshots(limit: int = 20) -> Tuple[List[Dict], int]:
+    """Get recent screenshots.
+
+    Also returns the newest mtime_ns among the listed images and their .meta
+    files: editing one in place doesn't touch the directory's mtime.
+    """
+    try:
+        entries = {entry.name: entry for entry in os.scandir(SCREENSHOTS_PATH)}
+    except FileNotFoundError:
+        return [], 0
+
     screenshots = []
-    for png in sorted(SCREENSHOTS_PATH.glob("*.png"), reverse=True)[:limit]:
-        meta_path = png.with_suffix('.meta')
+    newest = 0
+    for name in sorted((n for n in entries if n.endswith('.png')), reverse=True)[:limit]:
         meta = {}
-        if meta_path.exists():
+        meta_entry = entries.get(name[:-len('.png')] + '.meta')
+        if meta_entry is not None:
             try:
-                meta = dict(line.split(': ', 1) for line in meta_path.read_text().strip().split('\n'))
+                meta_mtime = meta_entry.stat().st_mtime_ns
+                newest = max(newest, meta_mtime)
+                meta = dict(_read_screenshot_meta(meta_entry.name, meta_mtime))
             except (OSError, ValueError):
                 pass
-        
+
+        st = entries[name].stat()
+        newest = max(newest, st.st_mtime_ns)
         screenshots.append({
-            "filename": png.name,
-            "path": f"/screenshots/{png.name}",
-            "timestamp": png.stat().st_mtime,
+            "filename": name,
+            "path": f"/screenshots/{name}",
+            "timestamp": st.st_mtime,
             "meta": meta
         })
-    
-    return screenshots
+
+    return screenshots, newest
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds a Cache-Control header to every file response.
+
+    StaticFiles already answers If-None-Match/If-Modified-Since with 304;
+    this lets browsers skip the revalidation request entirely.
+    """
+
+    def __init__(self, *args, cache_control: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = self.cache_control
+        return response
 
 
 # Mount static files for screenshots
 if SCREENSHOTS_PATH.exists():
-    app.mount("/screenshots", StaticFiles(directory=str(SCREENSHOTS_PATH)), name="screenshots")
+    app.mount(
+        "/screenshots",
+        CachedStaticFiles(directory=str(SCREENSHOTS_PATH), cache_control="public, max-age=60"),
+        name="screenshots"
+    )
 
 # Mount React build assets (must be after API routes but before catch-all)
 if REACT_BUILD_PATH.exists():
-    app.mount("/assets", StaticFiles(directory=str(REACT_BUILD_PATH / "assets")), name="react-assets")
+    # Vite puts a content hash in every asset filename, so they never change
+    app.mount(
+        "/assets",
+        CachedStaticFiles(
+            directory=str(REACT_BUILD_PATH / "assets"),
+            cache_control="public, max-age=31536000, immutable"
+        ),
+        name="react-assets"
+    )
+
+
+# index.html for every client-side route, served by StaticFiles so browsers can
+# revalidate it with If-None-Match/If-Modified-Since. no-cache because each
+# build points it at new hashed asset names. Like the /assets mount, whether a
+# build exists is decided once at startup.
+react_index_files = (
+    CachedStaticFiles(directory=str(REACT_BUILD_PATH), cache_control="no-cache")
+    if (REACT_BUILD_PATH / "index.html").exists() else None
+)
+
+
+async def serve_react_index(request: Request) -> Response:
+    """Serve the React app, or the legacy HTML if there is no React build."""
+    if react_index_files is None:
+        return HTMLResponse(content=DASHBOARD_HTML)
+    return await react_index_files.get_response("index.html", request.scope)
 
 
 @app.get("/")
-async def dashboard():
+async def dashboard(request: Request):
     """Serve the React app."""
-    react_index = REACT_BUILD_PATH / "index.html"
-    if react_index.exists():
-        return FileResponse(react_index)
-    # Fallback to legacy HTML if React build not available
-    return HTMLResponse(content=DASHBOARD_HTML)
+    return await serve_react_index(request)
 
 
-@app.get("/api/status")
-async def get_status():
+# Polled endpoints below answer repeat requests with 304 while their inputs are unchanged
+POLL_CACHE_MAX_AGE = 2  # seconds
+
+
+def file_version(*paths: Path) -> Tuple:
+    """(mtime_ns, size) of each path, None for missing ones; a cheap change marker."""
+    version = []
+    for path in paths:
+        try:
+            st = path.stat()
+            version.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            version.append(None)
+    return tuple(version)
+
+
+def check_etag(request: Request, response: Response, *parts) -> Optional[Response]:
+    """Tag a polled response; return a 304 if the client already holds it."""
+    etag = make_etag(*parts)
+    cache_control = f"max-age={POLL_CACHE_MAX_AGE}"
+    cached = not_modified(request, etag)
+    if cached:
+        cached.headers["Cache-Control"] = cache_control
+        return cached
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return None
+
+
+@app.get("/api/status", response_model=None)
+async def get_status(request: Request, response: Response):
     """Get current agent status."""
     # Try to read watcher status from a status file
     status_file = Path("/auto-dev/data/watcher_status.json")
+    cached = check_etag(request, response, "status", file_version(status_file))
+    if cached:
+        return cached
     if status_file.exists():
         try:
-            return json.loads(status_file.read_text())
+            return _json_loads(status_file.read_bytes())
         except (json.JSONDecodeError, OSError):
             pass
     
@@ -516,26 +1266,49 @@ async def get_status():
 @app.get("/api/memories")
 async def api_memories(limit: int = 50):
     """Get recent memories."""
-    return {"memories": get_recent_memories(limit)}
+    return {"memories": await run_in_threadpool(get_recent_memories, limit)}
 
 
-@app.get("/api/tokens")
-async def api_tokens(days: int = 7):
+@app.get("/api/tokens", response_model=None)
+async def api_tokens(request: Request, response: Response, days: int = 7):
     """Get token usage stats."""
-    return get_token_stats(days)
+    cached = check_etag(request, response, "tokens", days, int(time.time() // TOKEN_STATS_TTL))
+    if cached:
+        return cached
+    return await run_in_threadpool(get_token_stats, days)
 
 
-@app.get("/api/screenshots")
-async def api_screenshots(limit: int = 20):
+@app.get("/api/screenshots", response_model=None)
+async def api_screenshots(request: Request, response: Response, limit: int = 20):
     """Get recent screenshots."""
-    return {"screenshots": get_screenshots(limit)}
+    # The directory's mtime covers added/removed files; in-place edits of the
+    # listed files show up in their own mtimes
+    screenshots, newest = await run_in_threadpool(get_screenshots, limit)
+    cached = check_etag(request, response, "screenshots", limit, file_version(SCREENSHOTS_PATH), newest)
+    if cached:
+        return cached
+    return {"screenshots": screenshots}
 
 
-@app.get("/api/stats")
-async def api_stats():
+@app.get("/api/stats", response_model=None)
+async def api_stats(request: Request, response: Response):
     """Get aggregated statistics."""
-    tokens = get_token_stats(7)
-    memories = get_recent_memories(10)
+    cached = check_etag(
+        request, response, "stats",
+        int(time.time() // TOKEN_STATS_TTL),
+        file_version(DB_PATH, DB_PATH.with_name(DB_PATH.name + "-wal"))
+    )
+    if cached:
+        return cached
+    return await collect_stats()
+
+
+async def collect_stats() -> Dict[str, Any]:
+    """Aggregated statistics for /api/stats and the WebSocket feed."""
+    tokens, memories = await asyncio.gather(
+        run_in_threadpool(get_token_stats, 7),
+        run_in_threadpool(get_recent_memories, 10)
+    )
 
     return {
         "tokens": {
@@ -547,30 +1320,86 @@ async def api_stats():
     }
 
 
+# Process scans walk all of /proc; dashboards poll /api/agents every few seconds
+AGENT_PROCESSES_TTL = 2.0  # seconds
+_agent_processes_cache: Tuple[float, List[Dict]] = (0.0, [])
+# psutil handles for matched agents, kept so cpu_percent() measures between scans
+_agent_process_handles: Dict[int, psutil.Process] = {}
+
+
+def _is_agent_cmdline(cmdline: str) -> bool:
+    lowered = cmdline.lower()
+    return 'agent_runner.py' in cmdline or ('claude' in lowered and 'code' not in lowered)
+
+
+def _scan_agent_cmdlines():
+    """Yield (pid, cmdline) of agent processes, reading only /proc/<pid>/cmdline."""
+    try:
+        pids = [name for name in os.listdir('/proc') if name.isdigit()]
+    except FileNotFoundError:
+        # No procfs (e.g. macOS): let psutil find the command lines
+        for proc in psutil.process_iter(['pid', 'cmdline']):
+            cmdline = ' '.join(proc.info['cmdline'] or [])
+            if _is_agent_cmdline(cmdline):
+                yield proc.info['pid'], cmdline
+        return
+
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                raw = f.read()
+        except OSError:
+            continue
+        cmdline = raw.rstrip(b'\0').replace(b'\0', b' ').decode(errors='replace')
+        if _is_agent_cmdline(cmdline):
+            yield int(pid), cmdline
+
+
 def get_agent_processes() -> List[Dict]:
-    """Get info about running agent processes."""
+    """Get info about running agent processes (cached for AGENT_PROCESSES_TTL)."""
+    global _agent_processes_cache, _agent_process_handles
+    now = time.monotonic()
+    cached_at, cached = _agent_processes_cache
+    if now - cached_at < AGENT_PROCESSES_TTL:
+        return cached
+
+    total_memory = psutil.virtual_memory().total
     processes = []
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time', 'memory_percent', 'cpu_percent']):
+    handles = {}
+    # Only the few matching processes pay for psutil's per-process reads
+    for pid, cmdline in _scan_agent_cmdlines():
         try:
-            cmdline = ' '.join(proc.info['cmdline'] or [])
-            if 'agent_runner.py' in cmdline or ('claude' in cmdline.lower() and 'code' not in cmdline.lower()):
+            proc = _agent_process_handles.get(pid)
+            if proc is None or not proc.is_running():
+                proc = psutil.Process(pid)
+            with proc.oneshot():
+                memory_info = proc.memory_info()
                 processes.append({
-                    'pid': proc.info['pid'],
-                    'name': proc.info['name'],
+                    'pid': pid,
+                    'name': proc.name(),
                     'cmdline': cmdline[:100],
-                    'uptime': datetime.now().timestamp() - proc.info['create_time'],
-                    'memory_percent': round(proc.info['memory_percent'], 1),
-                    'cpu_percent': proc.info['cpu_percent']
+                    'uptime': datetime.now().timestamp() - proc.create_time(),
+                    'memory_percent': round(memory_info.rss / total_memory * 100, 1),
+                    # Non-blocking: change since the previous scan
+                    'cpu_percent': proc.cpu_percent()
                 })
+            handles[pid] = proc
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
+
+    _agent_process_handles = handles
+    _agent_processes_cache = (now, processes)
     return processes
 
 
-@app.get("/api/agents")
-async def api_agents():
+@app.get("/api/agents", response_model=None)
+async def api_agents(request: Request, response: Response):
     """Get info about running agents."""
-    processes = get_agent_processes()
+    processes = await run_in_threadpool(get_agent_processes)
+    # Unchanged until the next process scan
+    cached = check_etag(request, response, "agents", _agent_processes_cache[0])
+    if cached:
+        return cached
     watcher_running = any('agent_runner.py' in p.get('cmdline', '') for p in processes)
     claude_processes = [p for p in processes if 'claude' in p.get('cmdline', '').lower()]
     
@@ -587,16 +1416,17 @@ async def api_agents():
 async def start_agent():
     """Enable all agents via Redis (instant soft-pause control)."""
     # Always use Redis for instant enable/disable (agents run continuously in KaaS)
-    r = get_redis()
+    r = get_async_redis()
     if not r:
         return {"status": "error", "message": "Redis unavailable"}
 
     try:
-        # Enable all agents
-        for agent_type in AGENT_TYPES:
-            r.set(f"agent:{agent_type}:enabled", "1")
-        # Notify agent runners
-        r.publish("agent:control", json.dumps({"action": "start_all"}))
+        # Enable all agents and notify agent runners in one round trip
+        async with r.pipeline(transaction=False) as pipe:
+            for agent_type in AGENT_TYPES:
+                pipe.set(f"agent:{agent_type}:enabled", "1")
+            pipe.publish("agent:control", _json_dumps_text({"action": "start_all"}))
+            await pipe.execute()
         return {"status": "started", "message": f"All {len(AGENT_TYPES)} agents enabled"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -606,16 +1436,17 @@ async def start_agent():
 async def stop_agent():
     """Disable all agents via Redis (instant soft-pause control)."""
     # Always use Redis for instant enable/disable (agents run continuously in KaaS)
-    r = get_redis()
+    r = get_async_redis()
     if not r:
         return {"status": "error", "message": "Redis unavailable"}
 
     try:
-        # Disable all agents
-        for agent_type in AGENT_TYPES:
-            r.set(f"agent:{agent_type}:enabled", "0")
-        # Notify agent runners
-        r.publish("agent:control", json.dumps({"action": "stop_all"}))
+        # Disable all agents and notify agent runners in one round trip
+        async with r.pipeline(transaction=False) as pipe:
+            for agent_type in AGENT_TYPES:
+                pipe.set(f"agent:{agent_type}:enabled", "0")
+            pipe.publish("agent:control", _json_dumps_text({"action": "stop_all"}))
+            await pipe.execute()
         return {"status": "stopped", "message": f"All {len(AGENT_TYPES)} agents disabled"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -628,15 +1459,16 @@ async def start_specific_agent(agent_type: str):
         return {"status": "error", "message": f"Unknown agent type: {agent_type}"}
 
     # Always use Redis for instant enable/disable (agents run continuously in KaaS)
-    r = get_redis()
+    r = get_async_redis()
     if not r:
         return {"status": "error", "message": "Redis unavailable"}
 
     try:
-        # Set agent as enabled in Redis
-        r.set(f"agent:{agent_type}:enabled", "1")
-        # Publish message to notify agent runner immediately
-        r.publish("agent:control", json.dumps({"action": "start", "agent": agent_type}))
+        # Set agent as enabled in Redis and notify the agent runner in one round trip
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.set(f"agent:{agent_type}:enabled", "1")
+            pipe.publish("agent:control", _json_dumps_text({"action": "start", "agent": agent_type}))
+            await pipe.execute()
         return {"status": "started", "message": f"{agent_type} agent enabled"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -649,27 +1481,98 @@ async def stop_specific_agent(agent_type: str):
         return {"status": "error", "message": f"Unknown agent type: {agent_type}"}
 
     # Always use Redis for instant enable/disable (agents run continuously in KaaS)
-    r = get_redis()
+    r = get_async_redis()
     if not r:
         return {"status": "error", "message": "Redis unavailable"}
 
     try:
-        # Set agent as disabled in Redis
-        r.set(f"agent:{agent_type}:enabled", "0")
-        # Publish message to notify agent runner immediately
-        r.publish("agent:control", json.dumps({"action": "stop", "agent": agent_type}))
+        # Set agent as disabled in Redis and notify the agent runner in one round trip
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.set(f"agent:{agent_type}:enabled", "0")
+            pipe.publish("agent:control", _json_dumps_text({"action": "stop", "agent": agent_type}))
+            await pipe.execute()
         return {"status": "stopped", "message": f"{agent_type} agent disabled"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
 
+@lru_cache(maxsize=256)
+def _to_pg_placeholders(query: str) -> str:
+    """Convert SQLite ? placeholders to PostgreSQL %s (cached per query string)."""
+    return query.replace('?', '%s')
+
+
+@lru_cache(maxsize=128)
+def build_filtered_query(template: str, conditions: Tuple[str, ...]) -> str:
+    """Fill a query template's {where} slot with the active filter conditions.
+
+    Conditions are fixed strings chosen per filter, so each combination maps to
+    one cached query text: SQLite's statement cache and PostgreSQL prepared
+    statements hit instead of re-parsing freshly built SQL.
+    """
+    return template.format(where=" AND ".join(conditions) or "1=1")
+
+
+def _plain_rows(cursor) -> Optional[List[str]]:
+    """Switch a sqlite3 cursor to plain tuple rows; return its column names.
+
+    Zipping tuples with the names once is cheaper than dict(sqlite3.Row),
+    which looks every key up again by name. Returns None for other cursors.
+    """
+    if not isinstance(cursor, sqlite3.Cursor):
+        return None
+    cursor.row_factory = None
+    return [column[0] for column in cursor.description]
+
+
+def fetch_dicts(cursor) -> List[Dict[str, Any]]:
+    """Fetch all remaining rows as dicts in one pass.
+
+    PostgreSQL cursors already produce dicts (RealDictCursor / dict_row), so
+    those rows are returned without a per-row copy; SQLite rows are fetched
+    as tuples and zipped with the column names.
+    """
+    names = _plain_rows(cursor)
+    rows = cursor.fetchall()
+    if names is not None:
+        return [dict(zip(names, row)) for row in rows]
+    if rows and isinstance(rows[0], dict):
+        return rows
+    return [dict(row) for row in rows]
+
+
+def iter_dicts(cursor, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+    """Yield the remaining rows as dicts, fetching batch_size rows at a time."""
+    names = _plain_rows(cursor)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        if names is not None:
+            for row in rows:
+                yield dict(zip(names, row))
+        elif isinstance(rows[0], dict):
+            yield from rows
+        else:
+            for row in rows:
+                yield dict(row)
+
+
 class DatabaseWrapper:
     """Wrapper to provide consistent interface for SQLite and PostgreSQL."""
 
-    def __init__(self, conn, is_postgres=False):
+    def __init__(self, conn, is_postgres=False, pool=None):
         self._conn = conn
         self._is_postgres = is_postgres
-        self._cursor = None
+        # SQLitePool the connection goes back to on close()
+        self._pool = pool
+        # One cursor serves every PostgreSQL query for the wrapper's lifetime;
+        # callers consume each result before issuing the next query
+        self._cursor = conn.cursor() if is_postgres else None
+
+    @property
+    def is_postgres(self):
+        return self._is_postgres
 
     def cursor(self):
         """Return self to allow cursor().execute() pattern."""
@@ -677,12 +1580,8 @@ class DatabaseWrapper:
 
     def execute(self, query, params=None):
         """Execute query and return cursor-like object."""
-        # Convert SQLite ? placeholders to PostgreSQL %s
-        if self._is_postgres:
-            query = query.replace('?', '%s')
-
         if self._is_postgres:
-            self._cursor = self._conn.cursor()
+            query = _to_pg_placeholders(query)
             if params:
                 self._cursor.execute(query, params)
             else:
@@ -694,13 +1593,57 @@ class DatabaseWrapper:
             else:
                 return self._conn.execute(query)
 
+    def executemany(self, query, params_seq):
+        """Execute query once per parameter tuple in params_seq."""
+        if self._is_postgres:
+            self._cursor.executemany(_to_pg_placeholders(query), params_seq)
+            return self._cursor
+        return self._conn.executemany(query, params_seq)
+
+    def execute_prepared(self, query, params=None):
+        """Like execute(), but PostgreSQL parses and plans the query once per connection."""
+        if not self._is_postgres:
+            return self.execute(query, params)
+        self._conn.execute_prepared(self._cursor, _to_pg_placeholders(query), params)
+        return self._cursor
+
+    def begin_write(self):
+        """Open a write transaction, taking SQLite's write lock up front.
+
+        Waiting for another writer then happens here, before any work is done,
+        rather than part-way through the transaction. PostgreSQL opens its
+        transaction implicitly, so this is a no-op there.
+        """
+        if not self._is_postgres:
+            self._conn.execute("BEGIN IMMEDIATE")
+
     def commit(self):
         self._conn.commit()
 
     def close(self):
+        """Release the connection; later calls are no-ops."""
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
         if self._cursor:
             self._cursor.close()
-        self._conn.close()
+            self._cursor = None
+        if self._pool is not None:
+            self._pool.put(conn)
+        else:
+            conn.close()
+
+
+# SQLite fallback for the orchestrator DB; endpoints read and write through it
+ORCHESTRATOR_SQLITE_POOL_SIZE = 8
+ORCHESTRATOR_SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",  # durable at WAL checkpoints, no fsync per commit
+    "cache_size=-64000",  # ~64 MB page cache
+    "mmap_size=268435456",
+    "temp_store=MEMORY",  # ORDER BY/GROUP BY scratch space stays off disk
+)
+_orchestrator_db_pool = SQLitePool(ORCHESTRATOR_DB_PATH, ORCHESTRATOR_SQLITE_POOL_SIZE, ORCHESTRATOR_SQLITE_PRAGMAS)
 
 
 def get_orchestrator_db():
@@ -713,45 +1656,7 @@ def get_orchestrator_db():
     # Fall back to SQLite
     if not ORCHESTRATOR_DB_PATH.exists():
         return None
-    conn = sqlite3.connect(ORCHESTRATOR_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return DatabaseWrapper(conn, is_postgres=False)
-
-
-def get_postgres_db():
-    """Get PostgreSQL database connection."""
-    if not HAS_PSYCOPG2:
-        return None
-
-    # Check for individual connection params (Docker environment)
-    db_host = os.environ.get('DB_HOST')
-    db_user = os.environ.get('DB_USER')
-    db_password = os.environ.get('DB_PASSWORD')
-    db_name = os.environ.get('DB_NAME')
-
-    if db_host and db_user and db_name:
-        try:
-            conn = psycopg2.connect(
-                host=db_host,
-                user=db_user,
-                password=db_password or '',
-                dbname=db_name,
-                cursor_factory=psycopg2.extras.RealDictCursor
-            )
-            return conn
-        except Exception as e:
-            print(f"PostgreSQL connection error: {e}")
-
-    # Check for DATABASE_URL
-    database_url = os.environ.get('DATABASE_URL')
-    if database_url:
-        try:
-            conn = psycopg2.connect(database_url, cursor_factory=psycopg2.extras.RealDictCursor)
-            return conn
-        except Exception as e:
-            print(f"PostgreSQL connection error: {e}")
-
-    return None
+    return DatabaseWrapper(_orchestrator_db_pool.get(), is_postgres=False, pool=_orchestrator_db_pool)
 
 
 def get_redis():
@@ -766,9 +1671,159 @@ def get_redis():
         return None
 
 
+_async_redis = None
+
+
+def get_async_redis():
+    """Get the shared asyncio Redis client for agent control."""
+    global _async_redis
+    if not HAS_REDIS:
+        return None
+    if _async_redis is None:
+        redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+        try:
+            _async_redis = redis.asyncio.from_url(redis_url)
+        except Exception as e:
+            print(f"Redis connection error: {e}")
+            return None
+    return _async_redis
+
+
+async def close_async_redis():
+    """Close the shared asyncio Redis client."""
+    global _async_redis
+    if _async_redis is not None:
+        await _async_redis.aclose()
+        _async_redis = None
+
+
+_SCHEMA_STATEMENTS: Tuple[str, ...] = (
+    # Needs CREATE privilege on the database; an existing install is enough
+    """BEGIN
+        CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+    EXCEPTION WHEN others THEN
+        RAISE WARNING 'uuid-ossp not created: %', SQLERRM;
+    END""",
+
+    """CREATE TABLE IF NOT EXISTS repos (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+        name TEXT NOT NULL,
+        slug TEXT UNIQUE NOT NULL,
+        provider TEXT DEFAULT 'gitlab' CHECK (provider IN ('gitlab', 'github')),
+        gitlab_url TEXT NOT NULL,
+        gitlab_project_id TEXT NOT NULL,
+        default_branch TEXT DEFAULT 'main',
+        autonomy_mode TEXT DEFAULT 'guided' CHECK (autonomy_mode IN ('full', 'guided')),
+        settings JSONB DEFAULT '{}',
+        webhook_secret_hash TEXT,
+        token_ssm_path TEXT,
+        mr_prefix TEXT DEFAULT '[AUTO-DEV]',
+        created_at TIMESTAMP DEFAULT NOW(),
+        updated_at TIMESTAMP DEFAULT NOW(),
+        active BOOLEAN DEFAULT true
+    )""",
+
+    """CREATE TABLE IF NOT EXISTS tasks (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+        repo_id UUID REFERENCES repos(id) ON DELETE CASCADE,
+        parent_task_id UUID REFERENCES tasks(id) ON DELETE SET NULL,
+        task_type TEXT NOT NULL,
+        status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'claimed', 'in_progress', 'completed', 'failed', 'cancelled')),
+        priority INTEGER DEFAULT 5 CHECK (priority BETWEEN 1 AND 10),
+        payload JSONB DEFAULT '{}',
+        result JSONB,
+        error TEXT,
+        created_by TEXT,
+        assigned_to TEXT,
+        assigned_agent TEXT,
+        created_at TIMESTAMP DEFAULT NOW(),
+        claimed_at TIMESTAMP,
+        started_at TIMESTAMP,
+        completed_at TIMESTAMP,
+        retry_count INTEGER DEFAULT 0,
+        max_retries INTEGER DEFAULT 3,
+        needs_approval INTEGER DEFAULT 0,
+        approval_status TEXT,
+        approved_by TEXT,
+        approved_at TIMESTAMP,
+        rejection_reason TEXT
+    )""",
+
+    """CREATE TABLE IF NOT EXISTS approvals (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+        repo_id UUID REFERENCES repos(id) ON DELETE CASCADE,
+        task_id UUID REFERENCES tasks(id) ON DELETE CASCADE,
+        approval_type TEXT NOT NULL CHECK (approval_type IN ('spec', 'merge', 'issue_creation', 'deploy')),
+        status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'approved', 'rejected')),
+        payload JSONB DEFAULT '{}',
+        reviewer TEXT,
+        review_comment TEXT,
+        created_at TIMESTAMP DEFAULT NOW(),
+        reviewed_at TIMESTAMP,
+        auto_approved BOOLEAN DEFAULT false,
+        auto_approve_reason TEXT
+    )""",
+
+    """CREATE TABLE IF NOT EXISTS agent_status (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+        agent_type TEXT NOT NULL,
+        repo_id UUID REFERENCES repos(id) ON DELETE SET NULL,
+        status TEXT DEFAULT 'idle' CHECK (status IN ('idle', 'running', 'error', 'stopped')),
+        current_task_id UUID REFERENCES tasks(id) ON DELETE SET NULL,
+        last_heartbeat TIMESTAMP DEFAULT NOW(),
+        session_started TIMESTAMP,
+        metadata JSONB DEFAULT '{}'
+    )""",
+
+    """CREATE TABLE IF NOT EXISTS reflections (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+        repo_id UUID REFERENCES repos(id) ON DELETE CASCADE,
+        task_id UUID REFERENCES tasks(id) ON DELETE SET NULL,
+        agent_type TEXT NOT NULL,
+        reflection_type TEXT NOT NULL,
+        content TEXT NOT NULL,
+        confidence FLOAT DEFAULT 0.5,
+        tags TEXT[],
+        created_at TIMESTAMP DEFAULT NOW()
+    )""",
+
+    """CREATE TABLE IF NOT EXISTS learnings (
+        id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+        repo_id UUID REFERENCES repos(id) ON DELETE CASCADE,
+        agent_type TEXT NOT NULL,
+        category TEXT NOT NULL,
+        insight TEXT NOT NULL,
+        confidence FLOAT DEFAULT 0.5,
+        usage_count INTEGER DEFAULT 0,
+        last_used TIMESTAMP,
+        created_at TIMESTAMP DEFAULT NOW(),
+        active BOOLEAN DEFAULT true
+    )""",
+
+    "CREATE INDEX IF NOT EXISTS idx_tasks_repo_status ON tasks(repo_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_status_priority ON tasks(status, priority DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_assigned_to ON tasks(assigned_to)",
+    "CREATE INDEX IF NOT EXISTS idx_approvals_repo_status ON approvals(repo_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_approvals_pending ON approvals(status) WHERE status = 'pending'",
+    "CREATE INDEX IF NOT EXISTS idx_approvals_created_at ON approvals(created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_agent_status_type ON agent_status(agent_type)",
+    "CREATE INDEX IF NOT EXISTS idx_agent_status_heartbeat ON agent_status(last_heartbeat DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_reflections_repo_agent ON reflections(repo_id, agent_type)",
+    "CREATE INDEX IF NOT EXISTS idx_reflections_agent_created ON reflections(agent_type, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_reflections_type_created ON reflections(reflection_type, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_reflections_created ON reflections(created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_learnings_repo_agent ON learnings(repo_id, agent_type) WHERE active = true",
+)
+# Every statement is idempotent, so the whole schema plus the column
+# migrations goes out as one DO block in one round trip; each statement has
+# its own sub-block, so one failure doesn't roll back the others
+_SCHEMA_SQL = _do_block(_SCHEMA_STATEMENTS + tuple(sql for _, _, _, sql in _MIGRATIONS))
+
+
 def init_postgres_schema():
-    """Initialize PostgreSQL schema if tables don't exist."""
-    if not HAS_PSYCOPG2:
+    """Create the PostgreSQL schema and apply column migrations."""
+    if not HAS_POSTGRES:
         print("PostgreSQL driver not available, skipping schema init")
         return
 
@@ -778,239 +1833,137 @@ def init_postgres_schema():
         return
 
     try:
-        cursor = conn.cursor()
-
-        # Check if tables exist
-        cursor.execute("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables
-                WHERE table_schema = 'public' AND table_name = 'tasks'
-            ) as table_exists
-        """)
-        result = cursor.fetchone()
-        tables_exist = result.get('table_exists', False) if isinstance(result, dict) else result[0]
-
-        if tables_exist:
-            print("Database schema exists, checking for missing columns...")
-            # Add missing columns and fix constraints
-            migrations = [
-                "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMP",
-                "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS needs_approval INTEGER DEFAULT 0",
-                "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS approval_status TEXT",
-                "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS approved_by TEXT",
-                "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS approved_at TIMESTAMP",
-                "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS rejection_reason TEXT",
-                # Fix status check constraint to include 'claimed'
-                "ALTER TABLE tasks DROP CONSTRAINT IF EXISTS tasks_status_check",
-                "ALTER TABLE tasks ADD CONSTRAINT tasks_status_check CHECK (status IN ('pending', 'claimed', 'in_progress', 'completed', 'failed', 'cancelled'))",
-            ]
-            for migration in migrations:
-                try:
-                    cursor.execute(migration)
-                    conn.commit()
-                except Exception as e:
-                    print(f"Migration note: {e}")
-                    conn.rollback()
-            print("Schema migrations complete")
-            cursor.close()
-            conn.close()
-            return
-
-        print("Initializing database schema...")
-
-        # Execute each statement separately for better error handling
-        statements = [
-            'CREATE EXTENSION IF NOT EXISTS "uuid-ossp"',
-
-            """CREATE TABLE IF NOT EXISTS repos (
-                id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-                name TEXT NOT NULL,
-                slug TEXT UNIQUE NOT NULL,
-                provider TEXT DEFAULT 'gitlab' CHECK (provider IN ('gitlab', 'github')),
-                gitlab_url TEXT NOT NULL,
-                gitlab_project_id TEXT NOT NULL,
-                default_branch TEXT DEFAULT 'main',
-                autonomy_mode TEXT DEFAULT 'guided' CHECK (autonomy_mode IN ('full', 'guided')),
-                settings JSONB DEFAULT '{}',
-                webhook_secret_hash TEXT,
-                token_ssm_path TEXT,
-                mr_prefix TEXT DEFAULT '[AUTO-DEV]',
-                created_at TIMESTAMP DEFAULT NOW(),
-                updated_at TIMESTAMP DEFAULT NOW(),
-                active BOOLEAN DEFAULT true
-            )""",
-
-            # Migration: Add provider column to existing repos tables
-            "ALTER TABLE repos ADD COLUMN IF NOT EXISTS provider TEXT DEFAULT 'gitlab'",
-
-            """CREATE TABLE IF NOT EXISTS tasks (
-                id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-                repo_id UUID REFERENCES repos(id) ON DELETE CASCADE,
-                parent_task_id UUID REFERENCES tasks(id) ON DELETE SET NULL,
-                task_type TEXT NOT NULL,
-                status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'claimed', 'in_progress', 'completed', 'failed', 'cancelled')),
-                priority INTEGER DEFAULT 5 CHECK (priority BETWEEN 1 AND 10),
-                payload JSONB DEFAULT '{}',
-                result JSONB,
-                error TEXT,
-                created_by TEXT,
-                assigned_to TEXT,
-                assigned_agent TEXT,
-                created_at TIMESTAMP DEFAULT NOW(),
-                claimed_at TIMESTAMP,
-                started_at TIMESTAMP,
-                completed_at TIMESTAMP,
-                retry_count INTEGER DEFAULT 0,
-                max_retries INTEGER DEFAULT 3,
-                needs_approval INTEGER DEFAULT 0,
-                approval_status TEXT,
-                approved_by TEXT,
-                approved_at TIMESTAMP,
-                rejection_reason TEXT
-            )""",
-
-            """CREATE TABLE IF NOT EXISTS approvals (
-                id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-                repo_id UUID REFERENCES repos(id) ON DELETE CASCADE,
-                task_id UUID REFERENCES tasks(id) ON DELETE CASCADE,
-                approval_type TEXT NOT NULL CHECK (approval_type IN ('spec', 'merge', 'issue_creation', 'deploy')),
-                status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'approved', 'rejected')),
-                payload JSONB DEFAULT '{}',
-                reviewer TEXT,
-                review_comment TEXT,
-                created_at TIMESTAMP DEFAULT NOW(),
-                reviewed_at TIMESTAMP,
-                auto_approved BOOLEAN DEFAULT false,
-                auto_approve_reason TEXT
-            )""",
-
-            """CREATE TABLE IF NOT EXISTS agent_status (
-                id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-                agent_type TEXT NOT NULL,
-                repo_id UUID REFERENCES repos(id) ON DELETE SET NULL,
-                status TEXT DEFAULT 'idle' CHECK (status IN ('idle', 'running', 'error', 'stopped')),
-                current_task_id UUID REFERENCES tasks(id) ON DELETE SET NULL,
-                last_heartbeat TIMESTAMP DEFAULT NOW(),
-                session_started TIMESTAMP,
-                metadata JSONB DEFAULT '{}'
-            )""",
-
-            """CREATE TABLE IF NOT EXISTS reflections (
-                id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-                repo_id UUID REFERENCES repos(id) ON DELETE CASCADE,
-                task_id UUID REFERENCES tasks(id) ON DELETE SET NULL,
-                agent_type TEXT NOT NULL,
-                reflection_type TEXT NOT NULL,
-                content TEXT NOT NULL,
-                confidence FLOAT DEFAULT 0.5,
-                tags TEXT[],
-                created_at TIMESTAMP DEFAULT NOW()
-            )""",
-
-            """CREATE TABLE IF NOT EXISTS learnings (
-                id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-                repo_id UUID REFERENCES repos(id) ON DELETE CASCADE,
-                agent_type TEXT NOT NULL,
-                category TEXT NOT NULL,
-                insight TEXT NOT NULL,
-                confidence FLOAT DEFAULT 0.5,
-                usage_count INTEGER DEFAULT 0,
-                last_used TIMESTAMP,
-                created_at TIMESTAMP DEFAULT NOW(),
-                active BOOLEAN DEFAULT true
-            )""",
-
-            "CREATE INDEX IF NOT EXISTS idx_tasks_repo_status ON tasks(repo_id, status)",
-            "CREATE INDEX IF NOT EXISTS idx_tasks_status_priority ON tasks(status, priority DESC)",
-            "CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at DESC)",
-            "CREATE INDEX IF NOT EXISTS idx_tasks_assigned_to ON tasks(assigned_to)",
-            "CREATE INDEX IF NOT EXISTS idx_approvals_repo_status ON approvals(repo_id, status)",
-            "CREATE INDEX IF NOT EXISTS idx_approvals_pending ON approvals(status) WHERE status = 'pending'",
-            "CREATE INDEX IF NOT EXISTS idx_approvals_created_at ON approvals(created_at DESC)",
-            "CREATE INDEX IF NOT EXISTS idx_agent_status_type ON agent_status(agent_type)",
-            "CREATE INDEX IF NOT EXISTS idx_agent_status_heartbeat ON agent_status(last_heartbeat DESC)",
-            "CREATE INDEX IF NOT EXISTS idx_reflections_repo_agent ON reflections(repo_id, agent_type)",
-            "CREATE INDEX IF NOT EXISTS idx_learnings_repo_agent ON learnings(repo_id, agent_type) WHERE active = true",
-        ]
-
-        for stmt in statements:
-            try:
-                cursor.execute(stmt)
-            except Exception as e:
-                print(f"Warning: Statement failed (may already exist): {e}")
-                conn.rollback()
-                cursor = conn.cursor()  # Get a fresh cursor after rollback
-
+        with conn.cursor() as cursor:
+            cursor.execute(_SCHEMA_SQL)
         conn.commit()
         print("Database schema initialized successfully")
-
     except Exception as e:
         print(f"Error initializing database schema: {e}")
-        try:
-            conn.rollback()
-        except:
-            pass
     finally:
-        try:
-            cursor.close()
-            conn.close()
-        except:
-            pass
+        conn.close()
 
 
 # Schema initialization is now handled by orchestrator_pg.py
 # init_postgres_schema() - disabled to avoid UUID/TEXT type conflicts
 
 
+# One page of tasks plus the per-status counts, in a single PostgreSQL round trip
+TASKS_PAGE_SQL = """
+    WITH page AS (
+        SELECT {columns} FROM tasks
+        WHERE %(status)s::text IS NULL OR status = %(status)s
+        ORDER BY priority DESC, created_at DESC
+        LIMIT %(limit)s
+    )
+    SELECT
+        (SELECT COALESCE(json_agg(page ORDER BY priority DESC, created_at DESC), '[]')
+         FROM page) AS tasks,
+        (SELECT COALESCE(json_object_agg(status, count), '{}')
+         FROM (SELECT status, COUNT(*) AS count FROM tasks GROUP BY status) s) AS stats
+"""
+
+
+SQLITE_TASKS_SQL = "SELECT {columns} FROM tasks ORDER BY priority DESC, created_at DESC LIMIT ?"
+SQLITE_TASKS_BY_STATUS_SQL = (
+    "SELECT {columns} FROM tasks WHERE status = ? ORDER BY priority DESC, created_at DESC LIMIT ?"
+)
+
+
+# Columns task listings return. The JSON blobs are fetched only when requested
+TASK_LIST_COLUMNS = ('id', 'task_type', 'status', 'priority', 'assigned_to', 'repo_id',
+                     'created_at', 'completed_at', 'parent_task_id', 'error')
+# Task columns holding JSON text; listings include them unless ?fields= narrows it
+TASK_JSON_FIELDS = ('payload', 'result')
+
+
+def task_json_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """JSON columns to include in a task listing (all of them when fields is None)."""
+    if fields is None:
+        return TASK_JSON_FIELDS
+    requested = {name.strip() for name in fields.split(',')}
+    return tuple(name for name in TASK_JSON_FIELDS if name in requested)
+
+
+@lru_cache(maxsize=32)
+def task_list_query(template: str, json_fields: Tuple[str, ...]) -> str:
+    """Fill a task query template's {columns} slot with the listed columns."""
+    return template.replace("{columns}", ", ".join(TASK_LIST_COLUMNS + json_fields))
+
+
+def decode_task_json(task: Dict[str, Any], json_fields: Tuple[str, ...]) -> None:
+    """Decode the requested JSON columns of a task row in place."""
+    # payload/result may be TEXT or JSONB depending on which schema created the table
+    if 'payload' in json_fields:
+        task['payload'] = parse_json_field(task['payload']) or {}
+    # result stays NULL until a task finishes
+    if 'result' in json_fields and task.get('result') is not None:
+        task['result'] = parse_json_field(task['result'])
+
+
 @app.get("/api/tasks")
-async def get_tasks(status: str = None, limit: int = 50):
-    """Get tasks from the queue."""
+def get_tasks(status: str = None, limit: int = 50, fields: str = None):
+    """Get tasks from the queue.
+
+    fields: comma-separated JSON columns to include (payload, result); the
+    others are left out of the query. Defaults to all of them.
+    """
     conn = get_orchestrator_db()
     if not conn:
         return {"tasks": [], "stats": {}}
     
     try:
-        if status:
-            cursor = conn.execute(
-                "SELECT * FROM tasks WHERE status = ? ORDER BY priority DESC, created_at DESC LIMIT ?",
-                (status, limit)
-            )
+        json_fields = task_json_fields(fields)
+        if conn.is_postgres:
+            query = task_list_query(TASKS_PAGE_SQL, json_fields)
+            row = conn.execute_prepared(query, {"status": status, "limit": limit}).fetchone()
+            tasks, stats = row['tasks'], row['stats']
         else:
-            cursor = conn.execute(
-                "SELECT * FROM tasks ORDER BY priority DESC, created_at DESC LIMIT ?",
-                (limit,)
-            )
-        
-        tasks = []
-        for row in cursor.fetchall():
-            task = dict(row)
-            task['payload'] = parse_json_field(task['payload']) or {}
-            task['result'] = parse_json_field(task.get('result'))
-            tasks.append(task)
-        
-        # Get stats
-        cursor = conn.execute("""
-            SELECT status, COUNT(*) as count FROM tasks GROUP BY status
-        """)
-        stats = {row['status']: row['count'] for row in cursor.fetchall()}
-        
+            if status:
+                cursor = conn.execute(
+                    task_list_query(SQLITE_TASKS_BY_STATUS_SQL, json_fields),
+                    (status, limit)
+                )
+            else:
+                cursor = conn.execute(
+                    task_list_query(SQLITE_TASKS_SQL, json_fields),
+                    (limit,)
+                )
+            tasks = fetch_dicts(cursor)
+
+            cursor = conn.execute("""
+                SELECT status, COUNT(*) as count FROM tasks GROUP BY status
+            """)
+            stats = {row['status']: row['count'] for row in cursor.fetchall()}
+
+        if json_fields:
+            for task in tasks:
+                decode_task_json(task, json_fields)
+
         return {"tasks": tasks, "stats": stats}
     finally:
         conn.close()
 
 
+# Write statements shared by several endpoints; one constant text per statement
+# keeps them hitting the connection's statement cache
+TASK_INSERT_SQL = """
+    INSERT INTO tasks (id, task_type, priority, payload, status, created_by, created_at, assigned_to, repo_id, parent_task_id)
+    VALUES (?, ?, ?, ?, 'pending', ?, ?, ?, ?, ?)
+"""
+DISCUSSION_INSERT_SQL = "INSERT INTO discussions (id, author, topic, content, created_at) VALUES (?, ?, ?, ?, ?)"
+
+
 @app.post("/api/tasks")
 async def create_task(request: Request):
     """Create a new task."""
-    data = await request.json()
+    data = await read_json(request)
     conn = get_orchestrator_db()
     if not conn:
         return {"status": "error", "message": "Orchestrator database not available"}
 
     try:
-        import uuid
         task_id = str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
+        now = utc_now_iso()
 
         # Extract repo_id and assigned_to from the request
         repo_id = data.get('repo_id')
@@ -1022,14 +1975,11 @@ async def create_task(request: Request):
         if repo_id:
             payload['repo_id'] = repo_id
 
-        conn.execute("""
-            INSERT INTO tasks (id, task_type, priority, payload, status, created_by, created_at, assigned_to, repo_id, parent_task_id)
-            VALUES (?, ?, ?, ?, 'pending', ?, ?, ?, ?, ?)
-        """, (
+        conn.execute(TASK_INSERT_SQL, (
             task_id,
             data.get('type', 'build_product'),
             data.get('priority', 5),
-            json.dumps(payload),
+            _json_dumps_text(payload),
             data.get('created_by', 'dashboard'),
             now,
             assigned_to,
@@ -1043,6 +1993,14 @@ async def create_task(request: Request):
         conn.close()
 
 
+RESET_STALE_TASKS_SQL = """
+    UPDATE tasks
+    SET status = 'pending', claimed_at = NULL, assigned_to = NULL
+    WHERE status = 'claimed' AND claimed_at < ?
+    RETURNING id
+"""
+
+
 @app.post("/api/tasks/reset-stale")
 async def reset_stale_tasks(hours: int = 1):
     """Reset tasks that have been claimed for too long back to pending."""
@@ -1054,26 +2012,14 @@ async def reset_stale_tasks(hours: int = 1):
         # Find tasks claimed more than X hours ago
         cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
 
-        cursor = conn.execute("""
-            SELECT id, task_type, assigned_to, claimed_at
-            FROM tasks
-            WHERE status = 'claimed' AND claimed_at < ?
-        """, (cutoff,))
-        stale_tasks = cursor.fetchall()
+        # Reset them to pending in one statement (RETURNING needs SQLite 3.35+)
+        cursor = conn.execute(RESET_STALE_TASKS_SQL, (cutoff,))
+        task_ids = [row['id'] for row in cursor.fetchall()]
+        conn.commit()
 
-        if not stale_tasks:
+        if not task_ids:
             return {"status": "ok", "reset_count": 0, "message": "No stale tasks found"}
 
-        # Reset them to pending
-        task_ids = [t[0] if isinstance(t, tuple) else t['id'] for t in stale_tasks]
-        placeholders = ','.join(['?' for _ in task_ids])
-        conn.execute(f"""
-            UPDATE tasks
-            SET status = 'pending', claimed_at = NULL, assigned_to = NULL
-            WHERE id IN ({placeholders})
-        """, task_ids)
-        conn.commit()
-
         return {
             "status": "ok",
             "reset_count": len(task_ids),
@@ -1083,67 +2029,106 @@ async def reset_stale_tasks(hours: int = 1):
         conn.close()
 
 
+AGENT_TASKS_SQL = "SELECT {columns} FROM tasks WHERE {where} ORDER BY completed_at DESC, created_at DESC LIMIT ?"
+CLOSED_TASK_CONDITION = "status IN ('completed', 'cancelled', 'failed')"
+
+AGENT_TASK_SUMMARY_SQL = """
+    SELECT
+        COALESCE(assigned_to, 'unassigned') AS agent,
+        COUNT(*) AS total,
+        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) AS completed,
+        SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) AS pending,
+        SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) AS failed,
+        SUM(CASE WHEN status = 'claimed' THEN 1 ELSE 0 END) AS claimed,
+        SUM(CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END) AS in_progress,
+        SUM(CASE WHEN status = 'cancelled' THEN 1 ELSE 0 END) AS cancelled
+    FROM tasks
+    GROUP BY COALESCE(assigned_to, 'unassigned')
+"""
+
+
+def stream_task_lines(conn: DatabaseWrapper, cursor, json_fields: Tuple[str, ...]) -> Iterator[bytes]:
+    """Encode a task query's rows as NDJSON, one line per row.
+
+    conn is closed when the rows run out or encoding fails; the response's
+    background task closes it as well, for a stream that never starts.
+    """
+    try:
+        for task in iter_dicts(cursor):
+            decode_task_json(task, json_fields)
+            yield _json_dumps_bytes(task) + b"\n"
+    finally:
+        conn.close()
+
+
 @app.get("/api/agent-tasks")
-async def get_agent_tasks(agent: str = None, status: str = None, limit: int = 100):
-    """Get tasks grouped by agent with optional filtering."""
+async def get_agent_tasks(
+    agent: str = None,
+    status: str = None,
+    limit: int = 100,
+    fields: str = None,
+    stream: bool = False
+):
+    """Get tasks grouped by agent with optional filtering.
+
+    fields: comma-separated JSON columns to include, as for /api/tasks.
+    stream: return the matching tasks as NDJSON, one task per line, without
+    the per-agent grouping and summary. Rows are encoded one line at a time
+    as they are sent; on SQLite they are also fetched from the cursor as they
+    go, while PostgreSQL's client-side cursor holds the full result.
+    """
     conn = get_orchestrator_db()
     if not conn:
         return {"agents": {}, "summary": {}}
     
     try:
-        # Build query based on filters
-        query = "SELECT * FROM tasks WHERE 1=1"
+        conditions = []
         params = []
         
         if agent:
-            query += " AND assigned_to = ?"
+            conditions.append("assigned_to = ?")
             params.append(agent)
         
         if status:
             if status == "closed":
-                query += " AND status IN ('completed', 'cancelled', 'failed')"
+                conditions.append(CLOSED_TASK_CONDITION)
             elif status != "all":
-                query += " AND status = ?"
+                conditions.append("status = ?")
                 params.append(status)
         
-        query += " ORDER BY completed_at DESC, created_at DESC LIMIT ?"
         params.append(limit)
-        
-        cursor = conn.execute(query, params)
+        json_fields = task_json_fields(fields)
+        query = build_filtered_query(task_list_query(AGENT_TASKS_SQL, json_fields), tuple(conditions))
+        cursor = conn.execute_prepared(query, params)
+
+        if stream:
+            # The response owns the connection from here and closes it once sent
+            lines = stream_task_lines(conn, cursor, json_fields)
+            response = StreamingResponse(lines, media_type="application/x-ndjson",
+                                         background=BackgroundTask(conn.close))
+            conn = None
+            return response
         
         # Group tasks by agent
         agents = {}
-        for row in cursor.fetchall():
-            task = dict(row)
-            task['payload'] = parse_json_field(task['payload']) or {}
-            task['result'] = parse_json_field(task.get('result'))
+        for task in fetch_dicts(cursor):
+            decode_task_json(task, json_fields)
             
             agent_id = task.get('assigned_to') or 'unassigned'
             if agent_id not in agents:
                 agents[agent_id] = []
             agents[agent_id].append(task)
         
-        # Get summary stats per agent
-        cursor = conn.execute("""
-            SELECT 
-                COALESCE(assigned_to, 'unassigned') as agent,
-                status,
-                COUNT(*) as count
-            FROM tasks
-            GROUP BY assigned_to, status
-        """)
-        
+        # Per-agent status counts, pivoted in SQL
+        cursor = conn.execute_prepared(AGENT_TASK_SUMMARY_SQL)
         summary = {}
-        for row in cursor.fetchall():
-            agent_id = row['agent']
-            if agent_id not in summary:
-                summary[agent_id] = {'total': 0, 'completed': 0, 'pending': 0, 'failed': 0, 'claimed': 0}
-            summary[agent_id][row['status']] = row['count']
-            summary[agent_id]['total'] += row['count']
+        for counts in fetch_dicts(cursor):
+            summary[counts.pop('agent')] = counts
         
         return {"agents": agents, "summary": summary}
     finally:
-        conn.close()
+        if conn is not None:
+            conn.close()
 
 
 # React app routes - serve index.html for client-side routing
@@ -1154,17 +2139,59 @@ async def get_agent_tasks(agent: str = None, status: str = None, limit: int = 10
 @app.get("/learnings")
 @app.get("/settings")
 @app.get("/projects")
-async def react_routes():
+async def react_routes(request: Request):
     """Serve React app for all frontend routes."""
-    react_index = REACT_BUILD_PATH / "index.html"
-    if react_index.exists():
-        return FileResponse(react_index)
-    # Fallback to legacy HTML
-    return HTMLResponse(content=DASHBOARD_HTML)
+    return await serve_react_index(request)
 
 
 # ==================== Task Outcomes (Learning System) ====================
 
+# context_summary is free text the outcome list never shows; /api/outcomes/stats
+# returns it for recent failures
+OUTCOMES_SQL = """
+    SELECT id, task_id, repo_id, agent_id, task_type, outcome, duration_seconds,
+           error_summary, created_at
+    FROM task_outcomes
+    WHERE {where}
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+OUTCOMES_BY_AGENT_SQL = """
+    SELECT
+        agent_id,
+        COUNT(*) as total,
+        SUM(CASE WHEN outcome = 'success' THEN 1 ELSE 0 END) as success,
+        SUM(CASE WHEN outcome = 'failure' THEN 1 ELSE 0 END) as failure,
+        SUM(CASE WHEN outcome = 'partial' THEN 1 ELSE 0 END) as partial,
+        AVG(duration_seconds) as avg_duration
+    FROM task_outcomes
+    WHERE {where}
+    GROUP BY agent_id
+    ORDER BY total DESC
+"""
+
+OUTCOMES_BY_TASK_TYPE_SQL = """
+    SELECT
+        task_type,
+        COUNT(*) as total,
+        SUM(CASE WHEN outcome = 'success' THEN 1 ELSE 0 END) as success,
+        SUM(CASE WHEN outcome = 'failure' THEN 1 ELSE 0 END) as failure
+    FROM task_outcomes
+    WHERE {where}
+    GROUP BY task_type
+    ORDER BY total DESC
+"""
+
+RECENT_FAILURES_SQL = """
+    SELECT agent_id, task_type, error_summary, context_summary, created_at
+    FROM task_outcomes
+    WHERE {where} AND outcome = 'failure'
+    ORDER BY created_at DESC
+    LIMIT 10
+"""
+
+
 @app.get("/api/outcomes")
 async def get_outcomes(
     agent: str = None,
@@ -1179,28 +2206,26 @@ async def get_outcomes(
         return {"outcomes": [], "error": "No database connection"}
 
     try:
-        # Build query
-        query = "SELECT * FROM task_outcomes WHERE 1=1"
+        conditions = []
         params = []
 
         if agent:
-            query += " AND agent_id = ?"
+            conditions.append("agent_id = ?")
             params.append(agent)
         if task_type:
-            query += " AND task_type = ?"
+            conditions.append("task_type = ?")
             params.append(task_type)
         if repo_id:
-            query += " AND repo_id = ?"
+            conditions.append("repo_id = ?")
             params.append(repo_id)
         if outcome:
-            query += " AND outcome = ?"
+            conditions.append("outcome = ?")
             params.append(outcome)
 
-        query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
-
-        cursor = conn.execute(query, params)
-        outcomes = [dict(row) for row in cursor.fetchall()]
+        query = build_filtered_query(OUTCOMES_SQL, tuple(conditions))
+        cursor = conn.execute_prepared(query, params)
+        outcomes = fetch_dicts(cursor)
 
         return {"outcomes": outcomes}
     except Exception as e:
@@ -1217,55 +2242,22 @@ async def get_outcome_stats(repo_id: str = None, days: int = 30):
         return {"by_agent": [], "by_task_type": [], "recent_failures": [], "period_days": days}
 
     try:
-        from datetime import datetime, timedelta
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
 
-        where_clause = "created_at >= ?"
-        params = [cutoff]
-
-        if repo_id:
-            where_clause += " AND repo_id = ?"
-            params.append(repo_id)
+        conditions = ("created_at >= ?", "repo_id = ?") if repo_id else ("created_at >= ?",)
+        params = [cutoff, repo_id] if repo_id else [cutoff]
 
         # Stats by agent
-        cursor = conn.execute(f"""
-            SELECT
-                agent_id,
-                COUNT(*) as total,
-                SUM(CASE WHEN outcome = 'success' THEN 1 ELSE 0 END) as success,
-                SUM(CASE WHEN outcome = 'failure' THEN 1 ELSE 0 END) as failure,
-                SUM(CASE WHEN outcome = 'partial' THEN 1 ELSE 0 END) as partial,
-                AVG(duration_seconds) as avg_duration
-            FROM task_outcomes
-            WHERE {where_clause}
-            GROUP BY agent_id
-            ORDER BY total DESC
-        """, params)
-        by_agent = [dict(row) for row in cursor.fetchall()]
+        cursor = conn.execute_prepared(build_filtered_query(OUTCOMES_BY_AGENT_SQL, conditions), params)
+        by_agent = fetch_dicts(cursor)
 
         # Stats by task type
-        cursor = conn.execute(f"""
-            SELECT
-                task_type,
-                COUNT(*) as total,
-                SUM(CASE WHEN outcome = 'success' THEN 1 ELSE 0 END) as success,
-                SUM(CASE WHEN outcome = 'failure' THEN 1 ELSE 0 END) as failure
-            FROM task_outcomes
-            WHERE {where_clause}
-            GROUP BY task_type
-            ORDER BY total DESC
-        """, params)
-        by_task_type = [dict(row) for row in cursor.fetchall()]
+        cursor = conn.execute_prepared(build_filtered_query(OUTCOMES_BY_TASK_TYPE_SQL, conditions), params)
+        by_task_type = fetch_dicts(cursor)
 
         # Recent failures
-        cursor = conn.execute(f"""
-            SELECT agent_id, task_type, error_summary, context_summary, created_at
-            FROM task_outcomes
-            WHERE {where_clause} AND outcome = 'failure'
-            ORDER BY created_at DESC
-            LIMIT 10
-        """, params)
-        recent_failures = [dict(row) for row in cursor.fetchall()]
+        cursor = conn.execute_prepared(build_filtered_query(RECENT_FAILURES_SQL, conditions), params)
+        recent_failures = fetch_dicts(cursor)
 
         return {
             "by_agent": by_agent,
@@ -1281,6 +2273,16 @@ async def get_outcome_stats(repo_id: str = None, days: int = 30):
 
 # ==================== Reflections API ====================
 
+REFLECTIONS_SQL = """
+    SELECT id, agent_type, task_id, reflection_type,
+           content, confidence, tags, created_at
+    FROM reflections
+    WHERE {where}
+    ORDER BY created_at DESC
+    LIMIT %s
+"""
+
+
 @app.get("/api/reflections")
 async def get_reflections(
     agent_type: str = None,
@@ -1307,20 +2309,11 @@ async def get_reflections(
             conditions.append("repo_id = %s")
             params.append(repo_id)
 
-        where = " AND ".join(conditions) if conditions else "1=1"
-
-        cursor = conn.execute(f"""
-            SELECT id, agent_type, task_id, reflection_type,
-                   content, confidence, tags, created_at
-            FROM reflections
-            WHERE {where}
-            ORDER BY created_at DESC
-            LIMIT %s
-        """, params + [limit])
+        query = build_filtered_query(REFLECTIONS_SQL, tuple(conditions))
+        cursor = conn.execute_prepared(query, params + [limit])
 
         reflections = []
-        for row in cursor.fetchall():
-            row_dict = dict(row)
+        for row_dict in fetch_dicts(cursor):
             reflections.append({
                 'id': str(row_dict['id']),
                 'agent_id': row_dict['agent_type'],
@@ -1329,7 +2322,7 @@ async def get_reflections(
                 'summary': row_dict['content'],
                 'confidence': row_dict['confidence'],
                 'tags': row_dict.get('tags') or [],
-                'created_at': row_dict['created_at'].isoformat() if hasattr(row_dict['created_at'], 'isoformat') else str(row_dict['created_at'])
+                'created_at': row_dict['created_at']
             })
 
         return {'reflections': reflections}
@@ -1339,6 +2332,19 @@ async def get_reflections(
         conn.close()
 
 
+REFLECTION_STATS_SQL = """
+    SELECT
+        GROUPING(agent_type) AS is_type_row,
+        agent_type,
+        reflection_type,
+        COUNT(*) AS count,
+        COALESCE(AVG(confidence), 0)::float8 AS avg_confidence
+    FROM reflections
+    WHERE created_at > %s
+    GROUP BY GROUPING SETS ((agent_type), (reflection_type))
+"""
+
+
 @app.get("/api/reflections/stats")
 async def get_reflection_stats(days: int = 30):
     """Get reflection statistics."""
@@ -1349,31 +2355,15 @@ async def get_reflection_stats(days: int = 30):
     try:
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
 
-        # Count by agent
-        cursor = conn.execute("""
-            SELECT agent_type, COUNT(*), AVG(confidence)
-            FROM reflections
-            WHERE created_at > %s
-            GROUP BY agent_type
-        """, [cutoff])
-
-        by_agent = [
-            {'agent_id': r[0], 'count': r[1], 'avg_confidence': float(r[2] or 0)}
-            for r in cursor.fetchall()
-        ]
-
-        # Count by type
-        cursor = conn.execute("""
-            SELECT reflection_type, COUNT(*)
-            FROM reflections
-            WHERE created_at > %s
-            GROUP BY reflection_type
-        """, [cutoff])
-
-        by_type = [
-            {'type': r[0], 'count': r[1]}
-            for r in cursor.fetchall()
-        ]
+        # Both breakdowns from one scan; GROUPING() tells the two sets apart
+        cursor = conn.execute_prepared(REFLECTION_STATS_SQL, [cutoff])
+        by_agent = []
+        by_type = []
+        for r in fetch_dicts(cursor):
+            if r['is_type_row']:
+                by_type.append({'type': r['reflection_type'], 'count': r['count']})
+            else:
+                by_agent.append({'agent_id': r['agent_type'], 'count': r['count'], 'avg_confidence': r['avg_confidence']})
 
         return {'by_agent': by_agent, 'by_type': by_type, 'period_days': days}
     except Exception as e:
@@ -1385,7 +2375,7 @@ async def get_reflection_stats(days: int = 30):
 @app.post("/api/reflections")
 async def create_reflection(request: Request):
     """Record a new reflection (called by agents)."""
-    data = await request.json()
+    data = await read_json(request)
     conn = get_orchestrator_db()
     if not conn:
         return {'error': 'Database unavailable'}
@@ -1406,10 +2396,10 @@ async def create_reflection(request: Request):
         ))
 
         result = cursor.fetchone()
-        reflection_id = str(result[0]) if result else None
-        conn.commit()
+        reflection_id = str(result['id']) if result else None
 
-        # Auto-extract learning if high confidence
+        # Auto-extract learning if high confidence; committed together with
+        # the reflection so a request costs one commit (and one WAL flush)
         if data.get('confidence', 0) >= 0.7 and data.get('learning_content'):
             conn.execute("""
                 INSERT INTO learnings
@@ -1421,8 +2411,8 @@ async def create_reflection(request: Request):
                 data['learning_content'],
                 data.get('confidence', 0.5)
             ))
-            conn.commit()
 
+        conn.commit()
         return {'id': reflection_id, 'status': 'created'}
     except Exception as e:
         return {'error': str(e)}
@@ -1432,6 +2422,16 @@ async def create_reflection(request: Request):
 
 # ==================== Learnings API ====================
 
+LEARNINGS_SQL = """
+    SELECT id, agent_type, category, insight,
+           confidence, usage_count, created_at
+    FROM learnings
+    WHERE {where}
+    ORDER BY usage_count DESC, created_at DESC
+    LIMIT %s
+"""
+
+
 @app.get("/api/learnings")
 async def get_learnings(
     agent_type: str = None,
@@ -1457,20 +2457,11 @@ async def get_learnings(
         if validated_only:
             conditions.append("usage_count > 0")
 
-        where = " AND ".join(conditions)
-
-        cursor = conn.execute(f"""
-            SELECT id, agent_type, category, insight,
-                   confidence, usage_count, created_at
-            FROM learnings
-            WHERE {where}
-            ORDER BY usage_count DESC, created_at DESC
-            LIMIT %s
-        """, params + [limit])
+        query = build_filtered_query(LEARNINGS_SQL, tuple(conditions))
+        cursor = conn.execute_prepared(query, params + [limit])
 
         learnings = []
-        for row in cursor.fetchall():
-            row_dict = dict(row)
+        for row_dict in fetch_dicts(cursor):
             learnings.append({
                 'id': str(row_dict['id']),
                 'agent_id': row_dict['agent_type'],
@@ -1478,7 +2469,7 @@ async def get_learnings(
                 'content': row_dict['insight'],
                 'confidence': row_dict['confidence'],
                 'validation_count': row_dict['usage_count'],
-                'created_at': row_dict['created_at'].isoformat() if hasattr(row_dict['created_at'], 'isoformat') else str(row_dict['created_at'])
+                'created_at': row_dict['created_at']
             })
 
         return {'learnings': learnings}
@@ -1488,6 +2479,30 @@ async def get_learnings(
         conn.close()
 
 
+RATE_LIMIT_FILE = Path('/auto-dev/data/.rate_limited')
+# (mtime_ns, parsed contents, reset time) of the last rate-limit file read
+_rate_limit_cache: Tuple[int, Optional[Dict[str, Any]], Optional[datetime]] = (-1, None, None)
+
+
+def read_rate_limit() -> Tuple[Optional[Dict[str, Any]], Optional[datetime]]:
+    """Global rate-limit file and its reset time; re-parsed only when the file changes."""
+    global _rate_limit_cache
+    try:
+        mtime = RATE_LIMIT_FILE.stat().st_mtime_ns
+    except OSError:
+        return None, None
+
+    if _rate_limit_cache[0] != mtime:
+        try:
+            data = _json_loads(RATE_LIMIT_FILE.read_bytes())
+            reset_time = data.get('reset_time')
+            reset_dt = datetime.fromisoformat(reset_time) if reset_time else None
+        except Exception:
+            data, reset_dt = None, None
+        _rate_limit_cache = (mtime, data, reset_dt)
+    return _rate_limit_cache[1], _rate_limit_cache[2]
+
+
 @app.get("/api/agent-statuses")
 async def get_agent_statuses():
     """Get status of all agents (Redis + database)."""
@@ -1509,8 +2524,9 @@ async def get_agent_statuses():
     # Get enabled state from Redis
     if r:
         try:
-            for agent_type in AGENT_TYPES:
-                enabled = r.get(f"agent:{agent_type}:enabled")
+            # One MGET round trip instead of a GET per agent
+            enabled_flags = r.mget([f"agent:{agent_type}:enabled" for agent_type in AGENT_TYPES])
+            for agent_type, enabled in zip(AGENT_TYPES, enabled_flags):
                 # If key doesn't exist, default to enabled (None means enabled)
                 statuses[agent_type]["enabled"] = enabled is None or enabled == b"1"
         except Exception as e:
@@ -1541,24 +2557,20 @@ async def get_agent_statuses():
 
     # Check for global rate limit
     rate_limit_info = None
-    rate_limit_file = Path('/auto-dev/data/.rate_limited')
-    if rate_limit_file.exists():
+    data, reset_dt = read_rate_limit()
+    if reset_dt:
+        now = datetime.utcnow()
         try:
-            import json
-            data = json.loads(rate_limit_file.read_text())
-            reset_time = data.get('reset_time')
-            if reset_time:
-                from datetime import datetime
-                reset_dt = datetime.fromisoformat(reset_time)
-                if datetime.utcnow() < reset_dt:
-                    rate_limit_info = {
-                        'limited': True,
-                        'provider': data.get('provider', 'unknown'),
-                        'reset_time': reset_time,
-                        'set_by': data.get('agent_id'),
-                        'remaining_seconds': int((reset_dt - datetime.utcnow()).total_seconds())
-                    }
-        except Exception:
+            if now < reset_dt:
+                rate_limit_info = {
+                    'limited': True,
+                    'provider': data.get('provider', 'unknown'),
+                    'reset_time': data['reset_time'],
+                    'set_by': data.get('agent_id'),
+                    'remaining_seconds': int((reset_dt - now).total_seconds())
+                }
+        except TypeError:
+            # Offset-aware reset_time can't be compared with naive UTC
             pass
 
     return {"agents": statuses, "rate_limit": rate_limit_info}
@@ -1566,25 +2578,52 @@ async def get_agent_statuses():
 
 
 
+WATCHER_STATUS_DIR = Path("/auto-dev/data")
+# watcher_status_<agent>.json -> (mtime_ns, provider of its current session)
+_active_provider_cache: Dict[str, Tuple[int, Optional[str]]] = {}
+
+
+def _active_provider(entry: os.DirEntry) -> Optional[str]:
+    """Provider an agent is running on; its status file is re-read only when it changes."""
+    try:
+        mtime = entry.stat().st_mtime_ns
+    except OSError:
+        return None
+    cached = _active_provider_cache.get(entry.name)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        status_data = _json_loads(Path(entry.path).read_bytes())
+        provider = status_data.get("current_session", {}).get("provider")
+    except Exception:
+        provider = None
+    _active_provider_cache[entry.name] = (mtime, provider)
+    return provider
+
+
 @app.get("/api/agent-providers")
 async def get_agent_providers():
     """Get configured provider overrides and active provider for agents."""
-    config_data = load_config()
+    config_data = load_config(readonly=True)
     agents_config = config_data.get("agents", {})
     llm_config = config_data.get("llm", {})
     default_provider = llm_config.get("default_provider", "claude")
 
+    # One directory listing instead of an exists() check per agent
+    try:
+        status_files = {
+            entry.name: entry for entry in os.scandir(WATCHER_STATUS_DIR)
+            if entry.name.startswith("watcher_status_")
+        }
+    except FileNotFoundError:
+        status_files = {}
+
     providers = []
     for agent_id, agent_cfg in agents_config.items():
         override = agent_cfg.get("provider")
-        status_path = Path(f"/auto-dev/data/watcher_status_{agent_id}.json")
-        active_provider = None
-        if status_path.exists():
-            try:
-                status_data = json.loads(status_path.read_text())
-                active_provider = status_data.get("current_session", {}).get("provider")
-            except Exception:
-                active_provider = None
+        status_entry = status_files.get(f"watcher_status_{agent_id}.json")
+        active_provider = _active_provider(status_entry) if status_entry else None
 
         providers.append({
             "agent_id": agent_id,
@@ -1596,28 +2635,28 @@ async def get_agent_providers():
     return {"providers": providers, "default_provider": default_provider}
 
 
-@app.get("/api/agent-config")
-async def get_agent_config():
-    """Get agent definitions from settings.yaml for dynamic UI rendering."""
-    config_data = load_config()
-    agents_config = config_data.get("agents", {})
-
-    # Map agent types to icons
-    AGENT_ICONS = {
-        "pm": "📋",
-        "architect": "📐",
-        "builder": "🔨",
-        "reviewer": "🔍",
-        "tester": "🧪",
-        "security": "🛡️",
-        "devops": "⚙️",
-        "bug_finder": "🐛",
-        # Legacy agent icons for backwards compatibility
-        "hunter": "🔍",
-        "critic": "🧐",
-        "publisher": "🚀",
-        "meta": "🧠",
-    }
+# Map agent types to icons
+AGENT_ICONS = {
+    "pm": "📋",
+    "architect": "📐",
+    "builder": "🔨",
+    "reviewer": "🔍",
+    "tester": "🧪",
+    "security": "🛡️",
+    "devops": "⚙️",
+    "bug_finder": "🐛",
+    # Legacy agent icons for backwards compatibility
+    "hunter": "🔍",
+    "critic": "🧐",
+    "publisher": "🚀",
+    "meta": "🧠",
+}
+
+
+@lru_cache(maxsize=1)
+def _agent_config_body(settings_mtime: Optional[int]) -> bytes:
+    """Encoded /api/agent-config body; rebuilt only when settings.yaml changes."""
+    agents_config = load_config(readonly=True).get("agents", {})
 
     agents = []
     for agent_id, agent_cfg in agents_config.items():
@@ -1631,18 +2670,24 @@ async def get_agent_config():
             "provider": agent_cfg.get("provider"),
         })
 
-    return {"agents": agents}
+    return _json_dumps_bytes({"agents": agents})
+
+
+@app.get("/api/agent-config")
+async def get_agent_config():
+    """Get agent definitions from settings.yaml for dynamic UI rendering."""
+    return Response(content=_agent_config_body(config_mtime()), media_type="application/json")
 
 
 @app.post("/api/agent/provider/{agent_type}")
 async def set_agent_provider(agent_type: str, request: Request):
     """Set provider override for an agent and restart it."""
-    payload = await request.json()
+    payload = await read_json(request)
     provider = str(payload.get("provider", "")).strip().lower()
 
     allowed = {"default", "auto", "claude", "codex"}
     if provider not in allowed:
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": f"Invalid provider '{provider}'"},
             status_code=400
         )
@@ -1650,7 +2695,7 @@ async def set_agent_provider(agent_type: str, request: Request):
     config_data = load_config()
     agents_config = config_data.get("agents", {})
     if agent_type not in agents_config:
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": f"Unknown agent '{agent_type}'"},
             status_code=404
         )
@@ -1708,8 +2753,7 @@ async def get_messages(agent_id: str = None, limit: int = 50):
             )
         
         messages = []
-        for row in cursor.fetchall():
-            msg = dict(row)
+        for msg in fetch_dicts(cursor):
             msg['payload'] = parse_json_field(msg['payload']) or {}
             messages.append(msg)
         
@@ -1737,9 +2781,7 @@ async def get_discussions(topic: str = None, limit: int = 100):
                 (limit,)
             )
         
-        discussions = []
-        for row in cursor.fetchall():
-            discussions.append(dict(row))
+        discussions = fetch_dicts(cursor)
         
         return {"discussions": discussions}
     except Exception as e:
@@ -1767,12 +2809,11 @@ async def get_proposals(status: str = None):
             )
         
         proposals = []
-        for row in cursor.fetchall():
-            p = dict(row)
+        for p in fetch_dicts(cursor):
             p['payload'] = parse_json_field(p['payload']) or {}
-            p['votes_for'] = json.loads(p['votes_for']) if p['votes_for'] else []
-            p['votes_against'] = json.loads(p['votes_against']) if p['votes_against'] else []
-            p['comments'] = json.loads(p['comments']) if p['comments'] else []
+            p['votes_for'] = _json_loads(p['votes_for']) if p['votes_for'] else []
+            p['votes_against'] = _json_loads(p['votes_against']) if p['votes_against'] else []
+            p['comments'] = _json_loads(p['comments']) if p['comments'] else []
             proposals.append(p)
         
         return {"proposals": proposals}
@@ -1790,37 +2831,16 @@ async def get_approvals(status: str = None, repo_id: str = None):
     try:
         orchestrator = get_orchestrator()
 
-        # List approvals - if no status specified, get all
-        if status:
-            approvals = orchestrator.list_approvals(repo_id=repo_id, status=status, limit=50)
-        else:
-            # Get both pending and recent reviewed
-            pending = orchestrator.list_approvals(repo_id=repo_id, status='pending', limit=50)
-            approved = orchestrator.list_approvals(repo_id=repo_id, status='approved', limit=20)
-            rejected = orchestrator.list_approvals(repo_id=repo_id, status='rejected', limit=10)
-            approvals = pending + approved + rejected
-
-        # Convert DevApproval objects to dicts
-        approval_dicts = []
-        for a in approvals:
-            approval_dicts.append({
-                'id': a.id,
-                'repo_id': a.repo_id,
-                'approval_type': a.approval_type,
-                'title': a.title,
-                'description': a.description,
-                'context': a.context,
-                'submitted_by': a.submitted_by,
-                'status': a.status,
-                'reviewer_notes': a.reviewer_notes,
-                'gitlab_ref': a.gitlab_ref,
-                'created_at': a.created_at,
-                'reviewed_at': a.reviewed_at
-            })
+        # One query returns the newest items per status plus per-status totals;
+        # with no status filter, show pending items and recently reviewed ones
+        limits = {status: 50} if status else {'pending': 50, 'approved': 20, 'rejected': 10}
+        approvals, totals = orchestrator.list_approvals_by_status(limits, repo_id=repo_id)
+        approval_dicts = [a.to_dict() for a in approvals]
 
-        # Get pending count
-        pending_approvals = orchestrator.list_approvals(repo_id=repo_id, status='pending', limit=1000)
-        pending_count = len(pending_approvals)
+        if 'pending' in totals:
+            pending_count = totals['pending']
+        else:
+            pending_count = orchestrator.count_approvals(repo_id=repo_id, status='pending')
 
         return {"approvals": approval_dicts, "pending_count": pending_count}
     except Exception as e:
@@ -1832,7 +2852,7 @@ async def get_approvals(status: str = None, repo_id: str = None):
 async def approve_item(item_id: str, request: Request):
     """Approve a dev workflow item (spec, merge, deploy) using orchestrator_pg."""
     try:
-        body = await request.json()
+        body = await read_json(request)
         notes = body.get('notes', '')
     except (json.JSONDecodeError, ValueError, AttributeError):
         notes = ''
@@ -1841,44 +2861,46 @@ async def approve_item(item_id: str, request: Request):
         orchestrator = get_orchestrator()
 
         # The orchestrator.approve() handles post-approval actions (creating follow-up tasks)
-        success = orchestrator.approve(item_id, reviewer_notes=notes)
+        success = await run_in_threadpool(orchestrator.approve, item_id, reviewer_notes=notes)
 
         if success:
             return {"success": True, "message": f"Approved: {item_id}"}
         else:
-            return JSONResponse({"error": "Item not found or already reviewed"}, status_code=404)
+            return ORJSONResponse({"error": "Item not found or already reviewed"}, status_code=404)
     except Exception as e:
         logger.error(f"Error approving {item_id}: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 
 @app.post("/api/chat")
 async def send_chat(request: Request):
     """Send a message to the swarm. Liaison agent will respond."""
     try:
-        body = await request.json()
+        body = await read_json(request)
         message = body.get('message', '')
     except (json.JSONDecodeError, ValueError) as e:
         logger.warning(f"Invalid chat request: {e}")
-        return JSONResponse({"error": "Invalid request"}, status_code=400)
+        return ORJSONResponse({"error": "Invalid request"}, status_code=400)
 
     if not message:
-        return JSONResponse({"error": "Message required"}, status_code=400)
+        return ORJSONResponse({"error": "Message required"}, status_code=400)
+
+    return await run_in_threadpool(post_chat_message, message)
 
+
+def post_chat_message(message: str):
+    """Post a human chat message and queue a reply task for the liaison agent."""
     conn = get_orchestrator_db()
     if not conn:
-        return JSONResponse({"error": "Database unavailable"}, status_code=500)
+        return ORJSONResponse({"error": "Database unavailable"}, status_code=500)
 
     try:
-        import uuid
-        now = datetime.utcnow().isoformat()
+        now = utc_now_iso()
         post_id = str(uuid.uuid4())
+        conn.begin_write()
 
         # Post human message to chat topic
-        conn.execute("""
-            INSERT INTO discussions (id, author, topic, content, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (post_id, 'human', 'human_chat', message, now))
+        conn.execute(DISCUSSION_INSERT_SQL, (post_id, 'human', 'human_chat', message, now))
         
         # Create high-priority task for Liaison agent
         task_id = str(uuid.uuid4())
@@ -1887,94 +2909,102 @@ async def send_chat(request: Request):
             VALUES (?, ?, ?, ?, 'pending', ?, ?, ?)
         """, (
             task_id, 'respond_to_human', 10,
-            json.dumps({"message": message, "post_id": post_id}),
+            _json_dumps_text({"message": message, "post_id": post_id}),
             'liaison', 'human', now
         ))
         
         conn.commit()
         return {"success": True, "post_id": post_id}
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
     finally:
         conn.close()
 
 
+# The newest chat messages, returned oldest first; served from
+# idx_discussions_topic_created
+CHAT_MESSAGES_SQL = """
+    SELECT id, author, content, created_at FROM (
+        SELECT id, author, content, created_at
+        FROM discussions
+        WHERE topic = ?
+        ORDER BY created_at DESC
+        LIMIT ?
+    ) AS recent
+    ORDER BY created_at ASC
+"""
+CHAT_HISTORY_LIMIT = 50
+
+
 @app.get("/api/chat")
-async def get_chat():
+def get_chat():
     """Get chat messages between human and liaison."""
     conn = get_orchestrator_db()
     if not conn:
         return {"messages": []}
     
     try:
-        cursor = conn.execute("""
-            SELECT * FROM discussions 
-            WHERE topic = 'human_chat'
-            ORDER BY created_at DESC
-            LIMIT 50
-        """)
-        
-        messages = []
-        for row in cursor.fetchall():
-            messages.append({
-                "id": row['id'],
-                "author": row['author'],
-                "content": row['content'],
-                "created_at": row['created_at']
-            })
-        
-        return {"messages": list(reversed(messages))}
+        cursor = conn.execute_prepared(CHAT_MESSAGES_SQL, ('human_chat', CHAT_HISTORY_LIMIT))
+        return {"messages": fetch_dicts(cursor)}
     except Exception as e:
         return {"messages": [], "error": str(e)}
     finally:
         conn.close()
 
 
+DIRECTIVE_PREFIX = "🎯 HUMAN DIRECTIVE (Priority "
+# Task priorities run from 1 to 10 (the tasks table's CHECK constraint)
+DIRECTIVE_PRIORITY_RANGE = range(1, 11)
+
+
 @app.post("/api/directive")
 async def send_directive(request: Request):
     """Send a directive to all agents via the discussion board."""
     try:
-        body = await request.json()
+        body = await read_json(request)
         message = body.get('message', '')
         priority = body.get('priority', 10)
     except (json.JSONDecodeError, ValueError) as e:
         logger.warning(f"Invalid directive request: {e}")
-        return JSONResponse({"error": "Invalid request"}, status_code=400)
+        return ORJSONResponse({"error": "Invalid request"}, status_code=400)
 
     if not message:
-        return JSONResponse({"error": "Message required"}, status_code=400)
+        return ORJSONResponse({"error": "Message required"}, status_code=400)
+    # JSON true/false would pass as int and 2.5 would be truncated, so only plain ints
+    if type(priority) is not int or priority not in DIRECTIVE_PRIORITY_RANGE:
+        return ORJSONResponse(
+            {"error": f"Priority must be an integer from {DIRECTIVE_PRIORITY_RANGE.start} to {DIRECTIVE_PRIORITY_RANGE.stop - 1}"},
+            status_code=400,
+        )
     
+    return await run_in_threadpool(post_directive, message, priority)
+
+
+def post_directive(message: str, priority: int):
+    """Record a directive on the discussion board and queue it for every agent."""
     conn = get_orchestrator_db()
     if not conn:
-        return JSONResponse({"error": "Database unavailable"}, status_code=500)
+        return ORJSONResponse({"error": "Database unavailable"}, status_code=500)
     
     try:
-        import uuid
-        now = datetime.utcnow().isoformat()
+        now = utc_now_iso()
         post_id = str(uuid.uuid4())
+        conn.begin_write()
         
         # Post directive to discussion board
-        conn.execute("""
-            INSERT INTO discussions (id, author, topic, content, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (post_id, 'human', 'directive', f"🎯 HUMAN DIRECTIVE (Priority {priority}): {message}", now))
+        conn.execute(DISCUSSION_INSERT_SQL, (post_id, 'human', 'directive', f"{DIRECTIVE_PREFIX}{priority}): {message}", now))
         
         # Create high-priority tasks for all agents
-        for agent in AGENT_TYPES:
-            task_id = str(uuid.uuid4())
-            conn.execute("""
-                INSERT INTO tasks (id, task_type, priority, payload, status, assigned_to, created_by, created_at)
-                VALUES (?, ?, ?, ?, 'pending', ?, ?, ?)
-            """, (
-                task_id, 'directive', priority,
-                json.dumps({"instruction": message, "from": "human", "urgent": True}),
-                agent, 'human', now
-            ))
+        payload = _json_dumps_text({"instruction": message, "from": "human", "urgent": True})
+        conn.executemany(TASK_INSERT_SQL, [
+            (task_id, 'directive', priority, payload, 'human', now, agent, None, None)
+            for task_id, agent in zip(uuid4_batch(len(AGENT_TYPES)), AGENT_TYPES)
+        ])
         
         conn.commit()
         return {"success": True, "message": "Directive sent to all agents"}
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
     finally:
         conn.close()
 
@@ -1983,7 +3013,7 @@ async def send_directive(request: Request):
 async def reject_item(item_id: str, request: Request):
     """Reject a dev workflow item using orchestrator_pg."""
     try:
-        body = await request.json()
+        body = await read_json(request)
         reason = body.get('reason', 'No reason provided')
     except (json.JSONDecodeError, ValueError, AttributeError):
         reason = 'No reason provided'
@@ -1991,29 +3021,59 @@ async def reject_item(item_id: str, request: Request):
     try:
         orchestrator = get_orchestrator()
 
-        success = orchestrator.reject(item_id, reviewer_notes=reason)
+        success = await run_in_threadpool(orchestrator.reject, item_id, reviewer_notes=reason)
 
         if success:
             return {"success": True, "message": f"Rejected: {item_id}"}
         else:
-            return JSONResponse({"error": "Item not found or already reviewed"}, status_code=404)
+            return ORJSONResponse({"error": "Item not found or already reviewed"}, status_code=404)
     except Exception as e:
         logger.error(f"Error rejecting {item_id}: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
+
+
+_stats_broadcast_task: Optional[asyncio.Task] = None
+# Most recent encoded stats frame and when it was computed (time.monotonic()),
+# handed to clients as soon as they connect while it is still current
+_latest_stats_frame: Optional[Tuple[float, str]] = None
+
+
+async def stats_broadcaster():
+    """Background task: compute stats once per interval and push them to every client."""
+    global _latest_stats_frame
+    while True:
+        await asyncio.sleep(STATS_BROADCAST_INTERVAL)
+        if not manager.active_connections:
+            continue
+        try:
+            stats = await collect_stats()
+            frame = _json_dumps_text({"type": "stats", "data": stats})
+            _latest_stats_frame = (time.monotonic(), frame)
+            await manager.broadcast_frame(frame)
+        except Exception as e:
+            logger.error(f"Stats broadcast failed: {e}")
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates."""
-    await manager.connect(websocket)
+    outbox = await manager.connect(websocket)
+    # Not refreshed while nobody is connected, so an old frame is left out;
+    # the next broadcast follows within STATS_BROADCAST_INTERVAL
+    if _latest_stats_frame is not None:
+        computed_at, frame = _latest_stats_frame
+        if time.monotonic() - computed_at <= STATS_BROADCAST_INTERVAL:
+            outbox.put_nowait(frame)
+    sender = asyncio.create_task(relay(websocket, outbox))
     try:
+        # Updates are pushed by stats_broadcaster; just wait for the client to leave
         while True:
-            # Send periodic updates
-            await asyncio.sleep(5)
-            stats = await api_stats()
-            await websocket.send_json({"type": "stats", "data": stats})
+            await websocket.receive_text()
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
+        sender.cancel()
 
 
 # ============================================================================
@@ -2088,7 +3148,7 @@ async def get_project(project_id: str):
     """Get a single project proposal by ID."""
     conn = get_orchestrator_db()
     if not conn:
-        return JSONResponse({"error": "Database unavailable"}, status_code=500)
+        return ORJSONResponse({"error": "Database unavailable"}, status_code=500)
     
     try:
         cursor = conn.execute(
@@ -2098,13 +3158,13 @@ async def get_project(project_id: str):
         row = cursor.fetchone()
         
         if not row:
-            return JSONResponse({"error": "Project not found"}, status_code=404)
+            return ORJSONResponse({"error": "Project not found"}, status_code=404)
         
         project = dict(row)
         project['combined_rating'] = (project['hunter_rating'] + project['critic_rating']) / 2
         return {"project": project}
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
     finally:
         conn.close()
 
@@ -2113,17 +3173,17 @@ async def get_project(project_id: str):
 async def approve_project(project_id: str, request: Request):
     """Approve a project for building - creates build_product task."""
     try:
-        body = await request.json()
+        body = await read_json(request)
         notes = body.get('notes', '')
     except (json.JSONDecodeError, ValueError, AttributeError):
         notes = ''
 
     conn = get_orchestrator_db()
     if not conn:
-        return JSONResponse({"error": "Database unavailable"}, status_code=500)
+        return ORJSONResponse({"error": "Database unavailable"}, status_code=500)
     
     try:
-        now = datetime.utcnow().isoformat()
+        now = utc_now_iso()
         cursor = conn.execute("""
             UPDATE project_proposals 
             SET status = 'approved', reviewer_notes = ?, reviewed_at = ?
@@ -2135,7 +3195,6 @@ async def approve_project(project_id: str, request: Request):
             # Get project details
             row = conn.execute("SELECT * FROM project_proposals WHERE id = ?", (project_id,)).fetchone()
             if row:
-                import uuid
                 # Create build_product task for Builder
                 task_id = str(uuid.uuid4())
                 conn.execute("""
@@ -2143,7 +3202,7 @@ async def approve_project(project_id: str, request: Request):
                     VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (
                     task_id, 'build_product', 8,
-                    json.dumps({
+                    _json_dumps_text({
                         "project_id": project_id,
                         "title": row['title'],
                         "spec_path": row['spec_path'],
@@ -2155,10 +3214,7 @@ async def approve_project(project_id: str, request: Request):
                 ))
                 
                 # Post to discussion
-                conn.execute("""
-                    INSERT INTO discussions (id, author, topic, content, created_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+                conn.execute(DISCUSSION_INSERT_SQL, (
                     str(uuid.uuid4()), 'human', 'projects',
                     f"✅ PROJECT APPROVED: {row['title']} - Builder will start working on this!",
                     now
@@ -2167,9 +3223,9 @@ async def approve_project(project_id: str, request: Request):
             
             return {"success": True, "message": f"Approved: {row['title'] if row else project_id}"}
         else:
-            return JSONResponse({"error": "Project not found or not pending"}, status_code=404)
+            return ORJSONResponse({"error": "Project not found or not pending"}, status_code=404)
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
     finally:
         conn.close()
 
@@ -2178,17 +3234,17 @@ async def approve_project(project_id: str, request: Request):
 async def reject_project(project_id: str, request: Request):
     """Reject a project - will NOT be built."""
     try:
-        body = await request.json()
+        body = await read_json(request)
         reason = body.get('reason', 'No reason provided')
     except (json.JSONDecodeError, ValueError, AttributeError):
         reason = 'No reason provided'
 
     conn = get_orchestrator_db()
     if not conn:
-        return JSONResponse({"error": "Database unavailable"}, status_code=500)
+        return ORJSONResponse({"error": "Database unavailable"}, status_code=500)
     
     try:
-        now = datetime.utcnow().isoformat()
+        now = utc_now_iso()
         cursor = conn.execute("""
             UPDATE project_proposals 
             SET status = 'rejected', reviewer_notes = ?, reviewed_at = ?
@@ -2199,11 +3255,7 @@ async def reject_project(project_id: str, request: Request):
         if cursor.rowcount > 0:
             row = conn.execute("SELECT * FROM project_proposals WHERE id = ?", (project_id,)).fetchone()
             if row:
-                import uuid
-                conn.execute("""
-                    INSERT INTO discussions (id, author, topic, content, created_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+                conn.execute(DISCUSSION_INSERT_SQL, (
                     str(uuid.uuid4()), 'human', 'projects',
                     f"❌ PROJECT REJECTED: {row['title']} - Reason: {reason}",
                     now
@@ -2212,9 +3264,9 @@ async def reject_project(project_id: str, request: Request):
             
             return {"success": True, "message": f"Rejected: {row['title'] if row else project_id}"}
         else:
-            return JSONResponse({"error": "Project not found or already reviewed"}, status_code=404)
+            return ORJSONResponse({"error": "Project not found or already reviewed"}, status_code=404)
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
     finally:
         conn.close()
 
@@ -2223,17 +3275,17 @@ async def reject_project(project_id: str, request: Request):
 async def defer_project(project_id: str, request: Request):
     """Defer a project to backlog for later review."""
     try:
-        body = await request.json()
+        body = await read_json(request)
         notes = body.get('notes', 'Deferred for later review')
     except (json.JSONDecodeError, ValueError, AttributeError):
         notes = 'Deferred for later review'
 
     conn = get_orchestrator_db()
     if not conn:
-        return JSONResponse({"error": "Database unavailable"}, status_code=500)
+        return ORJSONResponse({"error": "Database unavailable"}, status_code=500)
     
     try:
-        now = datetime.utcnow().isoformat()
+        now = utc_now_iso()
         cursor = conn.execute("""
             UPDATE project_proposals 
             SET status = 'deferred', reviewer_notes = ?, reviewed_at = ?
@@ -2244,11 +3296,7 @@ async def defer_project(project_id: str, request: Request):
         if cursor.rowcount > 0:
             row = conn.execute("SELECT * FROM project_proposals WHERE id = ?", (project_id,)).fetchone()
             if row:
-                import uuid
-                conn.execute("""
-                    INSERT INTO discussions (id, author, topic, content, created_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+                conn.execute(DISCUSSION_INSERT_SQL, (
                     str(uuid.uuid4()), 'human', 'projects',
                     f"⏸️ PROJECT DEFERRED: {row['title']} - Moved to backlog for later",
                     now
@@ -2257,9 +3305,9 @@ async def defer_project(project_id: str, request: Request):
             
             return {"success": True, "message": f"Deferred: {row['title'] if row else project_id}"}
         else:
-            return JSONResponse({"error": "Project not found or not pending"}, status_code=404)
+            return ORJSONResponse({"error": "Project not found or not pending"}, status_code=404)
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
     finally:
         conn.close()
 
@@ -5941,13 +6989,17 @@ DASHBOARD_HTML = """
             
             ws.onmessage = (event) => {
                 const data = JSON.parse(event.data);
-                if (data.type === 'stats') {
-                    // Update with real-time data
-                    const stats = data.data;
-                    document.getElementById('totalIncome').textContent = 
-                        formatCurrency(stats.income?.total_30d || 0);
-                    document.getElementById('totalTokens').textContent = 
-                        formatNumber(stats.tokens?.total_7d || 0);
+                // Updates queued while the socket was busy arrive as one batch frame
+                const updates = data.type === 'batch' ? data.items : [data];
+                for (const update of updates) {
+                    if (update.type === 'stats') {
+                        // Update with real-time data
+                        const stats = update.data;
+                        document.getElementById('totalIncome').textContent = 
+                            formatCurrency(stats.income?.total_30d || 0);
+                        document.getElementById('totalTokens').textContent = 
+                            formatNumber(stats.tokens?.total_7d || 0);
+                    }
                 }
             };
             
@@ -5965,4 +7017,13 @@ DASHBOARD_HTML = """
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # uvloop/httptools ship with uvicorn[standard]; request them explicitly so a
+    # missing extension fails loudly instead of silently degrading to asyncio/h11
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8080,
+        loop=os.environ.get("DASHBOARD_LOOP", "uvloop"),
+        http=os.environ.get("DASHBOARD_HTTP", "httptools"),
+        ws=os.environ.get("DASHBOARD_WS", "websockets"),
+    )
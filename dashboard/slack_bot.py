@@ -15,7 +15,7 @@ Commands:
     /swarm reject <id> <reason> - Reject item
     /swarm tell <message> - Send directive to Liaison agent
 
-Run with: uvicorn dashboard.slack_bot:app --host 0.0.0.0 --port 8081
+Run with: uvicorn dashboard.slack_bot:app --host 0.0.0.0 --port 8081 --loop uvloop --http httptools
 """
 
 import hashlib
@@ -24,14 +24,14 @@ import time
 import logging
 import os
 import subprocess
-import json
 import sqlite3
 from typing import Optional
 from pathlib import Path
 
 from fastapi import FastAPI, Request, HTTPException, Form, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import httpx
+import orjson
 
 # Add parent to path for imports
 import sys
@@ -42,7 +42,7 @@ from watcher.orchestrator import get_orchestrator
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Swarm Control Slack Bot")
+app = FastAPI(title="Swarm Control Slack Bot", default_response_class=ORJSONResponse)
 
 # ============================================================================
 # Configuration - env vars preferred, SSM fallback
@@ -185,7 +185,7 @@ def cmd_status() -> str:
     status_dir = Path("/auto-dev/data")
     for f in status_dir.glob("watcher_status_*.json"):
         try:
-            data = json.loads(f.read_text())
+            data = orjson.loads(f.read_bytes())
             if data.get("rate_limit", {}).get("limited"):
                 agents_paused += 1
             elif data.get("is_running"):
@@ -206,7 +206,7 @@ def cmd_status() -> str:
             ORDER BY claimed_at DESC LIMIT 5
         """)
         for row in cursor.fetchall():
-            payload = json.loads(row['payload']) if row['payload'] else {}
+            payload = orjson.loads(row['payload']) if row['payload'] else {}
             title = payload.get('title', payload.get('product_name', payload.get('product', 'N/A')))[:25]
             claimed.append(f"  • `{row['assigned_to']}` → {title}")
         conn.close()
@@ -327,7 +327,6 @@ def cmd_priority(task_id: str, priority: int) -> str:
 
 def cmd_agents() -> str:
     """Show agent statuses."""
-    import json
     status_dir = Path("/auto-dev/data")
     
     lines = ["*Agent Status:*", "```"]
@@ -336,7 +335,7 @@ def cmd_agents() -> str:
     
     for f in sorted(status_dir.glob("watcher_status_*.json")):
         try:
-            data = json.loads(f.read_text())
+            data = orjson.loads(f.read_bytes())
             agent = data.get("agent_id", "?")
             running = "RUNNING" if data.get("is_running") else "STOPPED"
             rate_info = data.get("rate_limit", {})
@@ -632,14 +631,14 @@ def cmd_approve_project(project_id: str) -> str:
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (
                 task_id, 'build_product', 8,
-                json.dumps({
+                orjson.dumps({
                     "project_id": row['id'],
                     "title": row['title'],
                     "spec_path": row['spec_path'],
                     "effort_estimate": row['effort_estimate'],
                     "max_revenue": row['max_revenue_estimate'],
                     "differentiation": row['differentiation']
-                }),
+                }).decode(),
                 'pending', 'human', now
             ))
             
@@ -852,7 +851,7 @@ def cmd_ask(question: str, response_url: str = None) -> str:
         status_dir = Path("/auto-dev/data")
         for f in status_dir.glob("watcher_status_*.json"):
             try:
-                data = json.loads(f.read_text())
+                data = orjson.loads(f.read_bytes())
                 if data.get("rate_limit", {}).get("limited"):
                     agents_paused += 1
                 elif data.get("is_running"):
@@ -872,7 +871,7 @@ def cmd_ask(question: str, response_url: str = None) -> str:
         """)
         current_tasks = []
         for row in cursor.fetchall():
-            payload = json.loads(row['payload']) if row['payload'] else {}
+            payload = orjson.loads(row['payload']) if row['payload'] else {}
             title = payload.get('title', payload.get('product_name', payload.get('product', 'N/A')))
             current_tasks.append(f"{row['assigned_to']}: {row['type']} - {title}")
         
@@ -884,7 +883,7 @@ def cmd_ask(question: str, response_url: str = None) -> str:
         """)
         recent_completed = []
         for row in cursor.fetchall():
-            payload = json.loads(row['payload']) if row['payload'] else {}
+            payload = orjson.loads(row['payload']) if row['payload'] else {}
             title = payload.get('title', payload.get('product_name', 'N/A'))
             recent_completed.append(f"{row['assigned_to']}: {title}")
         
@@ -904,7 +903,7 @@ def cmd_ask(question: str, response_url: str = None) -> str:
         rate_file = Path("/auto-dev/data/.rate_limited")
         if rate_file.exists():
             try:
-                rl_data = json.loads(rate_file.read_text())
+                rl_data = orjson.loads(rate_file.read_bytes())
                 rate_reset = rl_data.get('reset_time')
                 rate_limited = True
             except:
@@ -1170,4 +1169,12 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8081)
+    # uvloop/httptools ship with uvicorn[standard], as for the dashboard; set
+    # SLACK_BOT_LOOP/SLACK_BOT_HTTP to "auto" where they are not installed
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8081,
+        loop=os.environ.get("SLACK_BOT_LOOP", "uvloop"),
+        http=os.environ.get("SLACK_BOT_HTTP", "httptools"),
+    )
@@ -155,7 +155,7 @@ def evaluate_condition(condition: str, event: 'WebhookEvent') -> bool:
     if condition == "note_mentions_autodev":
         if event.event_type != "note":
             return False
-        note = obj_attrs.get("note", "") or ""
+        note = obj_attrs.get("note") or ""
         return re.search(r"@auto-dev|\[auto-dev\]", note, re.IGNORECASE) is not None
 
     # has_new_commits
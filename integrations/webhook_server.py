@@ -73,12 +73,15 @@ def main():
 
     logger.info(f"Starting webhook server on {host}:{port}")
 
+    # uvloop/httptools ship with uvicorn[standard], as for the dashboard
     uvicorn.run(
         "integrations.webhook_server:app",
         host=host,
         port=port,
         reload=False,
-        log_level="info"
+        log_level="info",
+        loop=os.environ.get("WEBHOOK_LOOP", "uvloop"),
+        http=os.environ.get("WEBHOOK_HTTP", "httptools"),
     )
 
 
@@ -53,8 +53,8 @@ fi
 
 # Start dashboard in background
 echo "Starting dashboard on http://localhost:8080..."
-cd "$PROJECT_DIR/dashboard"
-uvicorn server:app --host 0.0.0.0 --port 8080 --reload &
+cd "$PROJECT_DIR"
+uvicorn dashboard.server:app --host 0.0.0.0 --port 8080 --loop uvloop --http httptools --ws websockets --reload &
 DASHBOARD_PID=$!
 
 # Wait for Ctrl+C
@@ -23,7 +23,7 @@ case "${1:-start}" in
         pkill -f "uvicorn dashboard.slack_bot" 2>/dev/null || true
         
         # Start bot in background
-        nohup python -m uvicorn dashboard.slack_bot:app --host 0.0.0.0 --port 8081 >> "$BOT_LOG" 2>&1 &
+        nohup python -m uvicorn dashboard.slack_bot:app --host 0.0.0.0 --port 8081 --loop uvloop --http httptools >> "$BOT_LOG" 2>&1 &
         
         sleep 2
         if curl -s http://localhost:8081/health | grep -q "ok"; then
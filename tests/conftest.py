@@ -0,0 +1,46 @@
+"""Shared fixtures for the dashboard tests.
+
+Tests run against SQLite databases in a temporary directory; PostgreSQL,
+Redis and the /auto-dev data paths are never touched.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """dashboard.server with PostgreSQL unconfigured, so the SQLite paths are used."""
+    for var in ("DATABASE_URL", "DB_HOST", "DB_USER", "DB_NAME"):
+        monkeypatch.delenv(var, raising=False)
+    from dashboard import server
+    return server
+
+
+@pytest.fixture
+def client(server):
+    """Test client for the dashboard app (startup tasks are not run)."""
+    from fastapi.testclient import TestClient
+    return TestClient(server.app)
+
+
+@pytest.fixture
+def orchestrator(server, tmp_path, monkeypatch):
+    """A SQLite-backed orchestrator whose database the dashboard also reads."""
+    from dashboard import repos
+    from watcher.orchestrator_pg import MultiTenantOrchestrator
+
+    path = tmp_path / "orchestrator.db"
+    orch = MultiTenantOrchestrator({"database": {"type": "sqlite", "path": str(path)}})
+    pool = server.SQLitePool(path, 2, server.ORCHESTRATOR_SQLITE_PRAGMAS)
+    monkeypatch.setattr(server, "ORCHESTRATOR_DB_PATH", path)
+    monkeypatch.setattr(server, "_orchestrator_db_pool", pool)
+    monkeypatch.setattr(repos, "orchestrator", orch)
+    yield orch
+    pool.close()
@@ -0,0 +1,185 @@
+"""Tests for the repository management API and its orchestrator calls."""
+
+import asyncio
+import threading
+
+
+def create_repo(orchestrator, **settings):
+    return orchestrator.create_repo(
+        name="Demo App",
+        gitlab_url="https://gitlab.example.com",
+        gitlab_project_id="42",
+        settings=settings,
+    )
+
+
+def test_repo_slug_keeps_non_ascii_letters(orchestrator):
+    def slug(name):
+        return orchestrator.create_repo(
+            name=name, gitlab_url="https://gitlab.example.com", gitlab_project_id="1"
+        ).slug
+
+    assert slug("Demo App_v2") == "demo-app-v2"
+    assert slug("Über") == "über"
+    assert slug("ber") == "ber"
+    assert slug("日本") == "日本"
+
+
+def test_repo_slug_without_letters_falls_back_to_the_id(orchestrator):
+    first = orchestrator.create_repo(name="---", gitlab_url="https://gitlab.example.com", gitlab_project_id="1")
+    second = orchestrator.create_repo(name="!!", gitlab_url="https://gitlab.example.com", gitlab_project_id="2")
+
+    assert first.slug == first.id
+    assert second.slug == second.id
+    assert orchestrator.get_repo_by_slug(first.id).id == first.id
+
+
+def test_repo_list_answers_304_until_repos_change(client, orchestrator):
+    create_repo(orchestrator)
+
+    first = client.get("/api/repos")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    assert client.get("/api/repos", headers={"If-None-Match": etag}).status_code == 304
+
+    orchestrator.create_repo(name="Other", gitlab_url="https://gitlab.example.com", gitlab_project_id="43")
+    changed = client.get("/api/repos", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["total"] == 2
+
+
+def test_repo_detail_answers_304_for_current_etag(client, orchestrator):
+    repo = create_repo(orchestrator)
+
+    first = client.get(f"/api/repos/{repo.id}")
+    assert first.status_code == 200
+
+    repeat = client.get(f"/api/repos/{repo.id}", headers={"If-None-Match": first.headers["ETag"]})
+    assert repeat.status_code == 304
+
+
+def test_ensure_webhook_secret_generates_once(orchestrator):
+    repo = create_repo(orchestrator)
+
+    secret, created = orchestrator.ensure_webhook_secret(repo.id)
+    assert created
+    assert len(secret) == 64
+
+    assert orchestrator.ensure_webhook_secret(repo.id) == (secret, False)
+    assert orchestrator.get_repo(repo.id).settings["webhook_secret"] == secret
+
+
+def test_ensure_webhook_secret_keeps_a_concurrent_writers_secret(orchestrator, monkeypatch):
+    repo = create_repo(orchestrator, branch_prefix="auto/")
+    get_repo = orchestrator.get_repo
+    reads = []
+
+    def get_repo_then_race(repo_id):
+        # Another writer stores its secret right after our first read
+        current = get_repo(repo_id)
+        reads.append(current)
+        if len(reads) == 1:
+            orchestrator.update_repo(repo_id, settings={**current.settings, "webhook_secret": "theirs"})
+        return current
+
+    monkeypatch.setattr(orchestrator, "get_repo", get_repo_then_race)
+
+    assert orchestrator.ensure_webhook_secret(repo.id) == ("theirs", False)
+    settings = get_repo(repo.id).settings
+    assert settings["webhook_secret"] == "theirs"
+    assert settings["branch_prefix"] == "auto/"
+
+
+def test_ensure_webhook_secret_unknown_repo(orchestrator):
+    assert orchestrator.ensure_webhook_secret("missing") is None
+
+
+def test_webhook_info_shows_a_generated_secret_once(client, orchestrator):
+    repo = create_repo(orchestrator)
+
+    first = client.get(f"/api/repos/{repo.id}/webhook").json()
+    stored = orchestrator.get_repo(repo.id).settings["webhook_secret"]
+    assert first["webhook_secret"] == stored
+
+    again = client.get(f"/api/repos/{repo.id}/webhook").json()
+    assert again["webhook_secret"] == f"{stored[:8]}...{stored[-4:]}"
+
+
+def create_repo_tasks(orchestrator, count):
+    repo = create_repo(orchestrator)
+    for n in range(count):
+        orchestrator.create_task(repo.id, "build", {"step": n}, priority=1 + n % 10)
+    return repo
+
+
+def test_streamed_repo_tasks_match_the_buffered_response(client, orchestrator, monkeypatch):
+    from dashboard import repos
+    repo = create_repo_tasks(orchestrator, 7)
+
+    buffered = client.get(f"/api/repos/{repo.id}/tasks?limit=10").json()
+    # Stream anything above 5 tasks, in batches of 2 so several chunks are joined
+    monkeypatch.setattr(repos, "TASK_STREAM_THRESHOLD", 5)
+    iter_tasks = orchestrator.iter_tasks
+    monkeypatch.setattr(orchestrator, "iter_tasks", lambda **kw: iter_tasks(batch_size=2, **kw))
+    streamed = client.get(f"/api/repos/{repo.id}/tasks?limit=10")
+
+    assert streamed.status_code == 200
+    assert streamed.json() == buffered
+    assert streamed.json()["count"] == 7
+
+
+def test_streamed_repo_tasks_without_matches(client, orchestrator, monkeypatch):
+    from dashboard import repos
+    repo = create_repo(orchestrator)
+    monkeypatch.setattr(repos, "TASK_STREAM_THRESHOLD", 5)
+
+    response = client.get(f"/api/repos/{repo.id}/tasks?limit=10")
+
+    assert response.json() == {"repo_id": repo.id, "tasks": [], "count": 0}
+
+
+def test_streamed_repo_tasks_query_error_is_a_500(client, orchestrator, monkeypatch):
+    from dashboard import repos
+    monkeypatch.setattr(repos, "TASK_STREAM_THRESHOLD", 5)
+
+    def failing_iter_tasks(**kwargs):
+        raise RuntimeError("database unavailable")
+        yield
+
+    monkeypatch.setattr(orchestrator, "iter_tasks", failing_iter_tasks)
+    response = client.get("/api/repos/some-repo/tasks?limit=10")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "database unavailable"}
+
+
+def test_iter_tasks_can_resume_on_another_thread(orchestrator):
+    # StreamingResponse may fetch each batch from a different worker thread
+    repo = create_repo_tasks(orchestrator, 5)
+    batches = orchestrator.iter_tasks(repo_id=repo.id, limit=10, batch_size=2)
+    first = []
+    worker = threading.Thread(target=lambda: first.extend(next(batches)))
+    worker.start()
+    worker.join()
+
+    rest = [task for batch in batches for task in batch]
+
+    assert len(first) == 2
+    assert len(rest) == 3
+
+
+def test_unstarted_repo_task_stream_releases_its_query(orchestrator, monkeypatch):
+    from dashboard import repos
+    repo = create_repo_tasks(orchestrator, 7)
+    monkeypatch.setattr(repos, "TASK_STREAM_THRESHOLD", 5)
+
+    async def main():
+        response = await repos.get_repo_tasks(repo.id, limit=10)
+        # Never iterated, e.g. the client went away before the body was sent
+        await response.background()
+        return response.background.func.__self__
+
+    batches = asyncio.run(main())
+
+    assert batches.gi_frame is None
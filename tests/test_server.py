@@ -0,0 +1,237 @@
+"""Tests for dashboard.server endpoints and helpers."""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+
+def test_app_imports_and_serves_health(client):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+
+
+def test_poll_endpoint_answers_304_until_its_input_changes(client, server, tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "SCREENSHOTS_PATH", tmp_path)
+    (tmp_path / "a.png").write_bytes(b"png")
+
+    first = client.get("/api/screenshots")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == f"max-age={server.POLL_CACHE_MAX_AGE}"
+
+    repeat = client.get("/api/screenshots", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.headers["ETag"] == etag
+    assert repeat.content == b""
+
+    # A new screenshot bumps the directory's mtime, and with it the ETag
+    (tmp_path / "b.png").write_bytes(b"png")
+    st = tmp_path.stat()
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    changed = client.get("/api/screenshots", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json()["screenshots"]) == 2
+
+
+def test_etag_depends_on_query_parameters(client, server, tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "SCREENSHOTS_PATH", tmp_path)
+
+    etag = client.get("/api/screenshots?limit=5").headers["ETag"]
+
+    response = client.get("/api/screenshots?limit=10", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+class RecordingWebSocket:
+    """Collects the frames relay() sends."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        self.sent.append(text)
+
+
+def run_relay_once(server, frames):
+    """Queue frames, let relay() drain them, and return what it sent."""
+    async def main():
+        websocket = RecordingWebSocket()
+        outbox = asyncio.Queue()
+        for frame in frames:
+            outbox.put_nowait(frame)
+        task = asyncio.create_task(server.relay(websocket, outbox))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        return websocket.sent
+
+    return asyncio.run(main())
+
+
+def test_relay_sends_a_single_queued_frame_unchanged(server):
+    frame = json.dumps({"type": "stats", "data": {"total": 1}})
+
+    assert run_relay_once(server, [frame]) == [frame]
+
+
+def test_relay_coalesces_queued_frames_into_one_batch(server):
+    frames = [json.dumps({"type": "stats", "data": {"n": n}}) for n in range(3)]
+
+    sent = run_relay_once(server, frames)
+
+    assert len(sent) == 1
+    batch = json.loads(sent[0])
+    assert batch == {"type": "batch", "items": [json.loads(frame) for frame in frames]}
+
+
+def test_websocket_client_gets_latest_stats_on_connect(client, server, monkeypatch):
+    frame = json.dumps({"type": "stats", "data": {"total": 3}})
+    monkeypatch.setattr(server, "_latest_stats_frame", (time.monotonic(), frame))
+
+    with client.websocket_connect("/ws") as websocket:
+        assert websocket.receive_text() == frame
+
+
+def test_websocket_client_skips_stats_from_an_idle_period(client, server, monkeypatch):
+    stale = json.dumps({"type": "stats", "data": {"total": 3}})
+    computed_at = time.monotonic() - server.STATS_BROADCAST_INTERVAL - 1
+    monkeypatch.setattr(server, "_latest_stats_frame", (computed_at, stale))
+
+    queued = []
+
+    async def record_outbox(websocket, outbox):
+        queued.append(outbox.qsize())
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(server, "relay", record_outbox)
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_text("ping")
+
+    assert queued == [0]
+
+
+def create_agent_tasks(orchestrator, count=3):
+    repo = orchestrator.create_repo(name="Demo", gitlab_url="https://gitlab.example.com", gitlab_project_id="1")
+    for n in range(count):
+        orchestrator.create_task(repo.id, "build", {"step": n}, priority=n + 1, assigned_to="builder")
+
+
+def test_agent_tasks_stream_matches_grouped_tasks(client, orchestrator):
+    create_agent_tasks(orchestrator)
+
+    grouped = client.get("/api/agent-tasks?fields=payload").json()
+    response = client.get("/api/agent-tasks?fields=payload&stream=true")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 3
+    assert lines == grouped["agents"]["builder"]
+
+
+def test_agent_tasks_stream_returns_its_connection(client, server, orchestrator):
+    create_agent_tasks(orchestrator)
+
+    client.get("/api/agent-tasks?stream=true")
+
+    assert server._orchestrator_db_pool._idle.qsize() == 1
+
+
+def test_unstarted_agent_tasks_stream_still_returns_its_connection(server, orchestrator):
+    create_agent_tasks(orchestrator)
+
+    async def main():
+        response = await server.get_agent_tasks(stream=True)
+        # Never iterated, e.g. the client went away before the body was sent
+        await response.background()
+
+    asyncio.run(main())
+
+    assert server._orchestrator_db_pool._idle.qsize() == 1
+
+
+@pytest.fixture
+def posted_directives(server, monkeypatch):
+    """Directives that passed validation, recorded instead of written to the database."""
+    posted = []
+
+    def record(message, priority):
+        posted.append((message, priority))
+        return {"success": True}
+
+    monkeypatch.setattr(server, "post_directive", record)
+    return posted
+
+
+@pytest.mark.parametrize("priority", [1, 7, 10])
+def test_directive_accepts_integer_priority(client, posted_directives, priority):
+    response = client.post("/api/directive", json={"message": "Ship it", "priority": priority})
+
+    assert response.status_code == 200
+    assert posted_directives == [("Ship it", priority)]
+    assert type(posted_directives[0][1]) is int
+
+
+def test_directive_priority_defaults_to_10(client, posted_directives):
+    assert client.post("/api/directive", json={"message": "Ship it"}).status_code == 200
+
+    assert posted_directives == [("Ship it", 10)]
+
+
+@pytest.mark.parametrize("priority", [True, False, 2.5, 7.0, "7", None, [7], 0, 11, -1, 2 ** 63])
+def test_directive_rejects_invalid_priority(client, posted_directives, priority):
+    response = client.post("/api/directive", json={"message": "Ship it", "priority": priority})
+
+    assert response.status_code == 400
+    assert response.json() == {"error": "Priority must be an integer from 1 to 10"}
+    assert posted_directives == []
+
+
+def test_directive_requires_a_message(client, posted_directives):
+    response = client.post("/api/directive", json={"priority": 5})
+
+    assert response.status_code == 400
+    assert response.json() == {"error": "Message required"}
+    assert posted_directives == []
+
+
+def test_failed_config_flush_keeps_the_edits_queued(server, monkeypatch):
+    def failing_save(cfg):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(server, "save_config", failing_save)
+    monkeypatch.setattr(server, "load_config", lambda readonly=False: {})
+    monkeypatch.setattr(server, "_pending_autonomy", {"default_mode": "full"})
+    monkeypatch.setattr(server, "_config_lock", asyncio.Lock())
+    monkeypatch.setattr(server, "_config_dirty", asyncio.Event())
+
+    with pytest.raises(OSError):
+        asyncio.run(server.flush_pending_config())
+
+    assert server._pending_autonomy == {"default_mode": "full"}
+    assert server._config_dirty.is_set()
+
+
+def test_screenshot_etag_changes_when_a_listed_file_is_edited(client, server, tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "SCREENSHOTS_PATH", tmp_path)
+    (tmp_path / "a.png").write_bytes(b"png")
+    meta = tmp_path / "a.meta"
+    meta.write_text("url: /old")
+    dir_stat = tmp_path.stat()
+
+    etag = client.get("/api/screenshots").headers["ETag"]
+
+    # Rewrite the sidecar in place; the directory's mtime stays the same
+    meta.write_text("url: /new")
+    st = meta.stat()
+    os.utime(meta, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    os.utime(tmp_path, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+    response = client.get("/api/screenshots", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["screenshots"][0]["meta"] == {"url": "/new"}
@@ -15,10 +15,13 @@ This is the primary orchestrator for auto-dev deployments.
 import json
 import uuid
 import os
+import re
+import secrets
 import logging
 import threading
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 from contextlib import contextmanager
@@ -37,11 +40,15 @@ except ImportError:
 # SQLite fallback
 import sqlite3
 
+# Runs of non-word characters (and '_') collapse to a single '-' in repo slugs;
+# letters and digits from any script are kept
+_SLUG_RE = re.compile(r"[\W_]+")
+
 
 def parse_json_field(value):
     """Parse JSON field handling both string (SQLite) and dict (PostgreSQL JSONB)."""
-    if value is None:
-        return None
+    if value is None or value == "":
+        return value
     if isinstance(value, (dict, list)):
         return value
     try:
@@ -234,6 +241,13 @@ class DevApproval:
 
 # ==================== Database Abstraction ====================
 
+class SQLiteRow(sqlite3.Row):
+    """sqlite3.Row with dict-style get(), as row converters use on RealDictRow."""
+
+    def get(self, key, default=None):
+        return self[key] if key in self.keys() else default
+
+
 class DatabaseConnection:
     """
     Database abstraction layer supporting PostgreSQL and SQLite.
@@ -275,8 +289,9 @@ class DatabaseConnection:
         else:
             # SQLite fallback
             path = self.config.get('path', '/auto-dev/data/orchestrator.db')
-            conn = sqlite3.connect(path)
-            conn.row_factory = sqlite3.Row
+            # Streamed reads (iter_tasks) may be resumed from another worker thread
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.row_factory = SQLiteRow
             try:
                 yield conn
                 conn.commit()
@@ -417,8 +432,15 @@ class MultiTenantOrchestrator:
                 )
             """)
             # Migrations: add missing columns used by newer code paths
-            cursor.execute("ALTER TABLE repos ADD COLUMN IF NOT EXISTS provider TEXT DEFAULT 'gitlab'")
-            cursor.execute("ALTER TABLE repos ADD COLUMN IF NOT EXISTS active BOOLEAN DEFAULT true")
+            for col, col_def in (('provider', "TEXT DEFAULT 'gitlab'"), ('active', 'BOOLEAN DEFAULT true')):
+                if self.db.db_type == 'postgresql':
+                    cursor.execute(f"ALTER TABLE repos ADD COLUMN IF NOT EXISTS {col} {col_def}")
+                    continue
+                try:
+                    # SQLite has no ADD COLUMN IF NOT EXISTS
+                    cursor.execute(f"ALTER TABLE repos ADD COLUMN {col} {col_def}")
+                except sqlite3.OperationalError:
+                    pass  # Column already exists
 
             # Migration: Convert tasks columns from UUID to TEXT if needed
             if self.db.db_type == 'postgresql':
@@ -604,12 +626,33 @@ class MultiTenantOrchestrator:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority DESC)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_approvals_repo ON dev_approvals(repo_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_approvals_status ON dev_approvals(status)")
+            # Composite indexes for per-repo list/aggregate queries (repo stats, dashboard stats)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_repo_status ON tasks(repo_id, status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_repo_type ON tasks(repo_id, task_type)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_approvals_repo_status ON dev_approvals(repo_id, status)")
+            # Dashboard task lists: equality columns first, then the ORDER BY columns, so
+            # the LIMITed queries read rows in order instead of sorting the whole table
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_priority_created ON tasks(status, priority DESC, created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_assigned_status_completed ON tasks(assigned_to, status, completed_at DESC, created_at DESC)")
+            # reset-stale: WHERE status = 'claimed' AND claimed_at < ?
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_claimed ON tasks(status, claimed_at)")
+            # Partial index matching list_repos(active_only=True) ordering; soft-deleted repos stay out of it
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_repos_active_name ON repos(name) WHERE active = true")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_agent_status_repo ON agent_status(repo_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_outcomes_agent ON task_outcomes(agent_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_outcomes_repo ON task_outcomes(repo_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_outcomes_type ON task_outcomes(task_type)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_outcomes_created ON task_outcomes(created_at DESC)")
+            # Outcome stats/lists: an equality filter plus a created_at window or ordering
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_outcomes_repo_created ON task_outcomes(repo_id, created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_outcomes_agent_created ON task_outcomes(agent_id, created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_outcomes_outcome_created ON task_outcomes(outcome, created_at DESC)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_processed_issues_repo ON processed_issues(repo_id)")
+            # Dashboard mail/discussion feeds: newest first, optionally for one recipient/topic
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_agent_mail_to_created ON agent_mail(to_agent, created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_agent_mail_created ON agent_mail(created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_discussions_topic_created ON discussions(topic, created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_discussions_created ON discussions(created_at DESC)")
 
             conn.commit()
 
@@ -627,11 +670,13 @@ class MultiTenantOrchestrator:
         provider: str = "gitlab"
     ) -> Repo:
         """Create a new managed repository."""
-        # Generate slug from name
-        slug = name.lower().replace(' ', '-').replace('/', '-')
+        repo_id = repo_id or str(uuid.uuid4())
+        # Generate URL-safe slug from name; slugs are unique, so a name with
+        # no letters or digits falls back to the repo id
+        slug = _SLUG_RE.sub('-', name.lower()).strip('-') or repo_id
 
         repo = Repo(
-            id=repo_id or str(uuid.uuid4()),
+            id=repo_id,
             name=name,
             gitlab_url=gitlab_url,
             gitlab_project_id=gitlab_project_id,
@@ -690,20 +735,111 @@ class MultiTenantOrchestrator:
             return None
         return self._row_to_repo(row)
 
-    def list_repos(self, status: str = None, active_only: bool = False) -> List[Repo]:
-        """List all repositories."""
+    def _repos_where(self, status: str = None, active_only: bool = False) -> str:
+        """Build the WHERE clause shared by list_repos and count_repos."""
         if status:
             # For PostgreSQL with 'active' boolean column
-            if status == 'active':
-                rows = self.db.execute("SELECT * FROM repos WHERE active = true ORDER BY name")
-            else:
-                rows = self.db.execute("SELECT * FROM repos WHERE active = false ORDER BY name")
-        elif active_only:
-            rows = self.db.execute("SELECT * FROM repos WHERE active = true ORDER BY name")
+            return "WHERE active = true" if status == 'active' else "WHERE active = false"
+        if active_only:
+            return "WHERE active = true"
+        return ""
+
+    def list_repos(
+        self,
+        status: str = None,
+        active_only: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Repo]:
+        """List repositories, optionally paginated in SQL."""
+        p = self.db.placeholder
+        query = f"SELECT * FROM repos {self._repos_where(status, active_only)} ORDER BY name"
+        if limit is None:
+            rows = self.db.execute(query)
         else:
-            rows = self.db.execute("SELECT * FROM repos ORDER BY name")
+            rows = self.db.execute(f"{query} LIMIT {p} OFFSET {p}", (limit, offset))
         return [self._row_to_repo(row) for row in rows]
 
+    def count_repos(self, status: str = None, active_only: bool = False) -> int:
+        """Count repositories matching the list_repos filters."""
+        row = self.db.execute_one(
+            f"SELECT COUNT(*) AS count FROM repos {self._repos_where(status, active_only)}"
+        )
+        return self._count_value(row)
+
+    def repos_version(self) -> tuple:
+        """Cheap change marker for the repos table: (MAX(updated_at), COUNT(*))."""
+        row = self.db.execute_one("SELECT MAX(updated_at) AS version, COUNT(*) AS count FROM repos")
+        if not row:
+            return (None, 0)
+        if hasattr(row, 'keys'):
+            return (str(row['version']), row['count'])
+        return (str(row[0]), row[1])
+
+    def repo_version(self, repo_id: str) -> Optional[str]:
+        """Change marker for one repo (its updated_at), or None if it does not exist."""
+        row = self.db.execute_one(
+            f"SELECT updated_at FROM repos WHERE id = {self.db.placeholder}",
+            (repo_id,)
+        )
+        if not row:
+            return None
+        return str(row['updated_at'] if hasattr(row, 'keys') else row[0])
+
+    @staticmethod
+    def _count_value(row) -> int:
+        """Extract a COUNT(*) value from a dict-like or tuple row."""
+        if not row:
+            return 0
+        return row['count'] if hasattr(row, 'keys') else row[0]
+
+    def repo_dashboard_stats(self) -> List[Dict[str, Any]]:
+        """
+        Per-repo task and approval counts for all active repos in one query.
+
+        Each row has id, name, autonomy_mode, task_count, pending_tasks,
+        in_progress_tasks and pending_approvals; repos with no tasks or
+        approvals report zeros.
+        """
+        p = self.db.placeholder
+        rows = self.db.execute(f"""
+            SELECT r.id, r.name, r.autonomy_mode,
+                   COALESCE(t.task_count, 0) AS task_count,
+                   COALESCE(t.pending_tasks, 0) AS pending_tasks,
+                   COALESCE(t.in_progress_tasks, 0) AS in_progress_tasks,
+                   COALESCE(a.pending_approvals, 0) AS pending_approvals
+            FROM repos r
+            LEFT JOIN (
+                SELECT repo_id,
+                       COUNT(*) AS task_count,
+                       SUM(CASE WHEN status = {p} THEN 1 ELSE 0 END) AS pending_tasks,
+                       SUM(CASE WHEN status = {p} THEN 1 ELSE 0 END) AS in_progress_tasks
+                FROM tasks
+                GROUP BY repo_id
+            ) t ON t.repo_id = r.id
+            LEFT JOIN (
+                SELECT repo_id, COUNT(*) AS pending_approvals
+                FROM dev_approvals
+                WHERE status = {p}
+                GROUP BY repo_id
+            ) a ON a.repo_id = r.id
+            WHERE r.active = true
+            ORDER BY r.name
+        """, (TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value, ApprovalStatus.PENDING.value))
+
+        columns = ('id', 'name', 'autonomy_mode', 'task_count', 'pending_tasks',
+                   'in_progress_tasks', 'pending_approvals')
+        stats = []
+        for row in rows or []:
+            values = [row[c] for c in columns] if hasattr(row, 'keys') else list(row)
+            stat = dict(zip(columns, values))
+            stat['id'] = str(stat['id'])
+            # SUM() comes back as Decimal on PostgreSQL
+            for c in columns[3:]:
+                stat[c] = int(stat[c])
+            stats.append(stat)
+        return stats
+
     def is_issue_processed(self, issue_id: str, repo_id: str, action: str) -> bool:
         """Check if an issue event has been processed."""
         row = self.db.execute_one(
@@ -761,12 +897,46 @@ class MultiTenantOrchestrator:
             conn.commit()
             return cursor.rowcount > 0
 
+    def ensure_webhook_secret(self, repo_id: str) -> Optional[tuple]:
+        """
+        Return (webhook_secret, created) for a repo, generating one if missing.
+
+        The write is a compare-and-set on updated_at, so concurrent callers
+        converge on a single secret instead of overwriting each other.
+        Returns None if the repo does not exist.
+        """
+        p = self.db.placeholder
+        for _ in range(3):
+            repo = self.get_repo(repo_id)
+            if not repo:
+                return None
+            secret = repo.settings.get('webhook_secret')
+            if secret:
+                return secret, False
+
+            secret = secrets.token_hex(32)
+            settings = {**repo.settings, 'webhook_secret': secret}
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    UPDATE repos SET settings = {p}, updated_at = {p}
+                    WHERE id = {p} AND updated_at = {p}
+                """, (json.dumps(settings), datetime.utcnow().isoformat(), repo_id, repo.updated_at))
+                conn.commit()
+                if cursor.rowcount > 0:
+                    return secret, True
+
+        # Lost every race - another writer has stored a secret by now
+        repo = self.get_repo(repo_id)
+        secret = repo.settings.get('webhook_secret') if repo else None
+        return (secret, False) if secret else None
+
     def _row_to_repo(self, row) -> Repo:
         """Convert database row to Repo object."""
         if hasattr(row, 'keys'):
             # Dict-like row (PostgreSQL RealDictRow or SQLite Row)
             # Handle settings - might be dict (jsonb) or string (json text)
-            settings = row.get('settings', {})
+            settings = row.get('settings') or {}
             if isinstance(settings, str):
                 settings = parse_json_field(settings) or {}
 
@@ -1005,14 +1175,13 @@ class MultiTenantOrchestrator:
             return None
         return self._row_to_task(row)
 
-    def list_tasks(
+    def _task_filters(
         self,
         repo_id: Optional[str] = None,
         status: Optional[str] = None,
-        task_type: Optional[str] = None,
-        limit: int = 50
-    ) -> List[Task]:
-        """List tasks with optional filters."""
+        task_type: Optional[str] = None
+    ) -> tuple:
+        """Build the WHERE clause and params shared by list_tasks and iter_tasks."""
         conditions = []
         params = []
         p = self.db.placeholder
@@ -1028,17 +1197,93 @@ class MultiTenantOrchestrator:
             params.append(task_type)
 
         where_clause = ' AND '.join(conditions) if conditions else '1=1'
+        return where_clause, params
+
+    def list_tasks(
+        self,
+        repo_id: Optional[str] = None,
+        status: Optional[str] = None,
+        task_type: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Task]:
+        """List tasks with optional filters."""
+        where_clause, params = self._task_filters(repo_id, status, task_type)
         params.append(limit)
 
         rows = self.db.execute(f"""
             SELECT * FROM tasks
             WHERE {where_clause}
             ORDER BY priority DESC, created_at DESC
-            LIMIT {p}
+            LIMIT {self.db.placeholder}
         """, tuple(params))
 
         return [self._row_to_task(row) for row in rows]
 
+    def iter_tasks(
+        self,
+        repo_id: Optional[str] = None,
+        status: Optional[str] = None,
+        task_type: Optional[str] = None,
+        limit: int = 1000,
+        batch_size: Optional[int] = None
+    ) -> Iterator[List[Task]]:
+        """
+        Yield tasks in batches of batch_size from a single query.
+
+        Same filters and ordering as list_tasks, but only one batch of Task
+        objects is alive at a time, for callers that stream large lists.
+        batch_size defaults to 500 on PostgreSQL and 100 on SQLite.
+        """
+        if batch_size is None:
+            batch_size = 500 if self.db.db_type == 'postgresql' else 100
+        where_clause, params = self._task_filters(repo_id, status, task_type)
+        params.append(limit)
+
+        with self.db.get_connection() as conn:
+            if self.db.db_type == 'postgresql':
+                # Server-side cursor: rows stay in PostgreSQL until fetched, so
+                # the client never materializes the whole result set
+                cursor = conn.cursor(name='iter_tasks')
+                cursor.itersize = batch_size
+            else:
+                cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT * FROM tasks
+                WHERE {where_clause}
+                ORDER BY priority DESC, created_at DESC
+                LIMIT {self.db.placeholder}
+            """, tuple(params))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [self._row_to_task(row) for row in rows]
+
+    def aggregate_task_counts(self, repo_id: str) -> Dict[str, Any]:
+        """Count a repository's tasks by status and by type in one grouped query."""
+        rows = self.db.execute(f"""
+            SELECT status, task_type, COUNT(*) AS count
+            FROM tasks
+            WHERE repo_id = {self.db.placeholder}
+            GROUP BY status, task_type
+        """, (repo_id,))
+
+        by_status = Counter()
+        by_type = Counter()
+        for row in rows or []:
+            if hasattr(row, 'keys'):
+                status, task_type, count = row['status'], row['task_type'], row['count']
+            else:
+                status, task_type, count = row[0], row[1], row[2]
+            by_status[status] += count
+            by_type[task_type] += count
+
+        return {
+            'by_status': dict(by_status),
+            'by_type': dict(by_type),
+            'total': sum(by_status.values())
+        }
+
     def get_assigned_tasks(
         self,
         agent_id: str,
@@ -1152,22 +1397,32 @@ class MultiTenantOrchestrator:
         with self.db.get_connection() as conn:
             cursor = conn.cursor()
             p = self.db.placeholder
-            cursor.execute(f"""
+            update_sql = f"""
                 UPDATE dev_approvals
                 SET status = 'approved', reviewer_notes = {p}, reviewed_at = {p}
                 WHERE id = {p} AND status = 'pending'
-            """, (reviewer_notes, now, approval_id))
-            conn.commit()
+            """
 
-            if cursor.rowcount > 0:
-                # Get the approval to create follow-up task
-                cursor.execute(f"SELECT * FROM dev_approvals WHERE id = {p}", (approval_id,))
+            if self.db.db_type == 'postgresql':
+                # PostgreSQL: the updated row (for the follow-up task) comes back with the UPDATE
+                cursor.execute(update_sql + " RETURNING *", (reviewer_notes, now, approval_id))
                 row = cursor.fetchone()
-                if row:
-                    approval = self._row_to_approval(row)
-                    self._handle_approval(approval)
-                return True
-        return False
+                updated = row is not None
+            else:
+                cursor.execute(update_sql, (reviewer_notes, now, approval_id))
+                updated = cursor.rowcount > 0
+                row = None
+                if updated:
+                    # Get the approval to create follow-up task
+                    cursor.execute(f"SELECT * FROM dev_approvals WHERE id = {p}", (approval_id,))
+                    row = cursor.fetchone()
+            conn.commit()
+
+        if not updated:
+            return False
+        if row:
+            self._handle_approval(self._row_to_approval(row))
+        return True
 
     def reject(
         self,
@@ -1244,6 +1499,73 @@ class MultiTenantOrchestrator:
 
         return [self._row_to_approval(row) for row in rows]
 
+    def count_approvals(
+        self,
+        repo_id: Optional[str] = None,
+        status: str = "pending",
+        approval_type: Optional[str] = None
+    ) -> int:
+        """Count approval requests matching the list_approvals filters."""
+        conditions = [f"status = {self.db.placeholder}"]
+        params = [status]
+
+        if repo_id:
+            conditions.append(f"repo_id = {self.db.placeholder}")
+            params.append(repo_id)
+        if approval_type:
+            conditions.append(f"approval_type = {self.db.placeholder}")
+            params.append(approval_type)
+
+        where_clause = ' AND '.join(conditions)
+        row = self.db.execute_one(
+            f"SELECT COUNT(*) AS count FROM dev_approvals WHERE {where_clause}",
+            tuple(params)
+        )
+        return self._count_value(row)
+
+    def list_approvals_by_status(
+        self,
+        limits: Dict[str, int],
+        repo_id: Optional[str] = None
+    ) -> Tuple[List[DevApproval], Dict[str, int]]:
+        """List the newest approvals for several statuses in one query.
+
+        Returns up to limits[status] approvals per status, grouped in the
+        order of `limits` and newest first within each, plus the total
+        number of approvals per status.
+        """
+        ph = self.db.placeholder
+        statuses = list(limits)
+        conditions = [f"status IN ({', '.join([ph] * len(statuses))})"]
+        params = list(statuses)
+        if repo_id:
+            conditions.append(f"repo_id = {ph}")
+            params.append(repo_id)
+        for status in statuses:
+            params.extend((status, limits[status]))
+        params.extend(statuses)
+
+        where_clause = ' AND '.join(conditions)
+        rank_limits = ' '.join(f"WHEN {ph} THEN {ph}" for _ in statuses)
+        status_order = ' '.join(f"WHEN {ph} THEN {i}" for i in range(len(statuses)))
+
+        rows = self.db.execute(f"""
+            SELECT * FROM (
+                SELECT *,
+                    ROW_NUMBER() OVER (PARTITION BY status ORDER BY created_at DESC) AS status_rank,
+                    COUNT(*) OVER (PARTITION BY status) AS status_total
+                FROM dev_approvals
+                WHERE {where_clause}
+            ) ranked
+            WHERE status_rank <= CASE status {rank_limits} END
+            ORDER BY CASE status {status_order} END, status_rank
+        """, tuple(params)) or []
+
+        totals = dict.fromkeys(statuses, 0)
+        for row in rows:
+            totals[row['status']] = row['status_total']
+        return [self._row_to_approval(row) for row in rows], totals
+
     def _row_to_approval(self, row) -> DevApproval:
         """Convert database row to DevApproval object."""
         if hasattr(row, 'keys'):
@@ -1451,7 +1773,7 @@ class MultiTenantOrchestrator:
         if not repo or repo.autonomy_mode != 'full':
             return False
 
-        thresholds = repo.settings.get('auto_approve_thresholds', {})
+        thresholds = repo.settings.get('auto_approve_thresholds') or {}
 
         if approval_type == DevApprovalType.SPEC_APPROVAL.value:
             required = thresholds.get('architect_confidence', 8)
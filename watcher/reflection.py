@@ -200,6 +200,11 @@ class ReflectionManager:
             )
         """)
 
+        # Reflection lists and stats filter by agent/type within a created_at window
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_reflections_agent_created ON reflections(agent_id, created_at DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_reflections_type_created ON reflections(reflection_type, created_at DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_reflections_created ON reflections(created_at DESC)")
+
         self.db.commit()
 
     # ========== Reflection Operations ==========